@@ -7,8 +7,10 @@ from typing import Annotated, Any, cast
 from fastapi import APIRouter, Depends, HTTPException
 from neo4j import AsyncResult, AsyncSession
 
-from ...db.deps import get_db_session
-from ...models.embedding import get_embedding_model
+from ...db.deps import get_write_session
+from ...db.graph_version import bump_graph_version
+from ...graph.fulltext import search_hit, search_nodes
+from ...graph.hybrid_search import search_in_memory
 from ...models.mcp import (
     InitializeRequest,
     InitializeResponse,
@@ -16,6 +18,7 @@ from ...models.mcp import (
     QueryResponse,
 )
 from ...tools.dispatcher import dispatch_tool
+from ...tools.handlers import match_skill_set
 from ..mcp.models import (
     EntityResponse,
     ExplainMatchRequest,
@@ -34,9 +37,6 @@ from .utils import create_successful_tool_response
 
 logger = logging.getLogger(__name__)
 
-# Get the model instance
-MODEL = get_embedding_model()
-
 # Constants
 SKILL_MATCH_THRESHOLD = 0.5
 DEFAULT_TEST_TOP_K = 5
@@ -92,13 +92,16 @@ async def initialize(_request: InitializeRequest) -> dict[str, Any]:
 @router.post("/query", response_model=QueryResponse)
 async def query(
     request: QueryRequest,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_write_session)],
 ) -> dict[str, Any]:
     """Execute a Cypher query."""
     try:
         result = await session.run(request.query, request.parameters or {})  # type: ignore
         records = [record async for record in result]
         summary = await _maybe_await(result.consume())
+        if summary.counters.contains_updates:
+            # Cached tool responses no longer reflect the graph
+            bump_graph_version()
         return {
             "results": [dict(record) for record in records],
             "metadata": {
@@ -148,28 +151,7 @@ async def match_role(request: dict, session: AsyncSession) -> dict:
             status_code=422, detail=f"MatchRoleRequest: Invalid parameters: {e!s}"
         ) from e
 
-    # Query the database to find matching profiles
-    result: AsyncResult = await session.run(
-        """
-        MATCH (p:Person)
-        WHERE ALL(skill IN $required_skills WHERE (p)-[:HAS_SKILL]->(:Skill {name: skill}))
-        RETURN p
-        """,
-        required_skills=required_skills,
-    )  # type: ignore
-    records = [record async for record in result]
-
-    matching_skills = []
-    skill_gaps = []
-    for skill in required_skills:
-        found = False
-        for record in records:
-            if skill in record["p"].get("skills", []):
-                matching_skills.append({"name": skill})
-                found = True
-                break
-        if not found:
-            skill_gaps.append(skill)
+    matching_skills, skill_gaps = await match_skill_set(session, required_skills)
 
     match_score = (
         len(matching_skills) / len(required_skills) if required_skills else 0.0
@@ -266,32 +248,27 @@ async def graph_search(request: dict, session: AsyncSession | None = None) -> di
     if not isinstance(top_k, int) or top_k <= 0:
         raise HTTPException(status_code=422, detail="top_k must be a positive integer")
 
-    # Query the database to find nodes matching the query
-    result: AsyncResult = await session.run(
-        """
-        MATCH (n)
-        WHERE n.name CONTAINS $search_query OR n.description CONTAINS $search_query
-        RETURN n
-        LIMIT $top_k
-        """,
-        search_query=search_query,
-        top_k=top_k,
-    )  # type: ignore
-    records = [record async for record in result]
+    ranked = await search_in_memory(search_query, top_k)
+    if ranked is not None:
+        hits = [hit for hit, _ in ranked]
+    else:
+        records = await search_nodes(session, search_query, top_k)
+        hits = [search_hit(record["n"]) for record in records]
 
     # Format results
     results = []
-    for record in records:
-        node = record["n"]
+    for hit in hits:
+        node = hit["properties"]
         results.append(
             {
                 "node": {
                     "id": node.get("id"),
+                    "node_id": hit["node_id"],
                     "name": node.get("name"),
                     "type": node.get("type"),
                     "description": node.get("description"),
-                    "labels": node.get("labels", []),
-                    "properties": node.get("properties", {}),
+                    "labels": hit["labels"],
+                    "properties": node,
                 }
             }
         )
@@ -309,18 +286,7 @@ async def handle_search(session: Any, query: str, limit: int) -> dict:
         raise HTTPException(status_code=400, detail="Query cannot be empty")
 
     try:
-        # Perform a simple text search
-        result: AsyncResult = await session.run(
-            """
-            MATCH (n)
-            WHERE n.name CONTAINS $query OR n.description CONTAINS $query
-            RETURN n
-            LIMIT $limit
-            """,
-            query=query,
-            limit=limit,
-        )  # type: ignore
-        records = [record async for record in result]
+        records = await search_nodes(session, query, limit)
         results = []
         for record in records:
             node = record["node"] if "node" in record else record["n"]
@@ -469,17 +435,7 @@ async def handle_search_request(
 ) -> SearchResponse:
     """Handle search request."""
     try:
-        result = await session.run(
-            """
-            MATCH (n)
-            WHERE toLower(n.name) CONTAINS toLower($query)
-            OR toLower(n.description) CONTAINS toLower($query)
-            RETURN n
-            LIMIT $limit
-            """,
-            {"query": request.query, "limit": request.limit},
-        )  # type: ignore
-        records = [record async for record in result]
+        records = await search_nodes(session, request.query, request.limit)
         entities = []
         for record in records:
             node = record["n"]
@@ -6,7 +6,8 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Query
 from neo4j import AsyncSession
 
-from ...db.deps import get_db_session
+from ...db.deps import get_read_session
+from ...models.embedding import embedding_model
 from ...tools.dispatcher import dispatch_tool
 from ..jsonrpc import JSONRPCRequest
 from .handlers import (
@@ -34,12 +35,12 @@ router = APIRouter()
 @router.get("/health", response_model=dict[str, str])
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
-    return {"status": "ok"}
+    return {"status": "ok", "embedding_model": embedding_model.status}
 
 
 @router.post("/search", response_model=SearchResponse)
 async def search_endpoint(
-    request: SearchRequest, session: AsyncSession = Depends(get_db_session)
+    request: SearchRequest, session: AsyncSession = Depends(get_read_session)
 ) -> SearchResponse:
     """Search endpoint for finding entities."""
     try:
@@ -54,7 +55,7 @@ async def search_endpoint(
 
 @router.post("/tools/dispatch", response_model=ToolDispatchResponse)
 async def tool_dispatch_endpoint(
-    request: ToolDispatchRequest, session: AsyncSession = Depends(get_db_session)
+    request: ToolDispatchRequest, session: AsyncSession = Depends(get_read_session)
 ) -> ToolDispatchResponse:
     """Tool dispatch endpoint for executing tools."""
     try:
@@ -70,7 +71,7 @@ async def tool_dispatch_endpoint(
 # Add the /rpc/tools/dispatch route that tests expect
 @router.post("/rpc/tools/dispatch")
 async def rpc_tool_dispatch_endpoint(
-    request: dict[str, Any], session: AsyncSession = Depends(get_db_session)
+    request: dict[str, Any], session: AsyncSession = Depends(get_read_session)
 ) -> dict[str, Any]:
     """RPC tool dispatch endpoint for executing tools."""
     try:
@@ -93,7 +94,7 @@ async def rpc_tool_dispatch_endpoint(
 
 @router.get("/entities/{entity_id}", response_model=EntityResponse)
 async def get_entity_endpoint(
-    entity_id: str, session: AsyncSession = Depends(get_db_session)
+    entity_id: str, session: AsyncSession = Depends(get_read_session)
 ) -> EntityResponse:
     """Get entity by ID endpoint."""
     try:
@@ -158,7 +159,7 @@ async def get_entity_endpoint(
 
 @router.get("/resources", response_model=list[ResourceResponse])
 async def list_resources_endpoint(
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> list[ResourceResponse]:
     """List resources endpoint."""
     try:
@@ -227,7 +228,7 @@ async def get_resource_endpoint(resource_name: str) -> ResourceResponse:
 # JSON-RPC endpoint
 @router.post("/rpc")
 async def rpc_endpoint(
-    request: dict[str, Any], session: AsyncSession = Depends(get_db_session)
+    request: dict[str, Any], session: AsyncSession = Depends(get_read_session)
 ) -> dict[str, Any]:
     """JSON-RPC endpoint for MCP operations."""
     try:
@@ -256,7 +257,7 @@ async def rpc_endpoint(
 async def match_role_endpoint(
     skills: list[str] = Query(..., description="Required skills"),
     experience: str | None = Query(None, description="Experience level"),
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> dict[str, Any]:
     """Match role endpoint for finding matching roles."""
     try:
@@ -277,7 +278,7 @@ async def match_role_endpoint(
 # Additional tool endpoints for testing
 @router.post("/match_role")
 async def match_role_direct_endpoint(
-    request: dict[str, Any], session: AsyncSession = Depends(get_db_session)
+    request: dict[str, Any], session: AsyncSession = Depends(get_read_session)
 ) -> dict[str, Any]:
     """Direct match role endpoint."""
     try:
@@ -295,7 +296,7 @@ async def match_role_direct_endpoint(
 
 @router.post("/explain_match")
 async def explain_match_endpoint(
-    request: dict[str, Any], session: AsyncSession = Depends(get_db_session)
+    request: dict[str, Any], session: AsyncSession = Depends(get_read_session)
 ) -> dict[str, Any]:
     """Explain match endpoint."""
     try:
@@ -313,7 +314,7 @@ async def explain_match_endpoint(
 
 @router.post("/graph_search")
 async def graph_search_endpoint(
-    request: dict[str, Any], session: AsyncSession = Depends(get_db_session)
+    request: dict[str, Any], session: AsyncSession = Depends(get_read_session)
 ) -> dict[str, Any]:
     """Graph search endpoint."""
     try:
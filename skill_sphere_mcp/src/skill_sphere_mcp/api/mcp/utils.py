@@ -7,6 +7,7 @@ from fastapi import HTTPException
 from neo4j import AsyncSession
 
 from ...config.settings import get_settings
+from ...db.graph_version import bump_graph_version
 from ...models.graph import GraphNode, GraphRelationship
 from ...models.skill import Skill
 from ..models import InitializeResponse
@@ -158,6 +159,7 @@ async def create_skill_in_db(skill: Skill, session: AsyncSession) -> Skill:
         record = await result.single()
         if not record:
             raise HTTPException(status_code=500, detail="Failed to create skill")
+        bump_graph_version()
         return Skill(**record["s"])
     except HTTPException:
         raise
@@ -3,8 +3,9 @@
 from fastapi import APIRouter, Depends, HTTPException
 from neo4j import AsyncSession
 
-from ..db.deps import get_db_session
+from ..db.deps import get_read_session
 from ..db.utils import get_entity_by_id
+from ..graph.fulltext import search_nodes
 
 router = APIRouter()
 
@@ -18,7 +19,7 @@ async def healthz() -> dict[str, str]:
 @router.get("/entity/{entity_id}")
 async def get_entity_legacy(
     entity_id: str,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> dict:
     """Get an entity by ID (legacy endpoint)."""
     try:
@@ -35,27 +36,20 @@ async def get_entity_legacy(
 @router.post("/search")
 async def search_semantic(
     request: dict,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_session),
 ) -> list[dict]:
     """Semantic search endpoint (legacy)."""
     try:
         query = request.get("query", "")
         k = request.get("k", 10)
 
-        # Simple mock implementation for now
-        # In a real implementation, this would use embeddings
-        result = await session.run(
-            "MATCH (n) WHERE n.name CONTAINS $query RETURN n LIMIT $k",
-            {"query": query, "k": k},
-        )
-
         records = []
-        async for record in result:
+        for record in await search_nodes(session, query, k):
             node = record["n"]
             records.append(
                 {
                     "entity_id": node.get("id", str(node.get("name", ""))),
-                    "score": 0.8,  # Mock score
+                    "score": record["score"],
                 }
             )
 
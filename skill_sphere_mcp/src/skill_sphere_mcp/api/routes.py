@@ -8,8 +8,9 @@ from fastapi.responses import Response
 from neo4j import AsyncSession
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, generate_latest
 
-from ..db.deps import get_db_session
+from ..db.deps import get_read_session, get_write_session
 from ..db.utils import get_entity_by_id
+from ..models.embedding import embedding_model
 from ..models.skill import Skill
 from .mcp.utils import create_skill_in_db
 
@@ -23,12 +24,12 @@ request_count = Counter('request_count', 'Total number of requests')
 @router.get("/health")
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
-    return {"status": "ok"}
+    return {"status": "ok", "embedding_model": embedding_model.status}
 
 
 @router.get("/skills", response_model=list[Skill])
 async def get_skills(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> list[Skill]:
     """Get all skills from the database."""
     try:
@@ -42,7 +43,7 @@ async def get_skills(
 
 @router.post("/skills", response_model=Skill)
 async def create_skill(
-    skill: Skill, session: Annotated[AsyncSession, Depends(get_db_session)]
+    skill: Skill, session: Annotated[AsyncSession, Depends(get_write_session)]
 ) -> Skill:
     """Create a new skill in the database."""
     return await create_skill_in_db(skill, session)
@@ -51,7 +52,7 @@ async def create_skill(
 @router.get("/entities/{entity_id}", response_model=dict)
 async def get_entity(
     entity_id: str,
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> dict:
     """Get an entity by ID."""
     try:
@@ -1,5 +1,7 @@
 """MCP Server - FastAPI application setup and configuration."""
 
+import asyncio
+import contextlib
 import importlib.resources
 import logging
 import os
@@ -12,7 +14,7 @@ from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
-from neo4j import AsyncSession
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncSession
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -31,9 +33,24 @@ from .api.rest import router as rest_router
 from .api.routes import router as metrics_router
 from .auth.oauth import OAUTH_AVAILABLE, validate_access_token
 from .config.settings import get_settings
-from .db.deps import get_db_session
+from .db.connection import DatabaseConnection
+from .db.deps import borrow_session, create_connection, get_read_session
+from .db.graph_version import bump_graph_version
+from .db.schema import bootstrap_schema
+from .graph.ann import ANNConfig
+from .graph.embeddings import embeddings
+from .graph.hybrid_search import hybrid_search
+from .graph.skill_matching import skill_matching
+from .graph.text_index import text_index
 from .middleware.matomo_tracking import MatomoTrackingMiddleware
+from .models.embedding import (
+    embedding_batcher,
+    embedding_model,
+    get_embedding_model,
+    load_known_skills,
+)
 from .routes import router as api_router
+from .utils.response_cache import create_backend, response_cache
 
 # Configure logging
 logging.basicConfig(
@@ -53,15 +70,123 @@ except ImportError:
     pass
 
 
+async def _bootstrap_schema(connection: DatabaseConnection) -> None:
+    """Create graph constraints and indexes, without failing startup."""
+    try:
+        async with borrow_session(connection, WRITE_ACCESS) as session:
+            await bootstrap_schema(session)
+    # pylint: disable-next=W0718
+    except Exception as exc:
+        # The server can run without the indexes, only slower
+        logger.warning("Skipping graph schema bootstrap: %s", exc)
+
+
+async def _load_text_index(connection: DatabaseConnection) -> None:
+    """Load or refresh the in-process search indexes, without failing startup."""
+    try:
+        async with borrow_session(connection, READ_ACCESS) as session:
+            was_ready = text_index.ready
+            if await text_index.load(session) and was_ready:
+                # The graph was changed outside this server
+                bump_graph_version()
+        if get_settings().search_mode == "hybrid":
+            model = await asyncio.to_thread(get_embedding_model)
+            if model is None:
+                logger.warning("No embedding model, hybrid search disabled")
+            else:
+                await asyncio.to_thread(hybrid_search.refresh, model)
+    # pylint: disable-next=W0718
+    except Exception as exc:
+        # graph.search falls back to the database until the index loads
+        logger.warning("Could not load text index: %s", exc)
+
+
+async def _refresh_text_index(connection: DatabaseConnection, interval: float) -> None:
+    """Load the text index, then pick up graph changes every ``interval`` seconds.
+
+    An interval of 0 loads the index once.
+    """
+    while True:
+        await _load_text_index(connection)
+        if not interval:
+            return
+        await asyncio.sleep(interval)
+
+
+async def _warm_up_embeddings(warm_start_file: str | None) -> None:
+    """Load the embedding model and pre-encode common queries."""
+    try:
+        await embedding_model.warm_up()
+        if warm_start_file:
+            await embedding_batcher.warm_cache(load_known_skills(warm_start_file))
+    # pylint: disable-next=W0718
+    except Exception as exc:
+        # Queries still encode on demand, only the first ones are slower
+        logger.warning("Embedding warm-up failed: %s", exc)
+
+
 @asynccontextmanager
-async def lifespan(_fastapi_app: FastAPI) -> AsyncGenerator[None, None]:
-    """Application lifespan manager."""
+async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None, None]:
+    """Application lifespan manager.
+
+    Owns the database connection, and with it the driver's connection
+    pool, which request dependencies read from ``app.state.db_connection``.
+    """
     settings = get_settings()
     # Startup
     logger.info("Starting MCP server")
+    connection = create_connection()
+    await connection.connect()
+    fastapi_app.state.db_connection = connection
+    embeddings.node_cache.maxsize = settings.embedding_node_cache_size
+    embeddings.index_config = ANNConfig(
+        kind=settings.embedding_index_kind,
+        backend=settings.embedding_index_backend,
+        nprobe=settings.embedding_index_nprobe,
+        ef_search=settings.embedding_index_ef_search,
+    )
+    if settings.embedding_snapshot_dir and embeddings.open_snapshot(
+        settings.embedding_snapshot_dir
+    ):
+        # Approximate indexes build off the event loop while requests are
+        # answered by exact search
+        embeddings.start_index_build()
+    embedding_batcher.max_batch_size = settings.embedding_batch_size
+    embedding_batcher.max_wait_ms = settings.embedding_batch_wait_ms
+    embedding_batcher.cache.maxsize = settings.embedding_query_cache_size
+    embedding_batcher.cache.ttl = settings.embedding_query_cache_ttl
+    skill_matching.evidence_cache.maxsize = settings.skill_evidence_cache_size
+    response_cache.backend = create_backend(
+        settings.response_cache_backend,
+        settings.response_cache_dir,
+        settings.response_cache_size,
+    )
+    if settings.neo4j_bootstrap_schema:
+        await _bootstrap_schema(connection)
+    # Slow loads run in the background so the server accepts requests at once
+    background_tasks = []
+    if settings.embedding_model_warmup or settings.embedding_warm_start_file:
+        background_tasks.append(
+            asyncio.create_task(
+                _warm_up_embeddings(settings.embedding_warm_start_file)
+            )
+        )
+    if settings.search_index_enabled:
+        background_tasks.append(
+            asyncio.create_task(
+                _refresh_text_index(
+                    connection, settings.search_index_refresh_interval
+                )
+            )
+        )
     yield
     # Shutdown
     logger.info("Shutting down MCP server")
+    for task in background_tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await connection.close()
     # Cleanup
     if settings.enable_telemetry:
         try:
@@ -188,21 +313,21 @@ def create_app() -> FastAPI:
     # Add direct tool endpoints for testing
     @mcp_server_app.post("/match_role", tags=["tools"])
     async def match_role_root(
-        request: dict, session: AsyncSession = Depends(get_db_session)
+        request: dict, session: AsyncSession = Depends(get_read_session)
     ) -> dict[str, Any]:
         """Match role endpoint at root level."""
         return await match_role_direct_endpoint(request, session)
 
     @mcp_server_app.post("/explain_match", tags=["tools"])
     async def explain_match_root(
-        request: dict, session: AsyncSession = Depends(get_db_session)
+        request: dict, session: AsyncSession = Depends(get_read_session)
     ) -> dict[str, Any]:
         """Explain match endpoint at root level."""
         return await explain_match_endpoint(request, session)
 
     @mcp_server_app.post("/graph_search", tags=["tools"])
     async def graph_search_root(
-        request: dict, session: AsyncSession = Depends(get_db_session)
+        request: dict, session: AsyncSession = Depends(get_read_session)
     ) -> dict[str, Any]:
         """Graph search endpoint at root level."""
         return await graph_search_endpoint(request, session)
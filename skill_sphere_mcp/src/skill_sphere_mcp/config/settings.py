@@ -58,6 +58,10 @@ class Settings(BaseSettings):
     neo4j_uri: str = Field(default="bolt://localhost:7687")
     neo4j_user: str = Field(default="neo4j")
     neo4j_password: str = Field(default="password")
+    neo4j_bootstrap_schema: bool = Field(default=True)
+    neo4j_max_connection_pool_size: int = Field(default=100, ge=1)
+    neo4j_connection_acquisition_timeout: float = Field(default=60.0, gt=0)
+    neo4j_max_connection_lifetime: float = Field(default=3600.0, gt=0)
 
     # OpenTelemetry
     otel_exporter_otlp_endpoint: str = Field(default="http://localhost:4317")
@@ -77,6 +81,35 @@ class Settings(BaseSettings):
     enable_caching: bool = Field(default=True)
     enable_oauth: bool = Field(default=False)
 
+    # Embeddings
+    embedding_snapshot_dir: str | None = Field(default=None)
+    embedding_node_cache_size: int = Field(default=1024, ge=0)
+    embedding_index_kind: str = Field(default="flat", pattern="^(flat|ivf|hnsw)$")
+    embedding_index_backend: str = Field(
+        default="auto", pattern="^(auto|faiss|numpy)$"
+    )
+    embedding_index_nprobe: int = Field(default=8, ge=1)
+    embedding_index_ef_search: int = Field(default=64, ge=1)
+    embedding_model_warmup: bool = Field(default=True)
+    embedding_batch_size: int = Field(default=32, ge=1)
+    embedding_batch_wait_ms: float = Field(default=5.0, ge=0)
+    embedding_query_cache_size: int = Field(default=1024, ge=0)
+    embedding_query_cache_ttl: float | None = Field(default=None, gt=0)
+    embedding_warm_start_file: str | None = Field(default=None)
+
+    # Skill matching
+    skill_evidence_cache_size: int = Field(default=1024, ge=0)
+
+    # Tool response cache (enable_caching switches it on)
+    response_cache_backend: str = Field(default="memory", pattern="^(memory|file)$")
+    response_cache_size: int = Field(default=1024, ge=0)
+    response_cache_dir: str | None = Field(default=None)
+
+    # In-process text search index
+    search_index_enabled: bool = Field(default=False)
+    search_index_refresh_interval: float = Field(default=300.0, ge=0)
+    search_mode: str = Field(default="lexical", pattern="^(lexical|hybrid)$")
+
     # Add otel_endpoint as a property for compatibility
     @property
     def otel_endpoint(self) -> str:
@@ -114,6 +147,8 @@ def get_test_settings() -> Settings:
         neo4j_uri="bolt://localhost:7687",
         neo4j_user="neo4j",
         neo4j_password="test_password",
+        neo4j_bootstrap_schema=False,
+        embedding_model_warmup=False,
         otel_exporter_otlp_endpoint="http://localhost:4317",
         otel_service_name="mcp-server-test",
         otel_sdk_disable=True,
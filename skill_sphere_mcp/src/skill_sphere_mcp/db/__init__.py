@@ -1,6 +1,11 @@
 """Database module."""
 
 from .connection import DatabaseConnection
-from .deps import get_db_session
+from .deps import get_db_session, get_read_session, get_write_session
 
-__all__ = ["DatabaseConnection", "get_db_session"]
+__all__ = [
+    "DatabaseConnection",
+    "get_db_session",
+    "get_read_session",
+    "get_write_session",
+]
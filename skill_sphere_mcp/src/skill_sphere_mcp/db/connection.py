@@ -1,9 +1,8 @@
 """Database connection management."""
 
 import logging
-from typing import cast
 
-from neo4j import AsyncDriver, AsyncSession, GraphDatabase
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
 from neo4j.exceptions import AuthError, ServiceUnavailable
 
 logger = logging.getLogger(__name__)
@@ -12,18 +11,55 @@ logger = logging.getLogger(__name__)
 class DatabaseConnection:
     """Database connection manager."""
 
-    def __init__(self, uri: str, user: str, password: str) -> None:
-        """Initialize database connection."""
+    # Pool options are keyword-only and mirror the driver's settings
+    # pylint: disable-next=too-many-arguments
+    def __init__(  # noqa: PLR0913
+        self,
+        uri: str,
+        user: str,
+        password: str,
+        *,
+        max_connection_pool_size: int = 100,
+        connection_acquisition_timeout: float = 60.0,
+        max_connection_lifetime: float = 3600.0,
+    ) -> None:
+        """Initialize database connection.
+
+        Args:
+            uri: Neo4j URI
+            user: Neo4j user
+            password: Neo4j password
+            max_connection_pool_size: Maximum number of pooled connections
+            connection_acquisition_timeout: Seconds to wait for a free
+                connection
+            max_connection_lifetime: Seconds after which pooled connections
+                are replaced
+        """
         self.uri = uri
         self.user = user
         self.password = password
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_acquisition_timeout = connection_acquisition_timeout
+        self.max_connection_lifetime = max_connection_lifetime
+        # Sessions currently borrowed from the driver's pool
+        self.sessions_in_use = 0
         self._driver: AsyncDriver | None = None
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether a driver has been created and not closed."""
+        return self._driver is not None
+
     async def connect(self) -> None:
         """Establish database connection."""
         try:
-            driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
-            self._driver = cast(AsyncDriver, driver)
+            self._driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password),
+                max_connection_pool_size=self.max_connection_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+                max_connection_lifetime=self.max_connection_lifetime,
+            )
             logger.info("Database connection established")
         except (ValueError, TypeError, AuthError, ServiceUnavailable) as e:
             logger.error("Failed to establish database connection: %s", e)
@@ -72,14 +108,25 @@ class DatabaseConnection:
                 self._driver = None
                 logger.info("Database connection closed")
 
-    def get_session(self) -> AsyncSession | None:
-        """Get database session."""
+    def get_session(self, access_mode: str | None = None) -> AsyncSession | None:
+        """Get database session.
+
+        Args:
+            access_mode: ``READ_ACCESS`` or ``WRITE_ACCESS``; with a routing
+                ``neo4j://`` URI, read sessions are served by cluster
+                followers and write sessions by the leader
+
+        Returns:
+            New session, or None if it could not be created
+        """
         if not self._driver:
             logger.error("No database driver available")
             return None
 
         try:
-            return self._driver.session()
+            if access_mode is None:
+                return self._driver.session()
+            return self._driver.session(default_access_mode=access_mode)
         except (RuntimeError, ValueError, AttributeError) as e:
             logger.error("Failed to create database session: %s", e)
             return None
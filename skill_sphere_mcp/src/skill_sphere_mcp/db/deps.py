@@ -1,40 +1,130 @@
 """Database dependency injection."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated
 
-from neo4j import AsyncSession
+from fastapi import Depends, Request
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncSession
+from prometheus_client import Counter, Gauge
 
 from ..config.settings import get_settings
 from .connection import DatabaseConnection
 
+# Sessions hold at most one pooled connection at a time, so borrowed
+# sessions track pool usage
+SESSIONS_IN_USE = Gauge(
+    "neo4j_pool_sessions_in_use", "Neo4j sessions currently borrowed from the pool"
+)
+SESSIONS_ACQUIRED = Counter(
+    "neo4j_pool_sessions_acquired",
+    "Neo4j sessions borrowed from the pool",
+    ["access_mode"],
+)
+POOL_MAX_SIZE = Gauge("neo4j_pool_max_size", "Configured Neo4j connection pool size")
+POOL_UTILIZATION = Gauge(
+    "neo4j_pool_utilization", "Borrowed sessions as a fraction of the pool size"
+)
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session dependency."""
+
+def create_connection() -> DatabaseConnection:
+    """Create a database connection configured from the settings.
+
+    The connection is opened and owned by the application lifespan, which
+    stores it as ``app.state.db_connection`` for :func:`get_connection`.
+    """
     settings = get_settings()
     connection = DatabaseConnection(
         uri=settings.neo4j_uri,
         user=settings.neo4j_user,
         password=settings.neo4j_password,
+        max_connection_pool_size=settings.neo4j_max_connection_pool_size,
+        connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
+        max_connection_lifetime=settings.neo4j_max_connection_lifetime,
     )
-    await connection.connect()
+    POOL_MAX_SIZE.set(connection.max_connection_pool_size)
+    return connection
+
+
+def get_connection(request: Request) -> DatabaseConnection:
+    """Return the application's database connection.
+
+    Raises:
+        RuntimeError: If the lifespan has not opened a connection
+    """
+    connection = getattr(request.app.state, "db_connection", None)
+    if connection is None:
+        raise RuntimeError("Database connection is not open")
+    return connection
+
+
+def _track_borrowed(connection: DatabaseConnection, change: int) -> None:
+    """Count sessions borrowed from a connection's pool."""
+    connection.sessions_in_use += change
+    SESSIONS_IN_USE.set(connection.sessions_in_use)
+    POOL_UTILIZATION.set(
+        connection.sessions_in_use / connection.max_connection_pool_size
+    )
+
+
+@asynccontextmanager
+async def borrow_session(
+    connection: DatabaseConnection, access_mode: str
+) -> AsyncIterator[AsyncSession]:
+    """Borrow a session from a connection's pool and return it when done.
+
+    Args:
+        connection: Open database connection
+        access_mode: ``READ_ACCESS`` or ``WRITE_ACCESS``
 
-    session = connection.get_session()
+    Raises:
+        RuntimeError: If no session could be created
+    """
+    session = connection.get_session(access_mode)
     if session is None:
-        await connection.close()
         raise RuntimeError("Failed to create database session")
 
+    SESSIONS_ACQUIRED.labels(access_mode=access_mode).inc()
+    _track_borrowed(connection, 1)
     try:
         yield session
     finally:
-        if session is not None:
-            try:
-                # Close session if it exists
-                if hasattr(session, "close") and callable(session.close):
-                    session.close()  # type: ignore[unused-coroutine]
-            except (RuntimeError, ValueError, AttributeError):
-                # Ignore known close errors
-                pass
-            except Exception:
-                # Broad catch for unexpected errors during session close (should not crash app)
-                pass
-        await connection.close()
+        try:
+            await session.close()
+        except (RuntimeError, ValueError, AttributeError):
+            # Ignore known close errors
+            pass
+        except Exception:
+            # Broad catch for unexpected errors during session close (should not crash app)
+            pass
+        finally:
+            _track_borrowed(connection, -1)
+
+
+async def get_read_session(
+    connection: Annotated[DatabaseConnection, Depends(get_connection)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get a read-only database session dependency.
+
+    Used by handlers that never write. With a ``neo4j://`` URI their
+    queries are spread across cluster followers.
+    """
+    async with borrow_session(connection, READ_ACCESS) as session:
+        yield session
+
+
+async def get_write_session(
+    connection: Annotated[DatabaseConnection, Depends(get_connection)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get a database session dependency for writes, routed to the leader.
+
+    Handlers that change the graph call
+    :func:`~skill_sphere_mcp.db.graph_version.bump_graph_version` once
+    their write has committed.
+    """
+    async with borrow_session(connection, WRITE_ACCESS) as session:
+        yield session
+
+
+# Kept for existing callers; sessions that write use get_write_session
+get_db_session = get_read_session
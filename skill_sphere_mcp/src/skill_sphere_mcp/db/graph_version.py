@@ -0,0 +1,41 @@
+"""Version of the graph as seen by this process.
+
+Writes bump the version. In-process caches of graph data, such as the
+embeddings and the skill index, compare it with the version they were
+filled at. It is a plain counter so the check costs nothing on the request
+path; bumping it also invalidates the tool response cache.
+"""
+
+from ..utils.response_cache import response_cache
+
+
+class GraphVersion:
+    """Counter of graph changes noticed by this process."""
+
+    def __init__(self) -> None:
+        """Start at version 0."""
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        """Current version."""
+        return self._value
+
+    def bump(self) -> None:
+        """Move to the next version."""
+        self._value += 1
+
+
+# Process-wide graph version
+_graph_version = GraphVersion()
+
+
+def graph_version() -> int:
+    """Return the current graph version."""
+    return _graph_version.value
+
+
+def bump_graph_version() -> None:
+    """Record that the graph changed, invalidating graph-derived caches."""
+    _graph_version.bump()
+    response_cache.invalidate()
@@ -0,0 +1,72 @@
+"""Graph schema bootstrap."""
+
+import logging
+
+from neo4j import AsyncSession
+from neo4j.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+SKILL_NAME_CONSTRAINT = """
+CREATE CONSTRAINT skill_name_unique IF NOT EXISTS
+FOR (s:Skill) REQUIRE s.name IS UNIQUE
+"""
+
+# Fallback when existing data holds duplicate skill names
+SKILL_NAME_INDEX = """
+CREATE INDEX skill_name IF NOT EXISTS
+FOR (s:Skill) ON (s.name)
+"""
+
+# Entity labels from hypergraph/graph_schema.yaml that carry a name;
+# Hyperedge anchors only have a hash and are left out.
+SEARCH_LABELS = (
+    "Person",
+    "Role",
+    "Organization",
+    "Project",
+    "Certification",
+    "Activity",
+    "Event",
+    "Skill",
+    "Tool",
+    "Topic",
+)
+
+NODE_TEXT_INDEX = "node_text"
+
+NODE_TEXT_FULLTEXT_INDEX = f"""
+CREATE FULLTEXT INDEX {NODE_TEXT_INDEX} IF NOT EXISTS
+FOR (n:{"|".join(SEARCH_LABELS)}) ON EACH [n.name, n.description]
+"""
+
+
+async def bootstrap_schema(session: AsyncSession) -> None:
+    """Create the constraints and indexes that skill lookups rely on.
+
+    Skill matching starts from ``Skill`` nodes looked up by name, so
+    ``Skill.name`` is made unique, which also indexes it. If duplicates
+    prevent the constraint, a plain index is created instead. Text search
+    uses a fulltext index over ``name`` and ``description`` of the schema
+    labels. All statements are idempotent.
+
+    Args:
+        session: Neo4j database session
+    """
+    try:
+        result = await session.run(SKILL_NAME_CONSTRAINT)
+        await result.consume()
+    except ClientError as e:
+        logger.warning(
+            "Cannot make Skill.name unique, creating a plain index: %s", e.message
+        )
+        result = await session.run(SKILL_NAME_INDEX)
+        await result.consume()
+
+    try:
+        result = await session.run(NODE_TEXT_FULLTEXT_INDEX)
+        await result.consume()
+    except ClientError as e:
+        logger.warning(
+            "Cannot create fulltext index, search will scan nodes: %s", e.message
+        )
@@ -0,0 +1,506 @@
+"""Nearest-neighbor indexes over normalized embedding matrices.
+
+Every index ranks rows by inner product, which equals cosine similarity for
+the row-normalized matrices produced by Node2Vec. Three kinds are offered:
+
+* ``flat``: exact brute-force search.
+* ``ivf``: inverted file over spherical k-means clusters; ``nprobe`` trades
+  recall for latency.
+* ``hnsw``: hierarchical navigable small world graph; ``ef_search`` trades
+  recall for latency.
+
+With the ``auto`` backend, exact search always uses NumPy so the index reads
+the (possibly memory-mapped) matrix in place instead of copying it. The
+approximate kinds use FAISS when it is installed, otherwise pure-NumPy
+implementations with the same behavior; HNSW falls back to IVF there, as the
+NumPy HNSW build is too slow for anything but small graphs.
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+import math
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import faiss  # type: ignore
+except ImportError:
+    faiss = None
+
+logger = logging.getLogger(__name__)
+
+INDEX_KINDS = ("flat", "ivf", "hnsw")
+INDEX_BACKENDS = ("auto", "faiss", "numpy")
+
+# Glob matching every file written under an index_filename() name
+INDEX_FILE_PATTERN = "index-*.bin"
+
+# Rows scored per chunk while clustering large matrices
+KMEANS_CHUNK_SIZE = 65_536
+
+
+@dataclass
+class ANNConfig:  # pylint: disable=too-many-instance-attributes
+    """Nearest-neighbor index parameters.
+
+    ``nprobe`` (IVF) and ``ef_search`` (HNSW) are the recall/latency knobs
+    and can be changed on a built index.
+    """
+
+    kind: str = "flat"
+    backend: str = "auto"
+    nlist: int = 0
+    nprobe: int = 8
+    kmeans_iterations: int = 10
+    hnsw_m: int = 16
+    ef_construction: int = 100
+    ef_search: int = 64
+    seed: int = 42
+
+
+def _top_k_rows(scores: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the ``k`` best columns of a score matrix, best first."""
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        empty = np.zeros((len(scores), 0))
+        return empty.astype(np.int64), empty.astype(np.float32)
+    # Partition out the k best columns, then sort only those
+    rows = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, rows, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    return np.take_along_axis(rows, order, axis=1), np.take_along_axis(
+        top_scores, order, axis=1
+    )
+
+
+def _pad_results(
+    rows: list[np.ndarray], scores: list[np.ndarray], k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Stack per-query results, padding short ones with row ``-1``."""
+    out_rows = np.full((len(rows), k), -1, dtype=np.int64)
+    out_scores = np.full((len(rows), k), -np.inf, dtype=np.float32)
+    for i, (query_rows, query_scores) in enumerate(zip(rows, scores, strict=True)):
+        out_rows[i, : len(query_rows)] = query_rows
+        out_scores[i, : len(query_scores)] = query_scores
+    return out_rows, out_scores
+
+
+class VectorIndex(ABC):
+    """Nearest-neighbor index over the rows of an embedding matrix."""
+
+    kind = ""
+    backend = ""
+
+    def __init__(self, config: ANNConfig):
+        """Initialize an empty index.
+
+        Args:
+            config: Index parameters
+        """
+        self.config = config
+
+    @abstractmethod
+    def build(self, matrix: np.ndarray) -> None:
+        """Index the rows of a row-normalized float32 matrix."""
+
+    @abstractmethod
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Find the ``k`` rows with the highest inner product per query.
+
+        Args:
+            queries: ``(num_queries, dimension)`` normalized float32 queries
+
+        Returns:
+            ``(num_queries, k)`` rows and scores, best first; missing results
+            are padded with row ``-1``
+        """
+
+    @abstractmethod
+    def save(self, path: str | Path) -> None:
+        """Write the index structure to ``path``."""
+
+    @abstractmethod
+    def load(self, path: str | Path, matrix: np.ndarray) -> None:
+        """Read an index written by :meth:`save` for the given matrix."""
+
+
+class NumpyFlatIndex(VectorIndex):
+    """Exact search with one matrix product per batch of queries."""
+
+    kind = "flat"
+    backend = "numpy"
+
+    def __init__(self, config: ANNConfig):
+        super().__init__(config)
+        self.matrix = np.zeros((0, 0), dtype=np.float32)
+
+    def build(self, matrix: np.ndarray) -> None:
+        self.matrix = matrix
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        return _top_k_rows(queries @ self.matrix.T, k)
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps({"kind": self.kind}), encoding="utf-8")
+
+    def load(self, path: str | Path, matrix: np.ndarray) -> None:
+        self.matrix = matrix
+
+
+class NumpyIVFIndex(VectorIndex):
+    """Inverted file index over spherical k-means clusters."""
+
+    kind = "ivf"
+    backend = "numpy"
+
+    def __init__(self, config: ANNConfig):
+        super().__init__(config)
+        self.matrix = np.zeros((0, 0), dtype=np.float32)
+        self.centroids = np.zeros((0, 0), dtype=np.float32)
+        self.order = np.zeros(0, dtype=np.int64)
+        self.offsets = np.zeros(1, dtype=np.int64)
+
+    def _assign(self, centroids: np.ndarray) -> np.ndarray:
+        """Assign every row to its most similar centroid."""
+        assignment = np.empty(len(self.matrix), dtype=np.int64)
+        for start in range(0, len(self.matrix), KMEANS_CHUNK_SIZE):
+            chunk = self.matrix[start : start + KMEANS_CHUNK_SIZE]
+            assignment[start : start + len(chunk)] = np.argmax(
+                chunk @ centroids.T, axis=1
+            )
+        return assignment
+
+    def _cluster_sums(self, assignment: np.ndarray, nlist: int) -> np.ndarray:
+        """Sum the rows of every cluster with one segmented reduction."""
+        counts = np.bincount(assignment, minlength=nlist)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        nonempty = counts > 0
+        sums = np.zeros((nlist, self.matrix.shape[1]), dtype=np.float32)
+        sums[nonempty] = np.add.reduceat(
+            self.matrix[np.argsort(assignment, kind="stable")],
+            starts[nonempty],
+            axis=0,
+        )
+        return sums
+
+    def build(self, matrix: np.ndarray) -> None:
+        self.matrix = matrix
+        n = len(matrix)
+        nlist = self.config.nlist or max(1, int(math.sqrt(n)))
+        nlist = min(nlist, n)
+        if nlist == 0:
+            return
+        rng = np.random.default_rng(self.config.seed)
+        centroids = matrix[rng.choice(n, nlist, replace=False)].astype(np.float32)
+        assignment = np.zeros(n, dtype=np.int64)
+        for _ in range(self.config.kmeans_iterations):
+            assignment = self._assign(centroids)
+            sums = self._cluster_sums(assignment, nlist)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            # Reseed empty clusters with random rows
+            sums[empty] = matrix[rng.choice(n, int(empty.sum()))]
+            norms[empty] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+        assignment = self._assign(centroids)
+        self.centroids = centroids
+        self.order = np.argsort(assignment, kind="stable")
+        self.offsets = np.zeros(nlist + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(np.bincount(assignment, minlength=nlist))
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        if len(self.centroids) == 0:
+            empty = [np.zeros(0)] * len(queries)
+            return _pad_results(empty, empty, k)
+        nprobe = min(max(self.config.nprobe, 1), len(self.centroids))
+        probes, _ = _top_k_rows(queries @ self.centroids.T, nprobe)
+        rows, scores = [], []
+        for query, lists in zip(queries, probes, strict=True):
+            candidates = np.concatenate(
+                [self.order[self.offsets[c] : self.offsets[c + 1]] for c in lists]
+            )
+            query_rows, query_scores = _top_k_rows(
+                (self.matrix[candidates] @ query)[None, :], k
+            )
+            rows.append(candidates[query_rows[0]])
+            scores.append(query_scores[0])
+        return _pad_results(rows, scores, k)
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "wb") as handle:
+            np.savez(
+                handle, centroids=self.centroids, order=self.order, offsets=self.offsets
+            )
+
+    def load(self, path: str | Path, matrix: np.ndarray) -> None:
+        self.matrix = matrix
+        with np.load(path) as data:
+            self.centroids = data["centroids"]
+            self.order = data["order"]
+            self.offsets = data["offsets"]
+
+
+class NumpyHNSWIndex(VectorIndex):
+    """Hierarchical navigable small world graph.
+
+    Layer 0 links every node to up to ``2 * hnsw_m`` neighbors, upper layers
+    to up to ``hnsw_m``. Building inserts nodes one at a time in Python, so
+    it is only used when the ``numpy`` backend is requested explicitly.
+    """
+
+    kind = "hnsw"
+    backend = "numpy"
+
+    def __init__(self, config: ANNConfig):
+        super().__init__(config)
+        self.matrix = np.zeros((0, 0), dtype=np.float32)
+        self.layers: list[np.ndarray] = []
+        self.entry_point = -1
+
+    def _neighbors(self, node: int, level: int) -> np.ndarray:
+        """Return the linked neighbors of a node on one layer."""
+        links = self.layers[level][node]
+        return links[links >= 0]
+
+    def _search_layer(
+        self, query: np.ndarray, entry_points: list[int], ef: int, level: int
+    ) -> list[tuple[float, int]]:
+        """Beam search one layer, returning up to ``ef`` (score, node) pairs."""
+        visited = set(entry_points)
+        scores = self.matrix[entry_points] @ query
+        candidates = [(-float(s), n) for s, n in zip(scores, entry_points, strict=True)]
+        results = [(float(s), n) for s, n in zip(scores, entry_points, strict=True)]
+        heapq.heapify(candidates)
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        while candidates:
+            neg_score, node = heapq.heappop(candidates)
+            if -neg_score < results[0][0] and len(results) >= ef:
+                break
+            neighbors = [
+                n for n in self._neighbors(node, level).tolist() if n not in visited
+            ]
+            if not neighbors:
+                continue
+            visited.update(neighbors)
+            neighbor_scores = (self.matrix[neighbors] @ query).tolist()
+            for score, neighbor in zip(neighbor_scores, neighbors, strict=True):
+                if len(results) < ef or score > results[0][0]:
+                    heapq.heappush(candidates, (-score, neighbor))
+                    heapq.heappush(results, (score, neighbor))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+        return sorted(results, reverse=True)
+
+    def _link(self, node: int, neighbors: list[int], level: int) -> None:
+        """Connect a node to its neighbors and prune overfull neighbor lists."""
+        links = self.layers[level]
+        capacity = links.shape[1]
+        links[node, : len(neighbors)] = neighbors[:capacity]
+        for neighbor in neighbors[:capacity]:
+            current = links[neighbor][links[neighbor] >= 0]
+            if len(current) < capacity:
+                links[neighbor, len(current)] = node
+                continue
+            # Keep the closest links of a full neighbor
+            candidates = np.append(current, node)
+            scores = self.matrix[candidates] @ self.matrix[neighbor]
+            links[neighbor] = candidates[np.argsort(-scores, kind="stable")[:capacity]]
+
+    def build(self, matrix: np.ndarray) -> None:
+        self.matrix = matrix
+        n = len(matrix)
+        m = max(self.config.hnsw_m, 2)
+        rng = np.random.default_rng(self.config.seed)
+        levels = np.floor(-np.log(1.0 - rng.random(n)) / math.log(m)).astype(int)
+        max_level = int(levels.max()) if n else -1
+        self.layers = [
+            np.full((n, 2 * m if level == 0 else m), -1, dtype=np.int32)
+            for level in range(max_level + 1)
+        ]
+        self.entry_point = -1
+        top_level = -1
+        for node in range(n):
+            node_level = int(levels[node])
+            if self.entry_point < 0:
+                self.entry_point, top_level = node, node_level
+                continue
+            query = matrix[node]
+            entry = [self.entry_point]
+            for level in range(top_level, node_level, -1):
+                entry = [self._search_layer(query, entry, 1, level)[0][1]]
+            for level in range(min(top_level, node_level), -1, -1):
+                found = self._search_layer(
+                    query, entry, self.config.ef_construction, level
+                )
+                self._link(node, [n for _, n in found[:m]], level)
+                entry = [n for _, n in found]
+            if node_level > top_level:
+                self.entry_point, top_level = node, node_level
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        rows, scores = [], []
+        for query in queries:
+            if self.entry_point < 0:
+                rows.append(np.zeros(0, dtype=np.int64))
+                scores.append(np.zeros(0))
+                continue
+            entry = [self.entry_point]
+            for level in range(len(self.layers) - 1, 0, -1):
+                entry = [self._search_layer(query, entry, 1, level)[0][1]]
+            ef = max(self.config.ef_search, k)
+            found = self._search_layer(query, entry, ef, 0)[:k]
+            rows.append(np.asarray([n for _, n in found], dtype=np.int64))
+            scores.append(np.asarray([s for s, _ in found]))
+        return _pad_results(rows, scores, k)
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "wb") as handle:
+            np.savez(
+                handle,
+                entry_point=np.asarray(self.entry_point),
+                **{f"layer{level}": links for level, links in enumerate(self.layers)},
+            )
+
+    def load(self, path: str | Path, matrix: np.ndarray) -> None:
+        self.matrix = matrix
+        with np.load(path) as data:
+            self.entry_point = int(data["entry_point"])
+            self.layers = [
+                data[f"layer{level}"]
+                for level in range(sum(key.startswith("layer") for key in data.files))
+            ]
+
+
+class FaissIndex(VectorIndex):
+    """FAISS flat, IVF or HNSW index using inner product."""
+
+    backend = "faiss"
+
+    def __init__(self, config: ANNConfig):
+        super().__init__(config)
+        self.kind = config.kind
+        self.index: faiss.Index | None = None
+
+    def _built(self) -> "faiss.Index":
+        """Return the FAISS index, which must have been built or loaded."""
+        if self.index is None:
+            raise RuntimeError("FAISS index has not been built")
+        return self.index
+
+    def _apply_knobs(self) -> None:
+        """Set the query-time recall/latency parameters."""
+        index = self._built()
+        if self.kind == "ivf":
+            index.nprobe = max(self.config.nprobe, 1)
+        elif self.kind == "hnsw":
+            index.hnsw.efSearch = self.config.ef_search
+
+    def build(self, matrix: np.ndarray) -> None:
+        vectors = np.ascontiguousarray(matrix, dtype=np.float32)
+        n, dimension = vectors.shape
+        if self.kind == "ivf":
+            nlist = min(self.config.nlist or max(1, int(math.sqrt(n))), max(n, 1))
+            quantizer = faiss.IndexFlatIP(dimension)
+            index = faiss.IndexIVFFlat(
+                quantizer, dimension, nlist, faiss.METRIC_INNER_PRODUCT
+            )
+            index.train(vectors)
+        elif self.kind == "hnsw":
+            index = faiss.IndexHNSWFlat(
+                dimension, self.config.hnsw_m, faiss.METRIC_INNER_PRODUCT
+            )
+            index.hnsw.efConstruction = self.config.ef_construction
+        else:
+            index = faiss.IndexFlatIP(dimension)
+        index.add(vectors)
+        self.index = index
+        self._apply_knobs()
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        index = self._built()
+        k = min(k, index.ntotal)
+        if k <= 0:
+            empty = [np.zeros(0)] * len(queries)
+            return _pad_results(empty, empty, 0)
+        self._apply_knobs()
+        scores, rows = index.search(np.ascontiguousarray(queries, np.float32), k)
+        return rows.astype(np.int64), scores
+
+    def save(self, path: str | Path) -> None:
+        faiss.write_index(self._built(), str(path))
+
+    def load(self, path: str | Path, matrix: np.ndarray) -> None:
+        self.index = faiss.read_index(str(path))
+        self._apply_knobs()
+
+
+_NUMPY_INDEXES: dict[str, type[VectorIndex]] = {
+    "flat": NumpyFlatIndex,
+    "ivf": NumpyIVFIndex,
+    "hnsw": NumpyHNSWIndex,
+}
+
+
+def create_index(config: ANNConfig) -> VectorIndex:
+    """Create an empty index for the configured kind and backend.
+
+    The ``auto`` backend serves exact search with :class:`NumpyFlatIndex`
+    and falls back from HNSW to IVF when FAISS is missing; the returned
+    index's ``config`` holds the parameters actually used.
+
+    Args:
+        config: Index parameters
+
+    Returns:
+        Unbuilt index
+
+    Raises:
+        ValueError: If the kind or backend is unknown or FAISS is missing
+    """
+    if config.kind not in INDEX_KINDS:
+        raise ValueError(f"Unknown index kind: {config.kind}")
+    if config.backend not in INDEX_BACKENDS:
+        raise ValueError(f"Unknown index backend: {config.backend}")
+    if config.backend == "faiss" and faiss is None:
+        raise ValueError("The faiss backend requires the faiss package")
+    if config.backend == "faiss":
+        return FaissIndex(config)
+    if config.backend == "auto" and config.kind != "flat":
+        if faiss is not None:
+            return FaissIndex(config)
+        if config.kind == "hnsw":
+            logger.warning("faiss is not installed; using an IVF index instead of HNSW")
+            config = replace(config, kind="ivf")
+    return _NUMPY_INDEXES[config.kind](config)
+
+
+def index_filename(config: ANNConfig, backend: str, vectors_id: str = "") -> str:
+    """Return the file name an index is persisted under.
+
+    The name encodes the build-time parameters and the identity of the
+    indexed vectors, so a saved index is only reused for the same vectors by
+    a configuration that would build the same structure. The query-time
+    knobs ``nprobe`` and ``ef_search`` are left out.
+
+    Args:
+        config: Index parameters
+        backend: Resolved backend name
+        vectors_id: Identity of the indexed matrix, e.g. a graph fingerprint
+
+    Returns:
+        File name
+    """
+    params = asdict(config)
+    for knob in ("nprobe", "ef_search", "backend"):
+        params.pop(knob)
+    params["vectors"] = vectors_id
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return f"index-{config.kind}-{backend}-{digest[:12]}.bin"
@@ -1,36 +1,157 @@
 # mypy: disable-error-code="union-attr"
 """Node2Vec embeddings and graph search functionality."""
 
+import asyncio
 import logging
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 from neo4j import AsyncSession
-from sklearn.metrics.pairwise import cosine_similarity
 
+from ..db.graph_version import graph_version
+from ..utils.cache import LRUCache
+from .ann import (
+    INDEX_FILE_PATTERN,
+    ANNConfig,
+    NumpyFlatIndex,
+    VectorIndex,
+    create_index,
+    index_filename,
+)
 from .node2vec.model import Node2Vec
+from .snapshot import (
+    EmbeddingSnapshot,
+    GraphFingerprint,
+    compute_fingerprint,
+    load_snapshot,
+    save_snapshot,
+)
 
 logger = logging.getLogger(__name__)
 
+GRAPH_STRUCTURE_QUERY = """
+MATCH (n)
+OPTIONAL MATCH (n)-->(m)
+RETURN id(n) as node_id, collect(id(m)) as neighbors
+"""
+
+HYDRATE_NODES_QUERY = """
+UNWIND $ids AS node_id
+MATCH (n) WHERE id(n) = node_id
+RETURN node_id, labels(n) as labels, properties(n) as props
+"""
+
 
 class Node2VecEmbeddings:
     """Manages Node2Vec embeddings for graph nodes."""
 
-    def __init__(self, dimension: int = 128):
+    def __init__(
+        self,
+        dimension: int = 128,
+        snapshot_dir: str | None = None,
+        node_cache_size: int = 0,
+        index_config: ANNConfig | None = None,
+    ):
         """Initialize Node2Vec embeddings.
 
         Args:
             dimension: Embedding dimension size
+            snapshot_dir: Directory of the persisted embedding snapshot
+            node_cache_size: Number of hydrated node payloads to cache, 0 to
+                disable
+            index_config: Nearest-neighbor index parameters, exact search
+                by default
         """
         self.dimension = dimension
+        self.snapshot_dir = snapshot_dir
+        self.fingerprint: GraphFingerprint | None = None
+        self._verified = False
+        self._verified_version = graph_version()
         self._embeddings: dict[str, np.ndarray] = {}
         self._node_ids: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
+        self._row_ids: list[str] = []
+        self.index_config = index_config or ANNConfig()
+        self._index: VectorIndex | None = None
+        self._index_dir: str | None = None
+        # Bumped whenever the search matrix changes, so a build that started
+        # before the change is not installed
+        self._search_generation = 0
+        self._index_task: asyncio.Task[VectorIndex] | None = None
+        self.node_cache: LRUCache[str, dict[str, Any]] = LRUCache(node_cache_size)
         self.model: Any | None = None  # type: ignore[python-version, unused-ignore, syntax]
 
+    @property
+    def is_loaded(self) -> bool:
+        """Whether embeddings were checked against the current graph.
+
+        Any write since the check bumps the graph version and makes the
+        embeddings unverified again.
+        """
+        return self._verified and self._verified_version == graph_version()
+
+    def open_snapshot(self, snapshot_dir: str | None = None) -> bool:
+        """Memory-map the persisted snapshot without querying the graph.
+
+        Used at startup so the first request does not have to train. The
+        snapshot is verified against the graph fingerprint on the first
+        :meth:`load_embeddings`.
+
+        Args:
+            snapshot_dir: Snapshot directory, defaults to ``snapshot_dir``
+
+        Returns:
+            Whether a snapshot was loaded
+        """
+        if snapshot_dir is not None:
+            self.snapshot_dir = snapshot_dir
+        if not self.snapshot_dir:
+            return False
+        snapshot = load_snapshot(self.snapshot_dir)
+        if snapshot is None:
+            return False
+        self._use_snapshot(snapshot)
+        self._verified = False
+        logger.info("Loaded embedding snapshot of %d nodes", len(snapshot.node_ids))
+        return True
+
+    def _use_snapshot(self, snapshot: EmbeddingSnapshot) -> None:
+        """Serve embeddings as row views of a snapshot matrix."""
+        self._embeddings = dict(zip(snapshot.node_ids, snapshot.matrix, strict=True))
+        self._invalidate_search()
+        norms = np.linalg.norm(snapshot.matrix, axis=1)
+        if np.allclose(norms, 1.0, atol=1e-4):
+            # Search the mapped matrix directly to keep it shared, and keep
+            # its index next to it
+            self._matrix, self._row_ids = snapshot.matrix, list(snapshot.node_ids)
+            self._index_dir = self.snapshot_dir
+        self._node_ids = {node: int(node) for node in snapshot.node_ids}
+        self._set_fingerprint(snapshot.fingerprint)
+        self.model = None
+
+    def _set_fingerprint(self, fingerprint: GraphFingerprint) -> None:
+        """Record the graph fingerprint, dropping cached nodes if it changed."""
+        if fingerprint != self.fingerprint:
+            self.node_cache.clear()
+        self.fingerprint = fingerprint
+
     async def load_embeddings(self, session: AsyncSession) -> None:
-        """Load embeddings from graph."""
-        # Get all nodes from graph
-        result = await session.run("MATCH (n) RETURN n")
+        """Load embeddings for the current graph.
+
+        The graph structure is fingerprinted first. Embeddings already held
+        or persisted for the same fingerprint are reused; otherwise Node2Vec
+        is trained and, if a snapshot directory is set, a new snapshot is
+        written.
+        """
+        version = graph_version()
+        if version != self._verified_version:
+            # Node properties may have changed without the structure
+            self.node_cache.clear()
+            self._verified_version = version
+
+        # Get all nodes and their outgoing edges from graph
+        result = await session.run(GRAPH_STRUCTURE_QUERY)
         nodes = [record async for record in result]
 
         # If no nodes found, return early
@@ -38,11 +159,28 @@ class Node2VecEmbeddings:
             self.model = None
             return
 
-        # Create Node2Vec instance
-        node2vec = Node2Vec()
+        graph = {
+            str(node["node_id"]): [
+                str(n) for n in (node.get("neighbors") or []) if n is not None
+            ]
+            for node in nodes
+        }
+        fingerprint = compute_fingerprint(graph)
+        if self._embeddings and fingerprint == self.fingerprint:
+            self._verified = True
+            return
+        snapshot = (
+            load_snapshot(self.snapshot_dir, fingerprint) if self.snapshot_dir else None
+        )
+        if snapshot is not None:
+            self._use_snapshot(snapshot)
+            self._verified = True
+            logger.info("Reused embedding snapshot for %d nodes", len(nodes))
+            return
 
-        # Train model
-        await node2vec.fit(session)
+        # Train on the structure fetched above, off the event loop
+        node2vec = Node2Vec()
+        await asyncio.to_thread(node2vec.fit_graph, graph)
         self.model = node2vec
 
         # Store embeddings
@@ -51,10 +189,45 @@ class Node2VecEmbeddings:
             for node in nodes
             if (embedding := node2vec.get_embedding(str(node["node_id"]))) is not None
         }
+        self._invalidate_search()
         self._node_ids = {str(node["node_id"]): int(node["node_id"]) for node in nodes}
+        self._set_fingerprint(fingerprint)
+        self._verified = True
 
         logger.info("Computed Node2Vec embeddings for %d nodes", len(nodes))
 
+        if self.snapshot_dir:
+            self._persist_snapshot(node2vec, fingerprint)
+
+    def _persist_snapshot(
+        self, node2vec: Node2Vec, fingerprint: GraphFingerprint
+    ) -> None:
+        """Write freshly trained embeddings to the snapshot directory.
+
+        A snapshot that cannot be written is logged and the trained
+        embeddings stay in use.
+        """
+        matrix = node2vec.get_embedding_matrix()
+        if matrix is None:
+            return
+        node_ids, embedding_matrix = matrix
+        try:
+            save_snapshot(
+                self.snapshot_dir,
+                EmbeddingSnapshot(node_ids, embedding_matrix, fingerprint),
+            )
+            for stale in Path(self.snapshot_dir).glob(INDEX_FILE_PATTERN):
+                stale.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning(
+                "Could not write embedding snapshot to %s: %s", self.snapshot_dir, exc
+            )
+            return
+        # Serve the written snapshot so its index can be persisted too
+        if snapshot := load_snapshot(self.snapshot_dir, fingerprint):
+            self._use_snapshot(snapshot)
+            self.model = node2vec
+
     async def search(
         self, session: AsyncSession, query_embedding: np.ndarray, top_k: int = 10
     ) -> list[dict[str, Any]]:
@@ -68,42 +241,200 @@ class Node2VecEmbeddings:
         Returns:
             List of similar nodes with scores
         """
-        if not self._embeddings:
+        results = await self.search_batch(
+            session, np.asarray(query_embedding).reshape(1, -1), top_k
+        )
+        return results[0]
+
+    async def search_batch(
+        self, session: AsyncSession, query_embeddings: np.ndarray, top_k: int = 10
+    ) -> list[list[dict[str, Any]]]:
+        """Search for the nodes most similar to each of several queries.
+
+        All queries are scored against the normalized embedding matrix with
+        a single matrix product.
+
+        Args:
+            session: Neo4j session
+            query_embeddings: ``(num_queries, dimension)`` query matrix
+            top_k: Number of results to return per query
+
+        Returns:
+            List of similar nodes with scores for every query
+        """
+        if not self.is_loaded:
             await self.load_embeddings(session)
+        self.start_index_build()
 
-        # Compute similarities
-        similarities = {}
-        for node_id, embedding in self._embeddings.items():
-            similarity = cosine_similarity(
-                query_embedding.reshape(1, -1), embedding.reshape(1, -1)
-            )[0][0]
-            similarities[node_id] = similarity
-
-        # Get top-k results
-        top_results = sorted(similarities.items(), key=lambda x: x[1], reverse=True)[
-            :top_k
+        rows, scores = self.top_k(query_embeddings, top_k)
+        hits = [
+            [
+                (self._row_ids[row], float(score))
+                for row, score in zip(*query, strict=True)
+                if row >= 0
+            ]
+            for query in zip(rows, scores, strict=True)
         ]
+        # Hydrate the hits of all queries in a single round-trip
+        payloads = await self._hydrate(
+            session, {node_id for query in hits for node_id, _ in query}
+        )
+        return [
+            [
+                {"node_id": node_id, "score": score, **payloads[node_id]}
+                for node_id, score in query
+                if node_id in payloads
+            ]
+            for query in hits
+        ]
+
+    def top_k(
+        self, query_embeddings: np.ndarray, top_k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Rank matrix rows by cosine similarity to each query.
+
+        Args:
+            query_embeddings: ``(num_queries, dimension)`` query matrix
+            top_k: Number of rows to return per query
+
+        Returns:
+            ``(num_queries, k)`` row indices and scores, best first
+        """
+        queries = _normalize_rows(np.atleast_2d(query_embeddings).astype(np.float32))
+        return self._search_index().search(queries, top_k)
+
+    def _invalidate_search(self) -> None:
+        """Drop the search matrix and index after the embeddings changed."""
+        self._matrix = None
+        self._index = None
+        self._index_dir = None
+        self._search_generation += 1
+
+    def _search_index(self) -> VectorIndex:
+        """Return the index to answer queries with.
+
+        Exact indexes are built on first use. Approximate ones are built by
+        :meth:`build_index`, usually in the background through
+        :meth:`start_index_build`; until then queries fall back to exact
+        search over the same matrix.
+        """
+        if self._index is not None:
+            return self._index
+        if self.index_config.kind == "flat":
+            return self.build_index()
+        fallback = NumpyFlatIndex(self.index_config)
+        fallback.build(self._search_matrix())
+        return fallback
+
+    def start_index_build(self) -> None:
+        """Build the configured approximate index in a worker thread.
+
+        Does nothing for exact search, without embeddings, or while the
+        index is already built or being built.
+        """
+        if (
+            self._index is not None
+            or self.index_config.kind == "flat"
+            or not self._embeddings
+            or (self._index_task is not None and not self._index_task.done())
+        ):
+            return
+        # The matrix is captured on the event loop; the thread only reads it
+        self._index_task = asyncio.create_task(
+            asyncio.to_thread(self._build_index, *self._index_inputs())
+        )
+        self._index_task.add_done_callback(_log_index_failure)
+
+    def build_index(self) -> VectorIndex:
+        """Load or build the configured index over the search matrix.
+
+        Returns:
+            The index, also installed for later searches
+        """
+        return self._build_index(*self._index_inputs())
 
-        # Fetch node details
-        results = []
-        for node_id, score in top_results:
-            query = """
-            MATCH (n) WHERE id(n) = $node_id
-            RETURN n, labels(n) as labels, properties(n) as props
-            """
-            result = await session.run(query, node_id=int(node_id))
-            record = await result.single()
-            if record:
-                results.append(
-                    {
-                        "node_id": node_id,
-                        "score": float(score),
-                        "labels": record["labels"],
-                        "properties": record["props"],
-                    }
-                )
-
-        return results
+    def _index_inputs(self) -> tuple[VectorIndex, np.ndarray, Path | None, int]:
+        """Return an empty index, the matrix, file path and generation to build."""
+        index = create_index(self.index_config)
+        matrix = self._search_matrix()
+        path = None
+        if self._index_dir and self.fingerprint is not None:
+            path = Path(self._index_dir) / index_filename(
+                index.config, index.backend, self.fingerprint.digest
+            )
+        return index, matrix, path, self._search_generation
+
+    def _build_index(
+        self,
+        index: VectorIndex,
+        matrix: np.ndarray,
+        path: Path | None,
+        generation: int,
+    ) -> VectorIndex:
+        """Load or build an index over ``matrix`` and install it if still current.
+
+        Indexes over a snapshot matrix are loaded from, or saved to, the
+        snapshot directory so restarts and other workers skip the build. An
+        index that cannot be saved is logged and still used.
+        """
+        if path is not None and path.exists():
+            index.load(path, matrix)
+        else:
+            index.build(matrix)
+            logger.info(
+                "Built %s %s index over %d nodes",
+                index.backend,
+                index.kind,
+                len(matrix),
+            )
+            if path is not None:
+                try:
+                    index.save(path)
+                except OSError as exc:
+                    logger.warning("Could not save search index to %s: %s", path, exc)
+        if generation == self._search_generation:
+            self._index = index
+        return index
+
+    def _search_matrix(self) -> np.ndarray:
+        """Return the contiguous, row-normalized embedding matrix.
+
+        Built once from the embeddings and reused until they change.
+        """
+        if self._matrix is None:
+            self._row_ids = list(self._embeddings)
+            if self._row_ids:
+                stacked = np.vstack(list(self._embeddings.values()))
+            else:
+                stacked = np.zeros((0, self.dimension))
+            self._matrix = _normalize_rows(stacked.astype(np.float32))
+        return self._matrix
+
+    async def _hydrate(
+        self, session: AsyncSession, node_ids: set[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch labels and properties for nodes, serving repeats from cache.
+
+        Uncached nodes are fetched with one ``UNWIND`` query. The cache is
+        cleared whenever the graph fingerprint or graph version changes.
+
+        Args:
+            session: Neo4j session
+            node_ids: Node IDs to hydrate
+
+        Returns:
+            Mapping of found node IDs to their ``labels`` and ``properties``
+        """
+        payloads = self.node_cache.get_many(node_ids)
+        missing = [int(node_id) for node_id in node_ids if node_id not in payloads]
+        if missing:
+            result = await session.run(HYDRATE_NODES_QUERY, ids=missing)
+            async for record in result:
+                node_id = str(record["node_id"])
+                payload = {"labels": record["labels"], "properties": record["props"]}
+                payloads[node_id] = payload
+                self.node_cache.put(node_id, payload)
+        return payloads
 
     # type: ignore[python-version, unused-ignore, syntax, union-attr]
     def get_embedding(self, node_id: str) -> np.ndarray | None:
@@ -117,6 +448,7 @@ class Node2VecEmbeddings:
             new_embeddings: Dictionary mapping node IDs to their embeddings
         """
         self._embeddings = new_embeddings.copy()
+        self._invalidate_search()
 
     def get_all_embeddings(self) -> dict[str, np.ndarray]:
         """Get all node embeddings.
@@ -127,5 +459,17 @@ class Node2VecEmbeddings:
         return self._embeddings.copy()
 
 
+def _log_index_failure(task: asyncio.Task[VectorIndex]) -> None:
+    """Log a background index build that failed; searches stay exact."""
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.warning("Could not build the embedding search index: %s", exc)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length, leaving all-zero rows at zero."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
 # Global embeddings instance
 embeddings = Node2VecEmbeddings()
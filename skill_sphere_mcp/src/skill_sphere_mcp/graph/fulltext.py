@@ -0,0 +1,122 @@
+"""Text search over node names and descriptions.
+
+Queries go to the ``node_text`` fulltext index created by the schema
+bootstrap and come back with Lucene relevance scores. When the index does
+not exist the search falls back to a case-insensitive ``CONTAINS`` scan and
+only retries the index after ``INDEX_RETRY_SECONDS``.
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from neo4j import AsyncSession
+from neo4j.exceptions import ClientError
+
+from ..db.schema import NODE_TEXT_INDEX
+
+logger = logging.getLogger(__name__)
+
+FULLTEXT_SEARCH_QUERY = """
+CALL db.index.fulltext.queryNodes($index, $search_query)
+YIELD node, score
+RETURN node AS n, score
+LIMIT $limit
+"""
+
+# Scan fallback; every hit gets the same score
+SCAN_SEARCH_QUERY = """
+MATCH (n)
+WHERE toLower(n.name) CONTAINS toLower($search_query)
+   OR toLower(n.description) CONTAINS toLower($search_query)
+RETURN n, 1.0 AS score
+LIMIT $limit
+"""
+
+INDEX_RETRY_SECONDS = 60.0
+
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+@dataclass
+class _IndexState:
+    """What this process knows about the fulltext index."""
+
+    # Monotonic time before which the index is assumed to be missing
+    missing_until: float = 0.0
+
+
+_index_state = _IndexState()
+
+
+def lucene_query(text: str) -> str:
+    """Build a Lucene query matching each term exactly or as a prefix.
+
+    Operators in user input are escaped so it is never parsed as syntax.
+
+    Args:
+        text: Free-text search string
+
+    Returns:
+        Lucene query string, empty if ``text`` has no terms
+    """
+    terms = [_LUCENE_SPECIAL.sub(r"\\\1", term) for term in text.lower().split()]
+    return " ".join(f"{term} {term}*" for term in terms)
+
+
+def search_hit(node: Any) -> dict[str, Any]:
+    """Return a node found by :func:`search_nodes` as a search hit.
+
+    Hits from the in-process indexes have the same shape.
+
+    Args:
+        node: Node returned by the driver
+
+    Returns:
+        Node element ID, labels and properties
+    """
+    return {
+        "node_id": getattr(node, "element_id", None),
+        "labels": sorted(getattr(node, "labels", ())),
+        "properties": dict(node),
+    }
+
+
+def _is_missing_index(error: ClientError) -> bool:
+    if error.code == "Neo.ClientError.Procedure.ProcedureNotFound":
+        return True
+    return "index" in (error.message or "").lower()
+
+
+async def search_nodes(
+    session: AsyncSession, query: str, limit: int
+) -> list[Any]:
+    """Find nodes whose name or description matches ``query``.
+
+    Args:
+        session: Neo4j database session
+        query: Free-text search string
+        limit: Maximum number of records
+
+    Returns:
+        Records with the node as ``n`` and its relevance ``score``, best first
+    """
+    search_query = lucene_query(query)
+    if search_query and time.monotonic() >= _index_state.missing_until:
+        try:
+            result = await session.run(
+                FULLTEXT_SEARCH_QUERY,
+                index=NODE_TEXT_INDEX,
+                search_query=search_query,
+                limit=limit,
+            )
+            return [record async for record in result]
+        except ClientError as e:
+            if not _is_missing_index(e):
+                raise
+            logger.warning("Fulltext index unavailable, scanning nodes: %s", e.message)
+            _index_state.missing_until = time.monotonic() + INDEX_RETRY_SECONDS
+
+    result = await session.run(SCAN_SEARCH_QUERY, search_query=query, limit=limit)
+    return [record async for record in result]
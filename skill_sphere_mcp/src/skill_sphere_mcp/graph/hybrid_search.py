@@ -0,0 +1,202 @@
+"""Hybrid lexical and semantic node search.
+
+Every indexed node's name and description is embedded once with the
+sentence-transformer model, and only nodes whose text changed are
+re-encoded on refresh. A query is encoded once and its cosine ranking is
+merged with the BM25 ranking of the in-process text index using reciprocal
+rank fusion, which needs no score calibration between the two.
+"""
+
+import logging
+from typing import Any
+
+import numpy as np
+
+from ..models.embedding import EmbeddingBatcher, embedding_batcher
+from .text_index import InvertedIndex, text_index
+
+logger = logging.getLogger(__name__)
+
+# Standard RRF damping constant
+RRF_K = 60
+
+# Hits taken from each ranking before fusion
+CANDIDATE_POOL = 50
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[str]], limit: int, k: int = RRF_K
+) -> list[tuple[str, float]]:
+    """Merge rankings by summing ``1 / (k + rank)`` per item.
+
+    Args:
+        rankings: Item IDs per ranking, best first
+        limit: Maximum number of results
+        k: Damping constant; larger values flatten rank differences
+
+    Returns:
+        (item ID, fused score) pairs, best first
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+class NodeTextEmbeddings:
+    """Normalized sentence embeddings of node text."""
+
+    def __init__(self) -> None:
+        """Initialize an empty embedding table."""
+        self._texts: dict[str, str] = {}
+        # IDs and matrix rows are swapped together so readers on the event
+        # loop never see them out of step while sync() runs in a thread
+        self._table: tuple[list[str], np.ndarray] = (
+            [],
+            np.empty((0, 0), dtype=np.float32),
+        )
+
+    def __len__(self) -> int:
+        """Number of embedded nodes."""
+        return len(self._table[0])
+
+    def sync(self, texts: dict[str, str], model: Any) -> int:
+        """Embed ``texts``, re-encoding only new or changed entries.
+
+        Args:
+            texts: Node text by node ID
+            model: SentenceTransformer model
+
+        Returns:
+            Number of texts encoded
+        """
+        kept = {
+            node_id: row
+            for node_id, row in zip(*self._table, strict=True)
+            if self._texts.get(node_id) == texts.get(node_id)
+        }
+        stale = [node_id for node_id in texts if node_id not in kept]
+        if stale:
+            encoded = model.encode(
+                [texts[node_id] for node_id in stale], normalize_embeddings=True
+            )
+            kept.update(zip(stale, np.asarray(encoded, dtype=np.float32), strict=True))
+        ids = list(texts)
+        matrix = (
+            np.stack([kept[node_id] for node_id in ids])
+            if ids
+            else np.empty((0, 0), dtype=np.float32)
+        )
+        self._table = (ids, matrix)
+        self._texts = dict(texts)
+        return len(stale)
+
+    def rank(self, query_vector: np.ndarray, limit: int) -> list[tuple[str, float]]:
+        """Rank nodes by cosine similarity to a normalized query vector.
+
+        Args:
+            query_vector: Normalized query embedding
+            limit: Maximum number of results
+
+        Returns:
+            (node ID, similarity) pairs, best first
+        """
+        ids, matrix = self._table
+        if not ids or limit <= 0:
+            return []
+        scores = matrix @ np.ravel(query_vector).astype(np.float32)
+        top = np.argpartition(-scores, min(limit, len(scores)) - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return [(ids[i], float(scores[i])) for i in top]
+
+
+class HybridSearch:
+    """BM25 and embedding rankings fused with reciprocal rank fusion."""
+
+    def __init__(
+        self, lexical: InvertedIndex, batcher: EmbeddingBatcher | None = None
+    ):
+        """Initialize hybrid search over a text index.
+
+        Args:
+            lexical: Text index providing nodes and BM25 rankings
+            batcher: Query encoder; by default one batching over the model
+                passed to :meth:`refresh`
+        """
+        self.lexical = lexical
+        self.embeddings = NodeTextEmbeddings()
+        self.model: Any = None
+        self.batcher = batcher or EmbeddingBatcher(lambda: self.model)
+
+    @property
+    def ready(self) -> bool:
+        """Whether node embeddings have been computed."""
+        return self.model is not None and self.lexical.ready
+
+    def refresh(self, model: Any) -> int:
+        """Bring node embeddings in line with the text index.
+
+        Args:
+            model: SentenceTransformer model
+
+        Returns:
+            Number of nodes encoded
+        """
+        # Copy so the text index can keep changing while this runs in a thread
+        encoded = self.embeddings.sync(dict(self.lexical.texts), model)
+        self.model = model
+        logger.info("Embedded %d node texts for hybrid search", encoded)
+        return encoded
+
+    async def search(
+        self, query: str, limit: int
+    ) -> list[tuple[dict[str, Any], float]]:
+        """Rank nodes against a query lexically and semantically.
+
+        Args:
+            query: Free-text search string
+            limit: Maximum number of results
+
+        Returns:
+            (search hit, fused score) pairs, best first
+        """
+        pool = max(limit, CANDIDATE_POOL)
+        query_vector = await self.batcher.encode(query)
+        # Embeddings may briefly trail the text index during a refresh
+        rankings = [
+            [node_id for node_id, _ in self.lexical.rank(query, pool)],
+            [
+                node_id
+                for node_id, _ in self.embeddings.rank(query_vector, pool)
+                if node_id in self.lexical.texts
+            ],
+        ]
+        return [
+            (self.lexical.node(node_id), score)
+            for node_id, score in reciprocal_rank_fusion(rankings, limit)
+        ]
+
+
+# Global hybrid search over the global text index, enabled at startup
+hybrid_search = HybridSearch(text_index, embedding_batcher)
+
+
+async def search_in_memory(
+    query: str, limit: int
+) -> list[tuple[dict[str, Any], float]] | None:
+    """Search the loaded in-process indexes, preferring hybrid ranking.
+
+    Args:
+        query: Free-text search string
+        limit: Maximum number of results
+
+    Returns:
+        (search hit, score) pairs, best first, or None if no index is
+        loaded and the database has to be queried
+    """
+    if hybrid_search.ready:
+        return await hybrid_search.search(query, limit)
+    if text_index.ready:
+        return text_index.search(query, limit)
+    return None
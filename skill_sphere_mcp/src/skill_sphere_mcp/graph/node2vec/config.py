@@ -5,7 +5,17 @@ from dataclasses import dataclass, field
 
 @dataclass
 class Node2VecTrainingConfig:
-    """Node2Vec training parameters."""
+    """Node2Vec training parameters.
+
+    ``workers`` above 1 shards walk generation and Hogwild-style training
+    across that many processes; ``seed`` makes runs reproducible for a given
+    number of workers.
+
+    Walks are streamed into training in blocks of ``walk_block_size``
+    walkers and regenerated for every epoch. With ``walk_spill_path`` one
+    pass of walks is written to that ``.npy`` file instead and replayed from
+    a memory map on every epoch.
+    """
 
     walk_length: int = 80
     num_walks: int = 10
@@ -13,15 +23,26 @@ class Node2VecTrainingConfig:
     num_neg_samples: int = 5
     learning_rate: float = 0.025
     epochs: int = 5
+    batch_size: int = 1024
+    workers: int = 1
+    seed: int = 42
+    walk_block_size: int = 10_000
+    walk_spill_path: str | None = None
 
 
 @dataclass
 class Node2VecModelConfig:
-    """Node2Vec model parameters."""
+    """Node2Vec model parameters.
+
+    ``lazy_edges`` and ``lazy_edge_threshold`` are passed on to the
+    :class:`TransitionConfig` used when fitting.
+    """
 
     dimension: int = 128
     p: float = 1.0
     q: float = 1.0
+    lazy_edges: bool = False
+    lazy_edge_threshold: int | None = None
 
 
 @dataclass
@@ -34,13 +55,22 @@ class Node2VecConfig:
 
 @dataclass
 class TransitionConfig:
-    """Configuration for transition probabilities."""
+    """Configuration for transition probabilities.
+
+    With ``lazy_edges`` the per-edge alias tables are not built; biased
+    second-order steps are instead drawn at walk time by rejection sampling
+    against the first-order node tables. ``lazy_edge_threshold`` switches to
+    lazy sampling only when the edge tables would hold more entries than
+    that.
+    """
 
     p: float
     q: float
     weight_key: str
     directed: bool
     unweighted: bool
+    lazy_edges: bool = False
+    lazy_edge_threshold: int | None = None
 
 
 @dataclass
@@ -52,3 +82,4 @@ class PreprocessConfig:
     weight_key: str = "weight"
     directed: bool = False
     unweighted: bool = False
+    lazy_edges: bool = False
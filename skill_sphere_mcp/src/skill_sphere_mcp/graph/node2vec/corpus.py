@@ -0,0 +1,185 @@
+"""Streaming walk corpora for Node2Vec training."""
+
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+import numpy as np
+
+from .csr import CSRGraph
+from .parallel import WorkerPool, pool_simulate_walks
+from .walks import simulate_walks
+
+logger = logging.getLogger(__name__)
+
+
+class WalkCorpus(ABC):
+    """Replayable source of fixed-size int32 walk blocks.
+
+    Every call to :meth:`blocks` starts a new pass over the corpus, so the
+    trainer can consume one block at a time instead of holding every walk.
+    """
+
+    @property
+    def graph(self) -> CSRGraph | None:
+        """Compiled graph walks are simulated on, or None for stored walks."""
+        return None
+
+    @abstractmethod
+    def blocks(self, pool: WorkerPool | None = None) -> Iterator[np.ndarray]:
+        """Yield ``(block_rows, walk_length)`` int32 walk arrays.
+
+        Padding after dead ends is ``-1``.
+
+        Args:
+            pool: Worker pool holding :attr:`graph` to simulate walks on, if
+                the corpus generates them
+        """
+
+    @abstractmethod
+    def node_counts(self) -> np.ndarray:
+        """Return the expected occurrence count of every node in the corpus."""
+
+
+class ArrayWalkCorpus(WalkCorpus):
+    """Corpus over a walk array that is already in memory."""
+
+    def __init__(self, walks: np.ndarray, num_nodes: int, block_size: int):
+        """Initialize the corpus.
+
+        Args:
+            walks: 2-D walk array
+            num_nodes: Number of distinct node indices
+            block_size: Walks per block
+        """
+        self.walks = walks
+        self.num_nodes = num_nodes
+        self.block_size = max(block_size, 1)
+
+    def blocks(self, pool: WorkerPool | None = None) -> Iterator[np.ndarray]:
+        """Yield consecutive slices of the walk array."""
+        for start in range(0, len(self.walks), self.block_size):
+            yield self.walks[start : start + self.block_size]
+
+    def node_counts(self) -> np.ndarray:
+        """Count node occurrences exactly."""
+        return np.bincount(self.walks[self.walks >= 0], minlength=self.num_nodes)
+
+
+class MemmapWalkCorpus(WalkCorpus):
+    """Corpus replayed block by block from a memory-mapped ``.npy`` file."""
+
+    def __init__(self, path: str, counts: np.ndarray, block_size: int):
+        """Initialize the corpus.
+
+        Args:
+            path: Path of the ``.npy`` walk file
+            counts: Node occurrence counts of the stored walks
+            block_size: Walks per block
+        """
+        self.path = path
+        self.counts = counts
+        self.block_size = max(block_size, 1)
+
+    def blocks(self, pool: WorkerPool | None = None) -> Iterator[np.ndarray]:
+        """Read one block of walks at a time from the mapped file."""
+        walks = np.load(self.path, mmap_mode="r")
+        for start in range(0, len(walks), self.block_size):
+            yield np.asarray(walks[start : start + self.block_size])
+
+    def node_counts(self) -> np.ndarray:
+        """Return the exact counts gathered while spilling."""
+        return self.counts
+
+
+class GeneratedWalkCorpus(WalkCorpus):
+    """Corpus that simulates fresh walks on the compiled graph for every pass.
+
+    Walks are simulated in the calling process unless :meth:`blocks` is
+    given a worker pool holding the graph.
+    """
+
+    def __init__(
+        self,
+        csr: CSRGraph,
+        num_walks: int,
+        walk_length: int,
+        rng: np.random.Generator,
+        block_size: int,
+    ):
+        """Initialize the corpus.
+
+        Args:
+            csr: Compiled graph
+            num_walks: Number of walks per start node and pass
+            walk_length: Maximum number of nodes per walk
+            rng: Random number generator
+            block_size: Walks per block
+        """
+        self.csr = csr
+        self.num_walks = num_walks
+        self.walk_length = walk_length
+        self.rng = rng
+        self.block_size = max(block_size, 1)
+
+    def __len__(self) -> int:
+        """Number of walks in one pass."""
+        return self.num_walks * len(self.csr.start_nodes)
+
+    @property
+    def graph(self) -> CSRGraph:
+        """Compiled graph walks are simulated on."""
+        return self.csr
+
+    def blocks(self, pool: WorkerPool | None = None) -> Iterator[np.ndarray]:
+        """Simulate one block of walkers at a time.
+
+        Start nodes are shuffled independently for each of the ``num_walks``
+        rounds, as in :func:`~.walks.generate_walk_array`.
+
+        Args:
+            pool: Pool from :func:`~.parallel.walk_pool` or
+                :func:`~.parallel.training_pool` to shard each block across
+        """
+        for _ in range(self.num_walks):
+            starts = self.rng.permutation(self.csr.start_nodes).astype(np.int32)
+            for offset in range(0, len(starts), self.block_size):
+                block = starts[offset : offset + self.block_size]
+                if pool is not None:
+                    yield pool_simulate_walks(pool, block, self.walk_length, self.rng)
+                else:
+                    yield simulate_walks(self.csr, block, self.walk_length, self.rng)
+
+    def node_counts(self) -> np.ndarray:
+        """Approximate node frequencies by degree.
+
+        The stationary distribution of a random walk on an undirected graph
+        is proportional to node degree, which avoids a counting pass over
+        walks that are never stored.
+        """
+        return self.csr.degrees.astype(np.int64)
+
+    def spill(self, path: str, pool: WorkerPool | None = None) -> MemmapWalkCorpus:
+        """Generate one pass of walks into a memory-mapped ``.npy`` file.
+
+        Later passes replay the stored walks instead of simulating new ones.
+
+        Args:
+            path: Destination of the walk file
+            pool: Worker pool to simulate the walks on, as for :meth:`blocks`
+
+        Returns:
+            Corpus backed by the written file
+        """
+        shape = (len(self), max(self.walk_length, 0))
+        walks = np.lib.format.open_memmap(path, mode="w+", dtype=np.int32, shape=shape)
+        counts = np.zeros(self.csr.num_nodes, dtype=np.int64)
+        offset = 0
+        for block in self.blocks(pool):
+            walks[offset : offset + len(block)] = block
+            counts += np.bincount(block[block >= 0], minlength=self.csr.num_nodes)
+            offset += len(block)
+        walks.flush()
+        del walks
+        logger.debug("Spilled %d walks to %s", offset, path)
+        return MemmapWalkCorpus(path, counts, self.block_size)
@@ -0,0 +1,171 @@
+"""Compressed sparse row (CSR) graph representation for Node2Vec walks."""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class CSRGraph:
+    """Integer-indexed adjacency and alias tables stored as flat NumPy arrays.
+
+    Node ``i`` has neighbors ``indices[indptr[i]:indptr[i + 1]]``, sorted in
+    ascending order. ``node_j``/``node_q`` hold the first-order alias table of
+    every node in the same slots as its neighbors. ``edge_j``/``edge_q`` hold
+    the second-order alias table of directed edge ``e`` (a position in
+    ``indices``) in ``edge_ptr[e]:edge_ptr[e + 1]``; they are empty when the
+    graph was compiled without edge tables, in which case walks apply the
+    return parameter ``p`` and in-out parameter ``q`` lazily.
+    """
+
+    node_ids: list[str]
+    index: dict[str, int]
+    indptr: np.ndarray
+    indices: np.ndarray
+    node_j: np.ndarray
+    node_q: np.ndarray
+    start_nodes: np.ndarray
+    edge_ptr: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    edge_j: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    edge_q: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    p: float = 1.0
+    q: float = 1.0
+    _edge_keys: np.ndarray | None = field(default=None, repr=False)
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes in the graph."""
+        return len(self.node_ids)
+
+    @property
+    def degrees(self) -> np.ndarray:
+        """Out-degree of every node."""
+        return np.diff(self.indptr)
+
+    @property
+    def has_edge_tables(self) -> bool:
+        """Whether second-order alias tables were compiled."""
+        return len(self.edge_ptr) == len(self.indices) + 1
+
+    @property
+    def is_biased(self) -> bool:
+        """Whether lazy second-order sampling has to apply ``p``/``q``."""
+        return self.p != 1.0 or self.q != 1.0
+
+    def has_edges(self, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+        """Check element-wise whether ``dst`` is a neighbor of ``src``.
+
+        Neighbors are sorted within each node, so ``src * N + dst`` keys form
+        one globally sorted array that can be binary searched in bulk.
+        """
+        if self._edge_keys is None:
+            sources = np.repeat(
+                np.arange(self.num_nodes, dtype=np.int64), self.degrees
+            )
+            self._edge_keys = sources * self.num_nodes + self.indices
+        if len(self._edge_keys) == 0:
+            return np.zeros(len(src), dtype=bool)
+        keys = np.asarray(src, dtype=np.int64) * self.num_nodes + dst
+        pos = np.minimum(
+            np.searchsorted(self._edge_keys, keys), len(self._edge_keys) - 1
+        )
+        return self._edge_keys[pos] == keys
+
+    def encode(self, node_ids: list[str]) -> np.ndarray:
+        """Translate string node IDs to integer indices."""
+        return np.asarray([self.index[n] for n in node_ids], dtype=np.int32)
+
+    def decode(self, walks: np.ndarray) -> list[list[str]]:
+        """Translate a 2-D walk array back to string node IDs.
+
+        Negative entries mark positions after a walk hit a dead end and are
+        dropped.
+        """
+        ids = self.node_ids
+        return [[ids[i] for i in row if i >= 0] for row in walks.tolist()]
+
+
+def _table_or_uniform(
+    table: dict[str, list[int]] | None, size: int
+) -> tuple[list[int], list[float]]:
+    """Return an alias table of ``size`` entries, uniform if none fits."""
+    if table is not None and len(table["q"]) == size:
+        return list(table["J"]), list(table["q"])
+    return [0] * size, [1.0] * size
+
+
+def compile_csr(
+    graph: dict[str, list[str]],
+    alias_nodes: dict[str, dict[str, list[int]]] | None = None,
+    alias_edges: dict[tuple[str, str], dict[str, list[int]]] | None = None,
+    p: float = 1.0,
+    q: float = 1.0,
+) -> CSRGraph:
+    """Compile an adjacency list and its alias tables into a CSR graph.
+
+    Alias tables are indexed by the sorted neighbor order used during
+    preprocessing. Nodes or edges without a matching table fall back to
+    uniform sampling. Edge tables are only compiled when ``alias_edges`` is
+    given; otherwise ``p`` and ``q`` are kept for lazy sampling at walk time.
+
+    Args:
+        graph: Mapping of node ID to neighbor IDs
+        alias_nodes: First-order alias tables keyed by node ID
+        alias_edges: Second-order alias tables keyed by ``(src, dst)``
+        p: Return parameter for lazy sampling
+        q: In-out parameter for lazy sampling
+
+    Returns:
+        Compiled CSR graph
+    """
+    alias_nodes = alias_nodes or {}
+    node_ids = sorted(set(graph).union(*graph.values()))
+    index = {node: i for i, node in enumerate(node_ids)}
+
+    neighbors = [sorted(graph.get(node, [])) for node in node_ids]
+    indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(nbrs) for nbrs in neighbors])
+    indices = np.fromiter(
+        (index[n] for nbrs in neighbors for n in nbrs),
+        dtype=np.int32,
+        count=int(indptr[-1]),
+    )
+
+    node_j: list[int] = []
+    node_q: list[float] = []
+    for node, nbrs in zip(node_ids, neighbors, strict=True):
+        table_j, table_q = _table_or_uniform(alias_nodes.get(node), len(nbrs))
+        node_j.extend(table_j)
+        node_q.extend(table_q)
+
+    csr = CSRGraph(
+        node_ids=node_ids,
+        index=index,
+        indptr=indptr,
+        indices=indices,
+        node_j=np.asarray(node_j, dtype=np.int32),
+        node_q=np.asarray(node_q, dtype=np.float64),
+        start_nodes=np.asarray([index[n] for n in graph], dtype=np.int32),
+        p=p,
+        q=q,
+    )
+
+    if alias_edges is not None:
+        degrees = np.diff(indptr)
+        edge_sizes = degrees[indices]
+        edge_ptr = np.zeros(len(indices) + 1, dtype=np.int64)
+        edge_ptr[1:] = np.cumsum(edge_sizes)
+        edge_j: list[int] = []
+        edge_q: list[float] = []
+        for src, nbrs in zip(node_ids, neighbors, strict=True):
+            for dst in nbrs:
+                table_j, table_q = _table_or_uniform(
+                    alias_edges.get((src, dst)), int(degrees[index[dst]])
+                )
+                edge_j.extend(table_j)
+                edge_q.extend(table_q)
+        csr.edge_ptr = edge_ptr
+        csr.edge_j = np.asarray(edge_j, dtype=np.int32)
+        csr.edge_q = np.asarray(edge_q, dtype=np.float64)
+
+    return csr
@@ -2,21 +2,28 @@
 
 import logging
 from collections import defaultdict
+from contextlib import nullcontext
 
 import numpy as np
 from neo4j import AsyncSession
 
 from .config import Node2VecConfig, PreprocessConfig, TransitionConfig
+from .corpus import ArrayWalkCorpus, GeneratedWalkCorpus, WalkCorpus
+from .csr import compile_csr
+from .parallel import train_skipgram_block, training_pool, walk_pool
 from .sampling import alias_draw, alias_setup
 from .state import Node2VecState
 from .training import (
     NegativeSamplingConfig,
     SamplingConfig,
+    SkipGramConfig,
+    build_unigram_table,
     process_negative_samples,
     process_positive_samples,
+    train_skipgram_epoch,
     update_embedding,
 )
-from .walks import WalkConfig, generate_walks, node2vec_walk
+from .walks import WalkConfig, generate_walk_array, generate_walks, node2vec_walk
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +100,12 @@ class Node2VecModel:
                 weight_key=_config.weight_key if _config else "weight",
                 directed=_config.directed if _config else False,
                 unweighted=_config.unweighted if _config else True,
+                lazy_edges=(
+                    _config.lazy_edges
+                    if _config
+                    else self._model.config.model.lazy_edges
+                ),
+                lazy_edge_threshold=self._model.config.model.lazy_edge_threshold,
             )
             self._model.preprocess_transition_probs(self.state.graph, transition_config)
             self.state.preprocessed = True
@@ -101,16 +114,9 @@ class Node2VecModel:
             return
 
         # Preprocess transition probabilities
-        transition_config = TransitionConfig(
-            p=self._model.config.model.p,
-            q=self._model.config.model.q,
-            weight_key="weight",
-            directed=False,
-            unweighted=True,
-        )
         # Access to protected member _state is required for integration; pylint: disable=protected-access
         self._model.preprocess_transition_probs(
-            self._model._state.graph, transition_config
+            self._model._state.graph
         )  # pylint: disable=protected-access
 
         self._model._state.preprocessed = True  # pylint: disable=protected-access
@@ -123,12 +129,13 @@ class Node2VecModel:
         # Initialize embeddings before training
         self._model.initialize_embeddings(set(self.state.graph.keys()))
 
-        # Generate walks if not already generated
-        if not self.state.walks:
-            self.state.walks = self._model.generate_walks(self.state.graph)
-
-        # Train embeddings
-        self._model.train_embeddings(self.state.walks)
+        # Train on walks generated during preprocessing, else stream them
+        if self.state.walks:
+            self._model.train_embeddings(self.state.walks)
+        else:
+            self._model.train_corpus(
+                self._model.walk_corpus(), self._model.csr_row_lookup()
+            )
 
 
 class Node2Vec:
@@ -141,7 +148,8 @@ class Node2Vec:
             config: Node2Vec configuration parameters
         """
         self.config = config or Node2VecConfig()
-        self._rng = np.random.default_rng(42)  # Fixed seed for reproducibility
+        # Fixed seed for reproducibility
+        self._rng = np.random.default_rng(self.config.training.seed)
         self._state = Node2VecState(
             embeddings={},
             node_ids={},
@@ -217,6 +225,8 @@ class Node2Vec:
                 weight_key="weight",
                 directed=False,
                 unweighted=True,
+                lazy_edges=self.config.model.lazy_edges,
+                lazy_edge_threshold=self.config.model.lazy_edge_threshold,
             )
 
         self._state.alias_nodes = {}
@@ -232,8 +242,27 @@ class Node2Vec:
 
         # Preprocess node and edge transition probabilities
         self._preprocess_node_transition_probs()
+        if config.lazy_edges or (
+            config.lazy_edge_threshold is not None
+            and self._edge_table_size() > config.lazy_edge_threshold
+        ):
+            # p/q are applied at walk time instead of per-edge alias tables
+            self._state.csr = compile_csr(
+                self._state.graph, self._state.alias_nodes, p=config.p, q=config.q
+            )
+            return
         self._preprocess_edge_transition_probs(config)
 
+        # Compile the integer-indexed walk graph
+        self._state.csr = compile_csr(
+            self._state.graph, self._state.alias_nodes, self._state.alias_edges
+        )
+
+    def _edge_table_size(self) -> int:
+        """Number of entries the per-edge alias tables would hold."""
+        graph = self._state.graph
+        return sum(len(graph.get(dst, ())) for nbrs in graph.values() for dst in nbrs)
+
     def _get_edge_weight(self) -> float:
         """Get edge weight for unweighted graphs.
 
@@ -242,65 +271,166 @@ class Node2Vec:
         """
         return 1.0
 
-    def train_embeddings(self, walks: list[list[str]]) -> None:
+    def train_embeddings(self, walks: list[list[str]] | np.ndarray) -> None:
         """Train embeddings using random walks.
 
         Args:
-            walks: List of random walks
+            walks: List of random walks or a 2-D walk array of CSR indices
         """
         self._train_embeddings(walks)
 
-    def _train_embeddings(self, walks: list[list[str]]) -> None:
-        """Train embeddings using random walks.
+    def _walks_to_rows(self, walks: list[list[str]] | np.ndarray) -> np.ndarray:
+        """Translate walks to a 2-D array of embedding matrix rows.
+
+        String walks are looked up by node ID, walk arrays by the CSR index of
+        the compiled graph. Unknown nodes and padding become ``-1``.
+        """
+        node_ids = self._state.node_ids
+        if isinstance(walks, np.ndarray):
+            # Padding (-1) maps to the trailing -1 entry
+            return self.csr_row_lookup()[walks]
+        walk_length = max((len(walk) for walk in walks), default=0)
+        rows = np.full((len(walks), walk_length), -1, dtype=np.int32)
+        for i, walk in enumerate(walks):
+            rows[i, : len(walk)] = [node_ids.get(node, -1) for node in walk]
+        return rows
+
+    def csr_row_lookup(self) -> np.ndarray:
+        """Map CSR indices to embedding matrix rows, with a trailing ``-1``."""
+        if self._state.csr is None:
+            raise RuntimeError("Walk arrays require a preprocessed graph")
+        node_ids = self._state.node_ids
+        return np.asarray(
+            [node_ids.get(node, -1) for node in self._state.csr.node_ids] + [-1],
+            dtype=np.int32,
+        )
+
+    def _train_embeddings(self, walks: list[list[str]] | np.ndarray) -> None:
+        """Train embeddings with batched skip-gram and negative sampling.
 
         Args:
-            walks: List of random walks
+            walks: List of random walks or a 2-D walk array of CSR indices
         """
-        nodes = set(self._state.graph.keys())
-        for _ in range(self.config.training.epochs):
-            for walk in walks:
-                for center_idx, node in enumerate(walk):
-                    context_nodes = self.get_context_nodes(walk, center_idx)
-                    self.process_positive_samples(node, context_nodes)
-                    # Only perform negative sampling if we have enough nodes
-                    available_nodes = nodes - {node} - set(context_nodes)
-                    if len(available_nodes) > 0:
-                        self.process_negative_samples(node, context_nodes, nodes)
+        rows = self._walks_to_rows(walks)
+        self.train_corpus(
+            ArrayWalkCorpus(
+                rows,
+                len(self._state.node_ids),
+                self.config.training.walk_block_size,
+            )
+        )
+
+    def walk_corpus(self) -> WalkCorpus:
+        """Return a streaming walk corpus over the compiled graph.
+
+        The corpus is spilled to ``walk_spill_path`` if one is configured.
+
+        Returns:
+            Walk corpus yielding blocks of CSR indices
+        """
+        csr = self._state.csr
+        if csr is None:
+            raise RuntimeError("Graph must be preprocessed before generating walks")
+        corpus = GeneratedWalkCorpus(
+            csr,
+            self.config.training.num_walks,
+            self.config.training.walk_length,
+            self._rng,
+            self.config.training.walk_block_size,
+        )
+        spill_path = self.config.training.walk_spill_path
+        if not spill_path:
+            return corpus
+        workers = self.config.training.workers
+        if workers > 1 and len(corpus) > 0:
+            with walk_pool(csr, workers) as pool:
+                return corpus.spill(spill_path, pool)
+        return corpus.spill(spill_path)
+
+    def train_corpus(
+        self, corpus: WalkCorpus, lookup: np.ndarray | None = None
+    ) -> None:
+        """Train embeddings on a corpus one block of walks at a time.
+
+        Args:
+            corpus: Walk corpus replayed once per epoch
+            lookup: Map from corpus node indices to matrix rows with a
+                trailing ``-1`` for padding, or None if they already match
+        """
+        w_in = self._state.embedding_matrix
+        w_out = self._state.context_matrix
+        if w_in is None or w_out is None or len(w_in) == 0:
+            return
+
+        counts = corpus.node_counts()
+        if lookup is not None:
+            rows = lookup[: len(counts)]
+            counts = np.bincount(
+                rows[rows >= 0], weights=counts[rows >= 0], minlength=len(w_in)
+            )
+        table = build_unigram_table(counts[: len(w_in)])
+        skipgram_config = SkipGramConfig(
+            window_size=self.config.training.window_size,
+            num_neg_samples=self.config.training.num_neg_samples,
+            learning_rate=self.config.training.learning_rate,
+            batch_size=self.config.training.batch_size,
+            rng=self._rng,
+        )
+        workers = self.config.training.workers
+        # One pool and one shared copy of the matrices for all epochs
+        with (
+            training_pool(w_in, w_out, table, workers, corpus.graph)
+            if workers > 1
+            else nullcontext()
+        ) as pool:
+            for epoch in range(self.config.training.epochs):
+                for block in corpus.blocks(pool):
+                    block_rows = block if lookup is None else lookup[block]
+                    if pool is not None:
+                        train_skipgram_block(pool, block_rows, skipgram_config)
+                    else:
+                        train_skipgram_epoch(
+                            w_in, w_out, block_rows, table, skipgram_config
+                        )
+                logger.debug("Finished Node2Vec epoch %d", epoch)
+
+        # Final normalization of all embeddings
+        norms = np.linalg.norm(w_in, axis=1, keepdims=True)
+        np.divide(w_in, norms, out=w_in, where=norms > 0)
 
     async def fit(self, session: AsyncSession) -> None:
         """Fit Node2Vec model.
 
+        Walks are streamed into training block by block instead of being
+        materialized up front.
+
         Args:
             session: Neo4j session
         """
-        # Get graph structure
-        self._state.graph = await self.get_graph(session)
+        self.fit_graph(await self.get_graph(session))
+
+    def fit_graph(self, graph: dict[str, list[str]]) -> None:
+        """Fit Node2Vec model to a graph that was already fetched.
+
+        Runs without the event loop, so callers can train in a worker thread.
+
+        Args:
+            graph: Dictionary mapping node IDs to their neighbors
+        """
+        self._state.graph = graph
 
         # Preprocess transition probabilities
         self.preprocess_transition_probs(self._state.graph)
 
-        # Initialize embeddings
-        self.initialize_embeddings(set(self._state.graph.keys()))
+        csr = self._state.csr
+        if csr is None:
+            raise RuntimeError("Graph must be preprocessed before generating walks")
 
-        # Generate random walks
-        walk_config = WalkConfig(
-            graph=self._state.graph,
-            alias_nodes=self.get_alias_nodes(),
-            alias_edges=self.get_alias_edges(),
-            walk_length=self.config.training.walk_length,
-            rng=self.get_rng(),
-        )
-        walks = generate_walks(walk_config, self.config.training.num_walks)
-
-        # Train embeddings
-        self._train_embeddings(walks)
+        # Initialize embeddings in compiled graph order so walks index rows
+        self._initialize_embedding_matrix(csr.node_ids)
 
-        # Final normalization of all embeddings
-        for node in self._state.embeddings:
-            emb = self._state.embeddings[node]
-            norm = np.linalg.norm(emb)
-            if norm > 0:
-                self._state.embeddings[node] = emb / norm
+        # Stream walks on the compiled graph into training
+        self.train_corpus(self.walk_corpus())
 
     def initialize_embeddings(self, nodes: set[str]) -> None:
         """Initialize embeddings for nodes.
@@ -308,11 +438,36 @@ class Node2Vec:
         Args:
             nodes: Set of nodes
         """
-        for node in nodes:
-            embedding = self._rng.normal(0, 1, self.config.model.dimension)
-            # Normalize to unit length
-            embedding = embedding / np.linalg.norm(embedding)
-            self._state.embeddings[node] = embedding
+        self._initialize_embedding_matrix(sorted(nodes))
+
+    def _initialize_embedding_matrix(self, node_ids: list[str]) -> None:
+        """Allocate input and context matrices for the given nodes.
+
+        Input rows start as random unit vectors and context rows as zeros.
+        The per-node embeddings are views into rows of the input matrix.
+
+        Args:
+            node_ids: Node IDs in matrix row order
+        """
+        dimension = self.config.model.dimension
+        matrix = self._rng.normal(0, 1, (len(node_ids), dimension)).astype(np.float32)
+        # Normalize to unit length
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        self._state.embedding_matrix = matrix
+        self._state.context_matrix = np.zeros_like(matrix)
+        self._state.node_ids = {node: i for i, node in enumerate(node_ids)}
+        self._state.embeddings = dict(zip(node_ids, matrix, strict=True))
+
+    def get_embedding_matrix(self) -> tuple[list[str], np.ndarray] | None:
+        """Return node IDs and the contiguous float32 embedding matrix.
+
+        Returns:
+            Node IDs in row order and the matrix, or None before initialization
+        """
+        if self._state.embedding_matrix is None:
+            return None
+        node_ids = sorted(self._state.node_ids, key=self._state.node_ids.__getitem__)
+        return node_ids, self._state.embedding_matrix
 
     def get_embedding(self, node_id: str) -> np.ndarray | None:
         """Get embedding for a node.
@@ -372,10 +527,7 @@ class Node2Vec:
             SamplingConfig(learning_rate=self.config.training.learning_rate),
         )
         # Normalize embeddings after update
-        for n in [node, *context_nodes]:
-            if n in self._state.embeddings:
-                emb = self._state.embeddings[n]
-                self._state.embeddings[n] = emb / np.linalg.norm(emb)
+        self._normalize_in_place([node, *context_nodes])
 
     def process_negative_samples(
         self, node: str, context_nodes: list[str], nodes: set[str]
@@ -399,10 +551,7 @@ class Node2Vec:
             ),
         )
         # Normalize embeddings after update
-        for n in [node, *context_nodes]:
-            if n in self._state.embeddings:
-                emb = self._state.embeddings[n]
-                self._state.embeddings[n] = emb / np.linalg.norm(emb)
+        self._normalize_in_place([node, *context_nodes])
 
     def update_embedding(self, node1: str, node2: str, label: float) -> None:
         """Update embeddings using gradient descent and normalize after update."""
@@ -414,34 +563,39 @@ class Node2Vec:
             self.config.training.learning_rate,
         )
         # Normalize both embeddings after update
-        for node in [node1, node2]:
-            if node in self._state.embeddings:
-                emb = self._state.embeddings[node]
+        self._normalize_in_place([node1, node2])
+
+    def _normalize_in_place(self, nodes: list[str]) -> None:
+        """Scale node embeddings to unit length without replacing the arrays.
+
+        Embeddings may be views into the embedding matrix, so they are
+        updated in place to keep both in sync.
+        """
+        for node in nodes:
+            emb = self._state.embeddings.get(node)
+            if emb is not None:
                 norm = np.linalg.norm(emb)
                 if norm > 0:
-                    self._state.embeddings[node] = emb / norm
+                    emb /= norm
 
     def node2vec_walk(
         self, start_node: str, graph: dict[str, list[str]] | None = None
     ) -> list[str]:
         """Generate a random walk starting from a node.
         Optionally accept a graph for test compatibility."""
-        if graph is not None:
-            # Use provided graph for test compatibility
-            walk_config = WalkConfig(
-                graph=graph,
-                alias_nodes=self._state.alias_nodes,
-                alias_edges=self._state.alias_edges,
-                walk_length=self.config.training.walk_length,
-                rng=self._rng,
-            )
-            return node2vec_walk(start_node, walk_config)
+        walk_p, walk_q = self._walk_bias()
+        if graph is None:
+            graph = self._state.graph
         walk_config = WalkConfig(
-            graph=self._state.graph,
+            graph=graph,
             alias_nodes=self._state.alias_nodes,
             alias_edges=self._state.alias_edges,
             walk_length=self.config.training.walk_length,
             rng=self._rng,
+            p=walk_p,
+            q=walk_q,
+            # Reuse the graph compiled during preprocessing
+            csr=self._state.csr if graph is self._state.graph else None,
         )
         return node2vec_walk(start_node, walk_config)
 
@@ -452,15 +606,33 @@ class Node2Vec:
         num_walks is optional for test compatibility."""
         if num_walks is None:
             num_walks = self.config.training.num_walks
+        if graph is self._state.graph and self._state.csr is not None:
+            # Reuse the graph compiled during preprocessing
+            walk_array = generate_walk_array(
+                self._state.csr,
+                num_walks,
+                self.config.training.walk_length,
+                self._rng,
+            )
+            return self._state.csr.decode(walk_array)
+        walk_p, walk_q = self._walk_bias()
         walk_config = WalkConfig(
             graph=graph,
             alias_nodes=self._state.alias_nodes,
             alias_edges=self._state.alias_edges,
             walk_length=self.config.training.walk_length,
             rng=self._rng,
+            p=walk_p,
+            q=walk_q,
         )
         return generate_walks(walk_config, num_walks)
 
+    def _walk_bias(self) -> tuple[float, float]:
+        """Return the p/q bias that walks must apply lazily."""
+        if self._state.csr is None or self._state.csr.has_edge_tables:
+            return 1.0, 1.0
+        return self._state.csr.p, self._state.csr.q
+
     def get_alias_nodes(self) -> dict[str, dict[str, list[int]]]:
         """Return alias nodes table."""
         return self._state.alias_nodes
@@ -0,0 +1,321 @@
+"""Multi-process walk generation and Hogwild-style training for Node2Vec."""
+
+import logging
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, replace
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .csr import CSRGraph
+from .training import SkipGramConfig, train_skipgram_epoch
+from .walks import simulate_walks
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class _WorkerState:
+    """Per-process state installed in each worker by the pool initializer."""
+
+    csr: CSRGraph | None = None
+    stack: ExitStack | None = None
+    w_in: np.ndarray | None = None
+    w_out: np.ndarray | None = None
+    table: np.ndarray | None = None
+
+
+_worker = _WorkerState()
+
+
+@dataclass(frozen=True)
+class SharedArraySpec:
+    """Picklable description of an array stored in shared memory."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@contextmanager
+def shared_array(array: np.ndarray) -> Iterator[tuple[SharedArraySpec, np.ndarray]]:
+    """Copy an array into a new shared memory block.
+
+    Yields the block's spec and a view onto it. The block is released and
+    unlinked on exit; callers must drop their references to the view first.
+
+    Args:
+        array: Array to share
+
+    Yields:
+        Shared memory spec and writable view
+    """
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        view: np.ndarray = np.ndarray(
+            array.shape, dtype=array.dtype, buffer=block.buf
+        )
+        view[...] = array
+        try:
+            yield SharedArraySpec(block.name, array.shape, array.dtype.str), view
+        finally:
+            del view
+    finally:
+        block.close()
+        block.unlink()
+
+
+@contextmanager
+def attach_shared_array(spec: SharedArraySpec) -> Iterator[np.ndarray]:
+    """Attach to a shared memory block created by :func:`shared_array`.
+
+    Callers must drop their references to the view before exit.
+
+    Args:
+        spec: Shared memory spec
+
+    Yields:
+        Writable view onto the shared block
+    """
+    block = shared_memory.SharedMemory(name=spec.name)
+    try:
+        view: np.ndarray = np.ndarray(
+            spec.shape, dtype=spec.dtype, buffer=block.buf
+        )
+        yield view
+        del view
+    finally:
+        block.close()
+
+
+def spawn_rngs(rng: np.random.Generator, count: int) -> list[np.random.SeedSequence]:
+    """Derive independent, reproducible seed streams from a generator.
+
+    Args:
+        rng: Parent random number generator
+        count: Number of streams
+
+    Returns:
+        Spawned seed sequences
+    """
+    entropy = int(rng.integers(np.iinfo(np.int64).max))
+    return np.random.SeedSequence(entropy).spawn(count)
+
+
+@dataclass(frozen=True)
+class WorkerPool:
+    """Process pool and the number of shards work is split into."""
+
+    executor: ProcessPoolExecutor
+    workers: int
+
+
+@dataclass(frozen=True)
+class TrainingSpecs:
+    """Shared memory specs of the matrices a training worker updates."""
+
+    w_in: SharedArraySpec
+    w_out: SharedArraySpec
+    table: SharedArraySpec
+
+
+def _init_worker(csr: CSRGraph | None, training: TrainingSpecs | None) -> None:
+    """Install the compiled graph and shared training arrays in a worker.
+
+    The shared arrays stay attached for the lifetime of the worker process.
+    """
+    _worker.csr = csr
+    if training is None:
+        return
+    stack = ExitStack()
+    _worker.stack = stack
+    _worker.w_in = stack.enter_context(attach_shared_array(training.w_in))
+    _worker.w_out = stack.enter_context(attach_shared_array(training.w_out))
+    _worker.table = stack.enter_context(attach_shared_array(training.table))
+
+
+def _walk_shard(
+    starts: np.ndarray, walk_length: int, seed: np.random.SeedSequence
+) -> np.ndarray:
+    """Simulate walks for one shard of start nodes in a worker process."""
+    csr = _worker.csr
+    if csr is None:
+        raise RuntimeError("Walk worker was not initialized")
+    rng = np.random.default_rng(seed)
+    return simulate_walks(csr, starts, walk_length, rng)
+
+
+def _train_shard(walks: np.ndarray, config: SkipGramConfig) -> None:
+    """Train on a shard of walks against the shared matrices."""
+    if _worker.w_in is None or _worker.w_out is None or _worker.table is None:
+        raise RuntimeError("Training worker was not initialized")
+    train_skipgram_epoch(_worker.w_in, _worker.w_out, walks, _worker.table, config)
+
+
+@contextmanager
+def walk_pool(csr: CSRGraph, workers: int) -> Iterator[WorkerPool]:
+    """Start worker processes that hold the compiled graph.
+
+    Args:
+        csr: Compiled graph
+        workers: Number of worker processes
+
+    Yields:
+        Worker pool for :func:`pool_simulate_walks`
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(csr, None)
+    ) as executor:
+        yield WorkerPool(executor, workers)
+
+
+def _shards(array: np.ndarray, workers: int) -> list[np.ndarray]:
+    """Split an array into at most ``workers`` non-empty consecutive shards."""
+    return [shard for shard in np.array_split(array, workers) if len(shard) > 0]
+
+
+def pool_simulate_walks(
+    pool: WorkerPool,
+    starts: np.ndarray,
+    walk_length: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Simulate walks with start nodes sharded across a worker pool.
+
+    Shards are fixed by position and each gets its own spawned seed, so the
+    result only depends on the parent generator and the number of workers.
+
+    Args:
+        pool: Pool from :func:`walk_pool` or :func:`training_pool` holding
+            the compiled graph
+        starts: Start node index of every walker
+        walk_length: Maximum number of nodes per walk
+        rng: Parent random number generator
+
+    Returns:
+        ``(len(starts), walk_length)`` int32 array
+    """
+    shards = _shards(starts, pool.workers)
+    if not shards:
+        return np.zeros((0, max(walk_length, 0)), dtype=np.int32)
+    seeds = spawn_rngs(rng, len(shards))
+    lengths = [walk_length] * len(shards)
+    return np.concatenate(
+        list(pool.executor.map(_walk_shard, shards, lengths, seeds))
+    )
+
+
+def parallel_simulate_walks(
+    csr: CSRGraph,
+    starts: np.ndarray,
+    walk_length: int,
+    rng: np.random.Generator,
+    workers: int,
+) -> np.ndarray:
+    """Simulate walks on a process pool created for this call.
+
+    Args:
+        csr: Compiled graph
+        starts: Start node index of every walker
+        walk_length: Maximum number of nodes per walk
+        rng: Parent random number generator
+        workers: Number of worker processes
+
+    Returns:
+        ``(len(starts), walk_length)`` int32 array
+    """
+    with walk_pool(csr, workers) as pool:
+        return pool_simulate_walks(pool, starts, walk_length, rng)
+
+
+def parallel_walk_array(
+    csr: CSRGraph,
+    num_walks: int,
+    walk_length: int,
+    rng: np.random.Generator,
+    workers: int,
+) -> np.ndarray:
+    """Generate ``num_walks`` rounds of walks across a process pool.
+
+    Args:
+        csr: Compiled graph
+        num_walks: Number of walks per node
+        walk_length: Maximum number of nodes per walk
+        rng: Parent random number generator
+        workers: Number of worker processes
+
+    Returns:
+        ``(num_walks * len(csr.start_nodes), walk_length)`` int32 array
+    """
+    rounds = [rng.permutation(csr.start_nodes) for _ in range(num_walks)]
+    starts = (
+        np.concatenate(rounds) if rounds else np.zeros(0, dtype=np.int32)
+    ).astype(np.int32)
+    return parallel_simulate_walks(csr, starts, walk_length, rng, workers)
+
+
+@contextmanager
+def training_pool(
+    w_in: np.ndarray,
+    w_out: np.ndarray,
+    table: np.ndarray,
+    workers: int,
+    csr: CSRGraph | None = None,
+) -> Iterator[WorkerPool]:
+    """Start worker processes that train on shared copies of the matrices.
+
+    The input and context matrices and the negative sampling table are
+    copied into shared memory once, and every worker attaches to them when
+    it starts. The trained matrices are copied back into ``w_in`` and
+    ``w_out`` after the pool has finished all its work. With ``csr`` the
+    workers can also simulate walks, so one pool serves a generated corpus
+    and the trainer.
+
+    Args:
+        w_in: Input (node) embedding matrix, updated on exit
+        w_out: Output (context) embedding matrix, updated on exit
+        table: Negative sampling table
+        workers: Number of worker processes
+        csr: Compiled graph for walk simulation, if any
+
+    Yields:
+        Worker pool for :func:`train_skipgram_block`
+    """
+    with ExitStack() as stack:
+        w_in_spec, shared_in = stack.enter_context(shared_array(w_in))
+        w_out_spec, shared_out = stack.enter_context(shared_array(w_out))
+        table_spec, shared_table = stack.enter_context(shared_array(table))
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(csr, TrainingSpecs(w_in_spec, w_out_spec, table_spec)),
+        )
+        try:
+            with executor:
+                yield WorkerPool(executor, workers)
+            np.copyto(w_in, shared_in)
+            np.copyto(w_out, shared_out)
+        finally:
+            # Views must be released before the shared blocks are closed
+            del shared_in, shared_out, shared_table
+
+
+def train_skipgram_block(
+    pool: WorkerPool, walks: np.ndarray, config: SkipGramConfig
+) -> None:
+    """Train one pass over a block of walks in Hogwild style.
+
+    The block is split across the workers of a :func:`training_pool`, which
+    apply their mini-batch updates to the shared matrices without locking.
+
+    Args:
+        pool: Pool from :func:`training_pool`
+        walks: ``(num_walks, walk_length)`` array of matrix rows
+        config: Skip-gram configuration; its generator seeds the workers
+    """
+    shards = _shards(walks, pool.workers)
+    seeds = spawn_rngs(config.rng, len(shards))
+    configs = [replace(config, rng=np.random.default_rng(seed)) for seed in seeds]
+    for _ in pool.executor.map(_train_shard, shards, configs):
+        pass
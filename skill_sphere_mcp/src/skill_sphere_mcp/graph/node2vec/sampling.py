@@ -56,3 +56,31 @@ def alias_draw(alias: dict[str, list[int]], idx: int, rng: np.random.Generator)
     if rng.random() < q[idx]:
         return idx
     return j[idx]
+
+
+def alias_draw_batch(
+    j: np.ndarray,
+    q: np.ndarray,
+    offsets: np.ndarray,
+    sizes: np.ndarray,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Draw one sample from each of many alias tables at once.
+
+    Table ``i`` occupies ``j[offsets[i]:offsets[i] + sizes[i]]`` (and the same
+    slots of ``q``). All sizes must be positive.
+
+    Args:
+        j: Flattened alias index tables
+        q: Flattened alias probability tables
+        offsets: Start offset of each table
+        sizes: Number of entries in each table
+        rng: Random number generator
+
+    Returns:
+        Sampled position within each table
+    """
+    draws = rng.random((2, len(sizes)))
+    slots = np.minimum((draws[0] * sizes).astype(np.int64), sizes - 1)
+    flat = offsets + slots
+    return np.where(draws[1] < q[flat], slots, j[flat])
@@ -3,6 +3,10 @@
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
+from .csr import CSRGraph
+
 
 @dataclass
 class Node2VecState:
@@ -10,10 +14,13 @@ class Node2VecState:
 
     embeddings: dict[str, Any] = field(default_factory=dict)
     node_ids: dict[str, int] = field(default_factory=dict)
+    embedding_matrix: np.ndarray | None = None
+    context_matrix: np.ndarray | None = None
     alias_nodes: dict[str, dict[str, list[int]]] = field(default_factory=dict)
     alias_edges: dict[tuple[str, str], dict[str, list[int]]] = field(
         default_factory=dict
     )
     walks: list[list[str]] = field(default_factory=list)
     graph: dict[str, list[str]] = field(default_factory=dict)
+    csr: CSRGraph | None = None
     preprocessed: bool = False
@@ -4,6 +4,12 @@ from dataclasses import dataclass
 
 import numpy as np
 
+# Number of entries in the negative sampling table
+UNIGRAM_TABLE_SIZE = 1_000_000
+
+# Scores are clipped to this magnitude before the sigmoid, as in word2vec
+MAX_SCORE = 6.0
+
 
 @dataclass
 class SamplingConfig:
@@ -109,3 +115,151 @@ def update_embedding(
     # Update embeddings
     embeddings[node1] += grad_vec1
     embeddings[node2] += grad_vec2
+
+
+@dataclass
+class SkipGramConfig:
+    """Configuration for batched skip-gram training."""
+
+    window_size: int
+    num_neg_samples: int
+    learning_rate: float
+    batch_size: int
+    rng: np.random.Generator
+
+
+def skipgram_pairs(walks: np.ndarray, window_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Extract all (center, context) index pairs from a 2-D walk array.
+
+    Entries below zero are padding and never form a pair.
+
+    Args:
+        walks: ``(num_walks, walk_length)`` array of node indices
+        window_size: Size of context window
+
+    Returns:
+        Center and context index arrays of equal length
+    """
+    centers: list[np.ndarray] = []
+    contexts: list[np.ndarray] = []
+    for offset in range(1, min(window_size, walks.shape[1] - 1) + 1):
+        left = walks[:, :-offset].ravel()
+        right = walks[:, offset:].ravel()
+        valid = (left >= 0) & (right >= 0)
+        left, right = left[valid], right[valid]
+        centers.extend((left, right))
+        contexts.extend((right, left))
+    if not centers:
+        empty = np.zeros(0, dtype=np.int32)
+        return empty, empty
+    return np.concatenate(centers), np.concatenate(contexts)
+
+
+def build_unigram_table(
+    counts: np.ndarray, power: float = 0.75, table_size: int = UNIGRAM_TABLE_SIZE
+) -> np.ndarray:
+    """Build a negative sampling table from node frequencies.
+
+    Each node occupies a share of the table proportional to its frequency
+    raised to ``power``, so uniform draws from the table follow the smoothed
+    unigram distribution.
+
+    Args:
+        counts: Occurrence count of every node
+        power: Smoothing exponent
+        table_size: Number of table entries
+
+    Returns:
+        Table of node indices (empty if all counts are zero)
+    """
+    weights = np.power(counts.astype(np.float64), power)
+    total = weights.sum()
+    if total <= 0:
+        return np.zeros(0, dtype=np.int32)
+    bounds = np.round(np.cumsum(weights) / total * table_size).astype(np.int64)
+    sizes = np.diff(bounds, prepend=0)
+    return np.repeat(np.arange(len(counts), dtype=np.int32), sizes)
+
+
+def train_skipgram_batch(
+    w_in: np.ndarray,
+    w_out: np.ndarray,
+    centers: np.ndarray,
+    targets: np.ndarray,
+    learning_rate: float,
+) -> None:
+    """Apply one mini-batch of skip-gram negative sampling updates in place.
+
+    Column 0 of ``targets`` holds the positive context node, the remaining
+    columns hold negative samples. Gradients hitting the same row within a
+    batch are averaged so that small graphs with many repeated nodes per
+    batch do not take oversized steps.
+
+    Args:
+        w_in: Input (node) embedding matrix
+        w_out: Output (context) embedding matrix
+        centers: ``(batch,)`` center node indices
+        targets: ``(batch, 1 + num_neg_samples)`` target node indices
+        learning_rate: Learning rate
+    """
+    center_vecs = w_in[centers]
+    target_vecs = w_out[targets]
+    scores = np.clip(
+        np.einsum("bd,bkd->bk", center_vecs, target_vecs), -MAX_SCORE, MAX_SCORE
+    )
+    labels = np.zeros_like(scores)
+    labels[:, 0] = 1.0
+    grads = (labels - 1.0 / (1.0 + np.exp(-scores))) * learning_rate
+
+    grad_in = np.einsum("bk,bkd->bd", grads, target_vecs)
+    grad_out = grads[:, :, None] * center_vecs[:, None, :]
+    _apply_mean_updates(
+        w_out, targets.ravel(), grad_out.reshape(-1, w_out.shape[1])
+    )
+    _apply_mean_updates(w_in, centers, grad_in)
+
+
+def _apply_mean_updates(
+    matrix: np.ndarray, rows: np.ndarray, grads: np.ndarray
+) -> None:
+    """Add the mean gradient of every distinct row to ``matrix`` in place."""
+    unique_rows, inverse, counts = np.unique(
+        rows, return_inverse=True, return_counts=True
+    )
+    sums = np.zeros((len(unique_rows), matrix.shape[1]), dtype=matrix.dtype)
+    np.add.at(sums, inverse, grads)
+    matrix[unique_rows] += sums / counts[:, None].astype(matrix.dtype)
+
+
+def train_skipgram_epoch(
+    w_in: np.ndarray,
+    w_out: np.ndarray,
+    walks: np.ndarray,
+    table: np.ndarray,
+    config: SkipGramConfig,
+) -> None:
+    """Train one epoch of skip-gram with negative sampling over a walk array.
+
+    Args:
+        w_in: Input (node) embedding matrix
+        w_out: Output (context) embedding matrix
+        walks: ``(num_walks, walk_length)`` array of node indices
+        table: Negative sampling table from :func:`build_unigram_table`
+        config: Skip-gram configuration
+    """
+    centers, contexts = skipgram_pairs(walks, config.window_size)
+    if len(centers) == 0:
+        return
+    order = config.rng.permutation(len(centers))
+    for start in range(0, len(order), config.batch_size):
+        batch = order[start : start + config.batch_size]
+        if len(table) > 0:
+            negatives = table[
+                config.rng.integers(0, len(table), (len(batch), config.num_neg_samples))
+            ]
+        else:
+            negatives = np.zeros((len(batch), 0), dtype=np.int32)
+        targets = np.concatenate([contexts[batch, None], negatives], axis=1)
+        train_skipgram_batch(
+            w_in, w_out, centers[batch], targets, config.learning_rate
+        )
@@ -4,18 +4,166 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from .sampling import alias_draw
+from .csr import CSRGraph, compile_csr
+from .sampling import alias_draw_batch
 
 
 @dataclass
 class WalkConfig:
-    """Configuration for random walks."""
+    """Configuration for random walks.
+
+    ``csr`` is the already compiled ``graph``; when it is None the graph is
+    compiled from the alias tables on every call.
+    """
 
     graph: dict[str, list[str]]
     alias_nodes: dict[str, dict[str, list[int]]]
     alias_edges: dict[tuple[str, str], dict[str, list[int]]]
     walk_length: int
     rng: np.random.Generator
+    p: float = 1.0
+    q: float = 1.0
+    csr: CSRGraph | None = None
+
+
+def _compiled(config: WalkConfig) -> CSRGraph:
+    """Return the compiled walk graph, compiling it if none was given."""
+    if config.csr is not None:
+        return config.csr
+    return compile_csr(
+        config.graph,
+        config.alias_nodes,
+        config.alias_edges or None,
+        p=config.p,
+        q=config.q,
+    )
+
+
+def _lazy_biased_slots(
+    csr: CSRGraph, prev: np.ndarray, cur: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """Sample second-order steps by rejection against the node alias tables.
+
+    A neighbor of ``cur`` is proposed from the first-order table and accepted
+    with probability proportional to its p/q bias: ``1/p`` for returning to
+    ``prev``, ``1`` for a common neighbor of ``prev`` and ``1/q`` otherwise.
+    The accepted samples follow the same distribution as the precomputed
+    edge alias tables.
+
+    Args:
+        csr: Compiled graph without edge tables
+        prev: Previous node of every walker
+        cur: Current node of every walker
+        rng: Random number generator
+
+    Returns:
+        Sampled neighbor slot of every walker
+    """
+    offsets = csr.indptr[cur]
+    sizes = csr.degrees[cur]
+    return_bias = 1.0 / csr.p
+    outward_bias = 1.0 / csr.q
+    upper = max(return_bias, 1.0, outward_bias)
+
+    slots = np.empty(len(cur), dtype=np.int64)
+    pending = np.arange(len(cur))
+    while len(pending) > 0:
+        proposals = alias_draw_batch(
+            csr.node_j, csr.node_q, offsets[pending], sizes[pending], rng
+        )
+        candidates = csr.indices[offsets[pending] + proposals]
+        prev_pending = prev[pending]
+        bias = np.where(
+            candidates == prev_pending,
+            return_bias,
+            np.where(csr.has_edges(prev_pending, candidates), 1.0, outward_bias),
+        )
+        accepted = rng.random(len(pending)) * upper < bias
+        slots[pending[accepted]] = proposals[accepted]
+        pending = pending[~accepted]
+    return slots
+
+
+def simulate_walks(
+    csr: CSRGraph, starts: np.ndarray, walk_length: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Advance one walker per start node in lockstep.
+
+    The first hop samples from the node alias tables, later hops from the
+    edge alias tables of the edge just traversed. Graphs compiled without
+    edge tables apply their p/q bias lazily by rejection sampling. Walkers
+    that reach a node without neighbors stop and the rest of their row is padded with ``-1``.
+
+    Args:
+        csr: Compiled graph
+        starts: Start node index of every walker
+        walk_length: Maximum number of nodes per walk
+        rng: Random number generator
+
+    Returns:
+        ``(len(starts), walk_length)`` int32 array of node indices
+    """
+    walks = np.full((len(starts), max(walk_length, 0)), -1, dtype=np.int32)
+    if len(starts) == 0 or walk_length <= 0:
+        return walks
+    walks[:, 0] = starts
+
+    degrees = csr.degrees
+    use_edges = csr.has_edge_tables
+    lazy_bias = not use_edges and csr.is_biased
+    active = np.arange(len(starts))
+    cur = np.asarray(starts, dtype=np.int64)
+    prev = np.full(len(starts), -1, dtype=np.int64)
+    last_edge = np.full(len(starts), -1, dtype=np.int64)
+
+    for step in range(1, walk_length):
+        keep = degrees[cur] > 0
+        active, cur, prev = active[keep], cur[keep], prev[keep]
+        last_edge = last_edge[keep]
+        if len(active) == 0:
+            break
+
+        sizes = degrees[cur]
+        if step > 1 and use_edges:
+            slots = alias_draw_batch(
+                csr.edge_j, csr.edge_q, csr.edge_ptr[last_edge], sizes, rng
+            )
+        elif step > 1 and lazy_bias:
+            slots = _lazy_biased_slots(csr, prev, cur, rng)
+        else:
+            slots = alias_draw_batch(
+                csr.node_j, csr.node_q, csr.indptr[cur], sizes, rng
+            )
+
+        last_edge = csr.indptr[cur] + slots
+        prev = cur
+        cur = csr.indices[last_edge].astype(np.int64)
+        walks[active, step] = cur
+
+    return walks
+
+
+def generate_walk_array(
+    csr: CSRGraph, num_walks: int, walk_length: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Generate ``num_walks`` rounds of walks from every start node.
+
+    Start nodes are shuffled independently for each round.
+
+    Args:
+        csr: Compiled graph
+        num_walks: Number of walks per node
+        walk_length: Maximum number of nodes per walk
+        rng: Random number generator
+
+    Returns:
+        ``(num_walks * len(csr.start_nodes), walk_length)`` int32 array
+    """
+    rounds = [rng.permutation(csr.start_nodes) for _ in range(num_walks)]
+    starts = (
+        np.concatenate(rounds) if rounds else np.zeros(0, dtype=np.int32)
+    ).astype(np.int32)
+    return simulate_walks(csr, starts, walk_length, rng)
 
 
 def node2vec_walk(start_node: str, config: WalkConfig) -> list[str]:
@@ -28,25 +176,11 @@ def node2vec_walk(start_node: str, config: WalkConfig) -> list[str]:
     Returns:
         List of nodes in the walk
     """
-    walk = [start_node]
-    while len(walk) < config.walk_length:
-        cur = walk[-1]
-        if len(config.graph[cur]) > 0:
-            if len(walk) == 1:
-                walk.append(
-                    config.graph[cur][
-                        alias_draw(config.alias_nodes[cur], 0, config.rng)
-                    ]
-                )
-            else:
-                prev = walk[-2]
-                next_node = config.graph[cur][
-                    alias_draw(config.alias_edges[(prev, cur)], 0, config.rng)
-                ]
-                walk.append(next_node)
-        else:
-            break
-    return walk
+    csr = _compiled(config)
+    walks = simulate_walks(
+        csr, csr.encode([start_node]), config.walk_length, config.rng
+    )
+    return csr.decode(walks)[0]
 
 
 def generate_walks(config: WalkConfig, num_walks: int) -> list[list[str]]:
@@ -59,10 +193,6 @@ def generate_walks(config: WalkConfig, num_walks: int) -> list[list[str]]:
     Returns:
         List of random walks
     """
-    walks = []
-    nodes = list(config.graph.keys())
-    for _ in range(num_walks):
-        config.rng.shuffle(nodes)
-        for node in nodes:
-            walks.append(node2vec_walk(node, config))
-    return walks
+    csr = _compiled(config)
+    walks = generate_walk_array(csr, num_walks, config.walk_length, config.rng)
+    return csr.decode(walks)
@@ -1,18 +1,41 @@
 """Skill matching service implementation."""
 
+import heapq
 import logging
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 from neo4j import AsyncSession
-from sklearn.metrics.pairwise import cosine_similarity  # type: ignore[import-untyped]
 
+from ..db.graph_version import graph_version
+from ..utils.cache import LRUCache
 from .embeddings import embeddings
 from .node2vec.model import Node2Vec
+from .snapshot import GraphFingerprint
 
 logger = logging.getLogger(__name__)
 
+SKILL_INDEX_QUERY = """
+MATCH (s:Skill)
+RETURN s.name as name, id(s) as node_id
+"""
+
+EVIDENCE_QUERY = """
+MATCH (s1:Skill {name: $req_skill})
+MATCH (s2:Skill {name: $candidate_skill})
+MATCH path = shortestPath((s1)-[*..3]-(s2))
+RETURN path
+"""
+
+EVIDENCE_BATCH_QUERY = """
+UNWIND $pairs AS pair
+MATCH (s1:Skill {name: pair.req_skill})
+MATCH (s2:Skill {name: pair.candidate_skill})
+MATCH path = shortestPath((s1)-[*..3]-(s2))
+RETURN pair.req_skill as req_skill, pair.candidate_skill as candidate_skill, path
+"""
+
 
 @dataclass
 class SkillMatch:
@@ -34,18 +57,75 @@ class MatchResult:
     supporting_nodes: list[dict[str, Any]]
 
 
+@dataclass
+class CandidateRanking:
+    """Represents a candidate's rank against role requirements."""
+
+    candidate_id: str
+    overall_score: float
+    matching_skills: list[SkillMatch]
+    skill_gaps: list[str]
+
+
 # pylint: disable=R0903  # Too few public methods (1/2) - this is a simple utility class
 class SkillMatchingService:
     """Service for matching skills against role requirements."""
 
-    def __init__(self, similarity_threshold: float = 0.7):
+    def __init__(
+        self, similarity_threshold: float = 0.7, evidence_cache_size: int = 1024
+    ):
         """Initialize the skill matching service.
 
         Args:
             similarity_threshold: Minimum similarity score to consider a match
+            evidence_cache_size: Number of (required, candidate) evidence paths
+                to cache, 0 to disable
         """
         self.similarity_threshold = similarity_threshold
+        self.evidence_cache: LRUCache[tuple[str, str], list[dict[str, Any]]] = (
+            LRUCache(evidence_cache_size)
+        )
         self._node2vec = Node2Vec()
+        self._skill_ids: dict[str, str] = {}
+        self._skill_ids_fingerprint: GraphFingerprint | None = None
+        self._skill_ids_version = 0
+        self._skill_ids_loaded = False
+
+    async def refresh_skill_index(self, session: AsyncSession) -> None:
+        """Load the skill name to node ID index with one bulk query.
+
+        Args:
+            session: Neo4j session
+        """
+        result = await session.run(SKILL_INDEX_QUERY)
+        skill_ids: dict[str, str] = {}
+        async for record in result:
+            if record["name"] is not None:
+                skill_ids.setdefault(record["name"], str(record["node_id"]))
+        self._skill_ids = skill_ids
+        # Paths between skills may have changed along with the graph
+        self.evidence_cache.clear()
+        self._skill_ids_fingerprint = embeddings.fingerprint
+        self._skill_ids_version = graph_version()
+        self._skill_ids_loaded = True
+        logger.debug("Loaded skill index with %d skills", len(skill_ids))
+
+    async def _ensure_skill_index(self, session: AsyncSession) -> None:
+        """Load the skill index on first use and whenever the graph changed.
+
+        Writes through this server bump the graph version; changes made
+        elsewhere show up as a new graph fingerprint.
+        """
+        if (
+            not self._skill_ids_loaded
+            or self._skill_ids_version != graph_version()
+            or self._skill_ids_fingerprint != embeddings.fingerprint
+        ):
+            await self.refresh_skill_index(session)
+
+    def invalidate_skill_index(self) -> None:
+        """Force the skill index to be reloaded on next use."""
+        self._skill_ids_loaded = False
 
     async def match_role(
         self,
@@ -72,8 +152,9 @@ class SkillMatchingService:
                 supporting_nodes=[],
             )
         # Load embeddings if not already loaded
-        if not embeddings.model:
+        if not embeddings.is_loaded:
             await embeddings.load_embeddings(session)
+        await self._ensure_skill_index(session)
 
         # Initialize result components
         matching_skills: list[SkillMatch] = []
@@ -84,17 +165,28 @@ class SkillMatchingService:
         skill_scores: list[float] = []
         experience_scores: list[float] = []
 
-        # Match each required skill
-        for req_skill in required_skills:
+        # Score all required skills against all candidates at once
+        best_matches = self._best_matches(required_skills, candidate_skills)
+        evidence = await self._gather_evidence_batch(
+            session,
+            [
+                (req_skill["name"], candidate_skills[best[0]]["name"])
+                for req_skill, best in zip(required_skills, best_matches, strict=True)
+                if best is not None
+            ],
+        )
+        for req_skill, best in zip(required_skills, best_matches, strict=True):
             req_name = req_skill["name"]
             req_years = req_skill.get("years", 0)
 
-            # Find best matching candidate skill
-            best_match = await self._find_best_match(
-                session, req_name, candidate_skills, req_years
-            )
-
-            if best_match:
+            if best is not None:
+                candidate = candidate_skills[best[0]]
+                best_match = SkillMatch(
+                    skill_name=candidate["name"],
+                    match_score=best[1],
+                    evidence=evidence.get((req_name, candidate["name"]), []),
+                    experience_years=candidate.get("years", 0),
+                )
                 matching_skills.append(best_match)
                 skill_scores.append(best_match.match_score)
                 experience_scores.append(
@@ -138,51 +230,209 @@ class SkillMatchingService:
         Returns:
             Best matching skill with evidence, or None if no match found
         """
-        best_score = 0.0
-        best_match: SkillMatch | None = None
-
-        # Get required skill embedding
-        req_embedding = await self._get_skill_embedding(session, req_skill)
-        if req_embedding is None:
+        await self._ensure_skill_index(session)
+        best = self._best_matches(
+            [{"name": req_skill, "years": req_years or 0}], candidate_skills
+        )[0]
+        if best is None:
             return None
+        candidate = candidate_skills[best[0]]
+        return SkillMatch(
+            skill_name=candidate["name"],
+            match_score=best[1],
+            evidence=await self._gather_evidence(session, req_skill, candidate["name"]),
+            experience_years=candidate.get("years", 0),
+        )
+
+    async def rank_candidates(
+        self,
+        session: AsyncSession,
+        required_skills: list[dict[str, Any]],
+        candidates: list[dict[str, Any]],
+        top_n: int = 10,
+    ) -> list[CandidateRanking]:
+        """Rank many candidates against the same role requirements.
+
+        The skills of all candidates are scored against the requirements in
+        one similarity matrix, and overall scores are computed for every
+        candidate at once with the weighting used by :meth:`match_role`. No
+        evidence is gathered; call :meth:`match_role` for a shortlisted
+        candidate to explain the match.
 
-        # Compare with each candidate skill
-        for candidate in candidate_skills:
-            candidate_embedding = await self._get_skill_embedding(
-                session, candidate["name"]
+        Args:
+            session: Neo4j session
+            required_skills: List of required skills with experience requirements
+            candidates: Candidates with an ``id`` and a list of ``skills``
+            top_n: Number of candidates to return
+
+        Returns:
+            The ``top_n`` best candidates, best first
+        """
+        if not required_skills or not candidates or top_n <= 0:
+            return []
+        if not embeddings.is_loaded:
+            await embeddings.load_embeddings(session)
+        await self._ensure_skill_index(session)
+
+        # Flatten all candidate skills so each candidate is a column segment
+        skills = [
+            skill for candidate in candidates for skill in candidate.get("skills", [])
+        ]
+        sizes = np.array([len(c.get("skills", [])) for c in candidates], dtype=np.intp)
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        non_empty = sizes > 0
+
+        num_required = len(required_skills)
+        best = np.full((num_required, len(candidates)), -np.inf)
+        first = np.zeros((num_required, len(candidates)), dtype=np.intp)
+        if skills:
+            scores = self._score_matrix(required_skills, skills)
+            best[:, non_empty] = np.maximum.reduceat(
+                scores, starts[non_empty], axis=1
+            )
+            # Index of the first skill reaching the best score, as match_role
+            owner = np.repeat(np.arange(len(candidates)), sizes)
+            positions = np.where(
+                scores == best[:, owner], np.arange(len(skills)), len(skills)
             )
-            if candidate_embedding is None:
-                continue
-
-            # Calculate semantic similarity
-            similarity = cosine_similarity(
-                req_embedding.reshape(1, -1), candidate_embedding.reshape(1, -1)
-            )[0][0]
-
-            if similarity >= self.similarity_threshold:
-                # Gather evidence for the match
-                evidence = await self._gather_evidence(
-                    session, req_skill, candidate["name"]
+            first[:, non_empty] = np.minimum.reduceat(
+                positions, starts[non_empty], axis=1
+            )
+
+        matched = best > 0
+        req_years = _skill_years(required_skills)[:, None]
+        best_years = np.append(_skill_years(skills), 0.0)[first]
+        experience = np.where(
+            req_years > 0,
+            np.minimum(best_years / np.where(req_years > 0, req_years, 1.0), 1.0),
+            1.0,
+        )
+        overall = 0.6 * np.where(matched, best, 0.0).mean(axis=0) + 0.4 * np.where(
+            matched, experience, 0.0
+        ).mean(axis=0)
+
+        top = heapq.nlargest(top_n, range(len(candidates)), key=overall.__getitem__)
+        rankings = []
+        for column in top:
+            candidate = candidates[column]
+            matching_skills = []
+            skill_gaps = []
+            for row, req_skill in enumerate(required_skills):
+                if not matched[row, column]:
+                    skill_gaps.append(req_skill["name"])
+                    continue
+                skill = skills[first[row, column]]
+                matching_skills.append(
+                    SkillMatch(
+                        skill_name=skill["name"],
+                        match_score=float(best[row, column]),
+                        evidence=[],
+                        experience_years=skill.get("years", 0),
+                    )
                 )
+            rankings.append(
+                CandidateRanking(
+                    candidate_id=str(candidate.get("id", column)),
+                    overall_score=float(overall[column]),
+                    matching_skills=matching_skills,
+                    skill_gaps=skill_gaps,
+                )
+            )
+        return rankings
 
-                # Adjust score based on experience if required
-                candidate_years = candidate.get("years", 0)
-                if req_years is not None and req_years > 0:
-                    experience_ratio = min(candidate_years / req_years, 1.0)
-                    similarity = similarity * 0.7 + experience_ratio * 0.3
+    def _best_matches(
+        self,
+        required_skills: list[dict[str, Any]],
+        candidate_skills: list[dict[str, Any]],
+    ) -> list[tuple[int, float] | None]:
+        """Select the best candidate skill for every required skill.
 
-                match = SkillMatch(
-                    skill_name=candidate["name"],
-                    match_score=similarity,
-                    evidence=evidence,
-                    experience_years=candidate_years,
-                )
+        Args:
+            required_skills: List of required skills with experience requirements
+            candidate_skills: List of candidate's skills with experience
+
+        Returns:
+            ``(candidate index, score)`` per required skill, or None where no
+            candidate clears the similarity threshold
+        """
+        if not candidate_skills:
+            return [None] * len(required_skills)
+        scores = self._score_matrix(required_skills, candidate_skills)
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(best)), best]
+        return [
+            (int(column), float(score)) if score > 0 else None
+            for column, score in zip(best, best_scores, strict=True)
+        ]
+
+    def _score_matrix(
+        self,
+        required_skills: list[dict[str, Any]],
+        candidate_skills: list[dict[str, Any]],
+    ) -> np.ndarray:
+        """Score every candidate skill against every required skill.
+
+        Required and candidate embeddings are stacked into two matrices and
+        compared with a single product. Thresholding and experience weighting
+        then operate on the similarity matrix.
+
+        Args:
+            required_skills: List of required skills with experience requirements
+            candidate_skills: List of candidate skills with experience
+
+        Returns:
+            ``(len(required_skills), len(candidate_skills))`` match scores,
+            ``-inf`` where the similarity is below the threshold or an
+            embedding is missing
+        """
+        scores = np.full((len(required_skills), len(candidate_skills)), -np.inf)
+        req_matrix, req_found = self._skill_matrix(required_skills)
+        cand_matrix, cand_found = self._skill_matrix(candidate_skills)
+        if not req_found.any() or not cand_found.any():
+            return scores
+
+        similarity = req_matrix @ cand_matrix.T
+        eligible = (
+            (similarity >= self.similarity_threshold)
+            & req_found[:, None]
+            & cand_found[None, :]
+        )
 
-                if similarity > best_score:
-                    best_score = similarity
-                    best_match = match
+        # Weight in experience for requirements that ask for years
+        req_years = _skill_years(required_skills)
+        cand_years = _skill_years(candidate_skills)
+        has_years = req_years > 0
+        experience_ratio = np.minimum(
+            cand_years[None, :] / np.where(has_years, req_years, 1.0)[:, None], 1.0
+        )
+        weighted = np.where(
+            has_years[:, None], similarity * 0.7 + experience_ratio * 0.3, similarity
+        )
+        return np.where(eligible, weighted, scores)
+
+    def _skill_matrix(
+        self, skills: list[dict[str, Any]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Stack row-normalized skill embeddings into a matrix.
 
-        return best_match
+        Args:
+            skills: Skills to look up by name
+
+        Returns:
+            ``(len(skills), dimension)`` matrix with zero rows for skills
+            without an embedding, and a mask of the skills that have one
+        """
+        vectors = [self._lookup_skill_embedding(skill["name"]) for skill in skills]
+        found = np.array([vector is not None for vector in vectors], dtype=bool)
+        if not found.any():
+            return np.zeros((len(skills), 0), dtype=np.float32), found
+        dimension = next(np.size(vector) for vector in vectors if vector is not None)
+        matrix = np.zeros((len(skills), dimension), dtype=np.float32)
+        for row, vector in enumerate(vectors):
+            if vector is not None:
+                matrix[row] = np.ravel(vector)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return np.divide(matrix, norms, out=matrix, where=norms > 0), found
 
     async def _get_skill_embedding(
         self, session: AsyncSession, skill_name: str
@@ -196,18 +446,14 @@ class SkillMatchingService:
         Returns:
             Skill embedding vector or None if not found
         """
-        # Query to find skill node
-        query = """
-        MATCH (s:Skill {name: $name})
-        RETURN id(s) as node_id
-        """
-        result = await session.run(query, name=skill_name)
-        record = await result.single()
+        await self._ensure_skill_index(session)
+        return self._lookup_skill_embedding(skill_name)
 
-        if not record:
+    def _lookup_skill_embedding(self, skill_name: str) -> np.ndarray | None:
+        """Get a skill embedding from the loaded skill index."""
+        node_id = self._skill_ids.get(skill_name)
+        if node_id is None:
             return None
-
-        node_id = str(record["node_id"])
         return embeddings.get_embedding(node_id)
 
     async def _gather_evidence(
@@ -223,41 +469,81 @@ class SkillMatchingService:
         Returns:
             List of evidence nodes and relationships
         """
-        query = """
-        MATCH (s1:Skill {name: $req_skill})
-        MATCH (s2:Skill {name: $candidate_skill})
-        MATCH path = shortestPath((s1)-[*..3]-(s2))
-        RETURN path
-        """
+        key = (req_skill, candidate_skill)
+        cached = self.evidence_cache.get(key)
+        if cached is not None:
+            return cached
+
         result = await session.run(
-            query, req_skill=req_skill, candidate_skill=candidate_skill
+            EVIDENCE_QUERY, req_skill=req_skill, candidate_skill=candidate_skill
         )
         record = await result.single()
+        evidence = _path_evidence(record["path"]) if record else []
+        self.evidence_cache.put(key, evidence)
+        return evidence
 
-        if not record:
-            return []
+    async def _gather_evidence_batch(
+        self, session: AsyncSession, pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """Gather evidence for several skill matches in one round-trip.
 
-        # Extract nodes and relationships from the path
-        evidence = []
-        for node in record["path"].nodes:
-            evidence.append(
-                {
-                    "type": "node",
-                    "labels": list(node.labels),
-                    "properties": dict(node),
-                }
-            )
-        for rel in record["path"].relationships:
-            evidence.append(
-                {
-                    "type": "relationship",
-                    "rel_type": rel.type,
-                    "properties": dict(rel),
-                }
-            )
+        Cached pairs are served from the evidence cache; the shortest paths
+        of all others are found with a single ``UNWIND $pairs`` query.
+
+        Args:
+            session: Neo4j session
+            pairs: ``(required skill, candidate skill)`` name pairs
+
+        Returns:
+            Mapping of every pair to its evidence nodes and relationships
+        """
+        evidence = self.evidence_cache.get_many(pairs)
+        missing = list(dict.fromkeys(pair for pair in pairs if pair not in evidence))
+        if not missing:
+            return evidence
 
+        result = await session.run(
+            EVIDENCE_BATCH_QUERY,
+            pairs=[
+                {"req_skill": req_skill, "candidate_skill": candidate_skill}
+                for req_skill, candidate_skill in missing
+            ],
+        )
+        async for record in result:
+            key = (record["req_skill"], record["candidate_skill"])
+            evidence[key] = _path_evidence(record["path"])
+        for key in missing:
+            # Pairs without a connecting path yield no record
+            self.evidence_cache.put(key, evidence.setdefault(key, []))
         return evidence
 
 
+def _path_evidence(path: Any) -> list[dict[str, Any]]:
+    """Convert a path into evidence nodes followed by relationships."""
+    evidence = []
+    for node in path.nodes:
+        evidence.append(
+            {
+                "type": "node",
+                "labels": list(node.labels),
+                "properties": dict(node),
+            }
+        )
+    for rel in path.relationships:
+        evidence.append(
+            {
+                "type": "relationship",
+                "rel_type": rel.type,
+                "properties": dict(rel),
+            }
+        )
+    return evidence
+
+
+def _skill_years(skills: list[dict[str, Any]]) -> np.ndarray:
+    """Return the years of experience of each skill, 0 where unspecified."""
+    return np.array([skill.get("years") or 0 for skill in skills], dtype=np.float64)
+
+
 # Global service instance
 skill_matching = SkillMatchingService()
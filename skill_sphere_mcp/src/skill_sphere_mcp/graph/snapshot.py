@@ -0,0 +1,128 @@
+"""Versioned on-disk snapshots of graph embeddings."""
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+MATRIX_FILE = "embeddings.npy"
+INDEX_FILE = "index.json"
+
+
+@dataclass(frozen=True)
+class GraphFingerprint:
+    """Cheap identity of a graph's structure."""
+
+    node_count: int
+    edge_count: int
+    digest: str
+
+
+@dataclass
+class EmbeddingSnapshot:
+    """Embedding matrix with the node IDs of its rows."""
+
+    node_ids: list[str]
+    matrix: np.ndarray
+    fingerprint: GraphFingerprint
+
+
+def compute_fingerprint(graph: dict[str, list[str]]) -> GraphFingerprint:
+    """Fingerprint an adjacency list independently of its ordering.
+
+    Args:
+        graph: Mapping of node ID to neighbor IDs
+
+    Returns:
+        Node and edge counts plus a SHA-256 digest of the sorted edges
+    """
+    digest = hashlib.sha256()
+    edge_count = 0
+    for node in sorted(graph):
+        neighbors = sorted(graph[node])
+        edge_count += len(neighbors)
+        digest.update(f"{node}:{','.join(neighbors)};".encode())
+    return GraphFingerprint(len(graph), edge_count, digest.hexdigest())
+
+
+def _replace_atomically(path: Path, write: Callable[[BinaryIO], object]) -> None:
+    """Write a file next to ``path`` and move it into place."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as handle:
+        write(handle)
+    os.replace(tmp_path, path)
+
+
+def save_snapshot(directory: str | Path, snapshot: EmbeddingSnapshot) -> None:
+    """Write a snapshot as a float32 ``.npy`` matrix plus a JSON index.
+
+    Both files are replaced atomically, so processes that still map the old
+    matrix keep reading it until they reload. The index is written last and
+    names the matrix shape, which lets readers reject a mismatched pair.
+
+    Args:
+        directory: Snapshot directory, created if missing
+        snapshot: Snapshot to write
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    matrix = np.ascontiguousarray(snapshot.matrix, dtype=np.float32)
+    index = {
+        "version": SNAPSHOT_VERSION,
+        "shape": list(matrix.shape),
+        "node_ids": snapshot.node_ids,
+        "fingerprint": asdict(snapshot.fingerprint),
+    }
+    _replace_atomically(directory / MATRIX_FILE, lambda handle: np.save(handle, matrix))
+    _replace_atomically(
+        directory / INDEX_FILE, lambda handle: handle.write(json.dumps(index).encode())
+    )
+    logger.info(
+        "Saved embedding snapshot of %d nodes to %s", len(snapshot.node_ids), directory
+    )
+
+
+def load_snapshot(
+    directory: str | Path, fingerprint: GraphFingerprint | None = None
+) -> EmbeddingSnapshot | None:
+    """Memory-map a snapshot written by :func:`save_snapshot`.
+
+    The matrix is opened read-only with ``mmap_mode="r"``, so processes
+    loading the same snapshot share one page-cached copy.
+
+    Args:
+        directory: Snapshot directory
+        fingerprint: Expected graph fingerprint, or None to accept any
+
+    Returns:
+        The snapshot, or None if it is missing, outdated or does not match
+    """
+    directory = Path(directory)
+    try:
+        index = json.loads((directory / INDEX_FILE).read_text(encoding="utf-8"))
+        matrix = np.load(directory / MATRIX_FILE, mmap_mode="r")
+    except (OSError, ValueError) as exc:
+        logger.debug("No usable embedding snapshot in %s: %s", directory, exc)
+        return None
+
+    if index.get("version") != SNAPSHOT_VERSION:
+        logger.info("Ignoring embedding snapshot with version %s", index.get("version"))
+        return None
+    stored = GraphFingerprint(**index["fingerprint"])
+    if fingerprint is not None and stored != fingerprint:
+        logger.info("Embedding snapshot is stale for the current graph")
+        return None
+    node_ids = [str(node) for node in index["node_ids"]]
+    if list(matrix.shape) != index["shape"] or len(node_ids) != len(matrix):
+        logger.warning("Embedding snapshot matrix does not match its index")
+        return None
+    return EmbeddingSnapshot(node_ids=node_ids, matrix=matrix, fingerprint=stored)
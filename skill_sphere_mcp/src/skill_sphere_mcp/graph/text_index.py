@@ -0,0 +1,232 @@
+"""In-process BM25 search over node names and descriptions.
+
+The graph is small enough to keep a token to posting-list inverted index in
+memory, so ``graph.search`` can be answered without a Bolt round-trip. The
+index is built from one bulk export query and refreshed by re-running it:
+only nodes whose text changed are re-tokenized.
+"""
+
+import heapq
+import logging
+import math
+import re
+from collections import Counter
+from typing import Any
+
+from neo4j import AsyncSession
+
+from ..db.schema import SEARCH_LABELS
+
+logger = logging.getLogger(__name__)
+
+EXPORT_QUERY = """
+MATCH (n)
+WHERE any(label IN labels(n) WHERE label IN $labels)
+RETURN elementId(n) AS node_id, labels(n) AS labels, properties(n) AS props
+"""
+
+TEXT_PROPERTIES = ("name", "description")
+
+# Keeps tokens such as "c++", "c#" and "node.js" whole
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Tokens in order of appearance
+    """
+    return _TOKEN.findall(text.lower())
+
+
+def _node_text(props: dict[str, Any]) -> str:
+    return " ".join(str(props.get(key) or "") for key in TEXT_PROPERTIES)
+
+
+class InvertedIndex:
+    """Token to posting-list index ranked with Okapi BM25."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._nodes: dict[str, dict[str, Any]] = {}
+        self._labels: dict[str, list[str]] = {}
+        self._texts: dict[str, str] = {}
+        self._lengths: dict[str, int] = {}
+        self._total_length = 0
+        self._loaded = False
+
+    def __len__(self) -> int:
+        """Number of indexed nodes."""
+        return len(self._nodes)
+
+    @property
+    def ready(self) -> bool:
+        """Whether the index has been loaded from the graph."""
+        return self._loaded
+
+    def add(
+        self, node_id: str, props: dict[str, Any], labels: list[str] | None = None
+    ) -> None:
+        """Index a node, replacing any previous version.
+
+        Args:
+            node_id: Node element ID
+            props: Node properties
+            labels: Node labels
+        """
+        text = _node_text(props)
+        self._nodes[node_id] = props
+        self._labels[node_id] = sorted(labels or [])
+        if self._texts.get(node_id) == text:
+            return
+        self._remove_postings(node_id)
+        tokens = tokenize(text)
+        for token, count in Counter(tokens).items():
+            self._postings.setdefault(token, {})[node_id] = count
+        self._texts[node_id] = text
+        self._lengths[node_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, node_id: str) -> None:
+        """Drop a node from the index.
+
+        Args:
+            node_id: Node element ID
+        """
+        self._remove_postings(node_id)
+        self._nodes.pop(node_id, None)
+        self._labels.pop(node_id, None)
+
+    def _remove_postings(self, node_id: str) -> None:
+        text = self._texts.pop(node_id, None)
+        if text is None:
+            return
+        for token in set(tokenize(text)):
+            postings = self._postings[token]
+            del postings[node_id]
+            if not postings:
+                del self._postings[token]
+        self._total_length -= self._lengths.pop(node_id)
+
+    def sync(
+        self,
+        nodes: dict[str, dict[str, Any]],
+        labels: dict[str, list[str]] | None = None,
+    ) -> int:
+        """Make the index hold exactly ``nodes``.
+
+        Args:
+            nodes: Node properties by element ID
+            labels: Node labels by element ID
+
+        Returns:
+            Number of nodes added, changed or removed
+        """
+        changed = 0
+        for node_id in set(self._nodes) - set(nodes):
+            self.remove(node_id)
+            changed += 1
+        for node_id, props in nodes.items():
+            if self._texts.get(node_id) != _node_text(props):
+                changed += 1
+            self.add(node_id, props, (labels or {}).get(node_id))
+        self._loaded = True
+        return changed
+
+    async def load(self, session: AsyncSession) -> int:
+        """Refresh the index from the graph.
+
+        Args:
+            session: Neo4j database session
+
+        Returns:
+            Number of nodes added, changed or removed
+        """
+        result = await session.run(EXPORT_QUERY, labels=list(SEARCH_LABELS))
+        nodes: dict[str, dict[str, Any]] = {}
+        labels: dict[str, list[str]] = {}
+        async for record in result:
+            nodes[record["node_id"]] = record["props"]
+            labels[record["node_id"]] = record["labels"]
+        changed = self.sync(nodes, labels)
+        logger.info("Text index holds %d nodes (%d changed)", len(nodes), changed)
+        return changed
+
+    @property
+    def texts(self) -> dict[str, str]:
+        """Indexed text by node element ID; do not modify."""
+        return self._texts
+
+    def node(self, node_id: str) -> dict[str, Any]:
+        """Return an indexed node as a search hit.
+
+        Args:
+            node_id: Node element ID
+
+        Returns:
+            Node element ID, labels and properties, shaped like
+            :func:`~skill_sphere_mcp.graph.fulltext.search_hit`
+        """
+        return {
+            "node_id": node_id,
+            "labels": self._labels.get(node_id, []),
+            "properties": self._nodes[node_id],
+        }
+
+    def search(self, query: str, limit: int) -> list[tuple[dict[str, Any], float]]:
+        """Rank nodes against a query with BM25.
+
+        Args:
+            query: Free-text search string
+            limit: Maximum number of results
+
+        Returns:
+            (search hit, score) pairs, best first
+        """
+        return [
+            (self.node(node_id), score) for node_id, score in self.rank(query, limit)
+        ]
+
+    def rank(self, query: str, limit: int) -> list[tuple[str, float]]:
+        """Rank node IDs against a query with BM25.
+
+        Args:
+            query: Free-text search string
+            limit: Maximum number of results
+
+        Returns:
+            (node ID, score) pairs, best first
+        """
+        if not self._nodes:
+            return []
+        doc_count = len(self._nodes)
+        avg_length = self._total_length / doc_count or 1.0
+        scores: dict[str, float] = {}
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for node_id, tf in postings.items():
+                length_ratio = self._lengths[node_id] / avg_length
+                norm = self.k1 * (1 - self.b + self.b * length_ratio)
+                weight = idf * tf * (self.k1 + 1) / (tf + norm)
+                scores[node_id] = scores.get(node_id, 0.0) + weight
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+
+# Global index instance, loaded at startup when enabled
+text_index = InvertedIndex()
@@ -1,23 +1,313 @@
-"""Embedding model management."""
+"""Embedding model management.
 
+The sentence-transformer model, and the torch stack behind it, is only
+imported and loaded on first use so that importing the server stays cheap.
+The app lifespan can warm it up in the background. Request-path encoding
+goes through a micro-batcher so concurrent queries share one ``encode``,
+behind a cache of query embeddings keyed by normalized text.
+"""
+
+import asyncio
 import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from sentence_transformers import SentenceTransformer
+import numpy as np
+from prometheus_client import Counter, Gauge, Histogram
 
-logger = logging.getLogger(__name__)
+from ..utils.cache import TTLCache
 
-# Initialize the model at module level
 try:
-    MODEL: SentenceTransformer | None = SentenceTransformer("all-MiniLM-L6-v2")
+    import yaml
 except ImportError:
-    MODEL = None
-    logger.warning("sentence-transformers not installed, will use random embeddings")
+    yaml = None
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Seconds before a model that failed to load is tried again
+MODEL_RETRY_SECONDS = 60.0
+
+ENCODE_QUEUE_DEPTH = Gauge(
+    "embedding_encode_queue_depth", "Texts waiting for a batched encode"
+)
+ENCODE_BATCH_SIZE = Histogram(
+    "embedding_encode_batch_size",
+    "Texts per batched encode",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+QUERY_CACHE_LOOKUPS = Counter(
+    "embedding_query_cache_lookups",
+    "Query embedding cache lookups",
+    ["result"],
+)
+
+
+class EmbeddingModelProvider:
+    """Lazily loads one shared SentenceTransformer model, thread-safely."""
+
+    def __init__(
+        self, model_name: str = MODEL_NAME, retry_seconds: float = MODEL_RETRY_SECONDS
+    ):
+        """Initialize the provider without loading anything.
+
+        Args:
+            model_name: SentenceTransformer model name or path
+            retry_seconds: Seconds before a failed load is tried again
+        """
+        self.model_name = model_name
+        self.retry_seconds = retry_seconds
+        self._model: SentenceTransformer | None = None
+        self._loaded = False
+        self._loading = False
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Whether a model is loaded and usable."""
+        return self._model is not None
 
+    @property
+    def status(self) -> str:
+        """Readiness for health checks: idle, loading, ready or unavailable."""
+        if self._model is not None:
+            return "ready"
+        if self._loading:
+            return "loading"
+        return "unavailable" if self._loaded or self._retry_at else "idle"
 
-def get_embedding_model() -> SentenceTransformer | None:
-    """Get the embedding model instance.
+    def _should_load(self) -> bool:
+        """Whether no load has succeeded yet and one may be attempted now."""
+        return not self._loaded and time.monotonic() >= self._retry_at
+
+    def get(self) -> "SentenceTransformer | None":
+        """Return the model, loading it on first call.
+
+        Concurrent first calls block until the single load finishes. A model
+        that failed to load, e.g. because its download failed, is tried again
+        on the first call ``retry_seconds`` later; a missing
+        sentence-transformers package is not.
+
+        Returns:
+            SentenceTransformer model or None if not available
+        """
+        if not self._should_load():
+            return self._model
+        with self._lock:
+            if self._should_load():
+                self._loading = True
+                try:
+                    self._model = self._load()
+                    self._loaded = True
+                # pylint: disable-next=W0718
+                except Exception as exc:
+                    # A missing download must not take the server down
+                    logger.error(
+                        "Could not load embedding model %s, retrying in %.0fs: %s",
+                        self.model_name,
+                        self.retry_seconds,
+                        exc,
+                    )
+                    self._retry_at = time.monotonic() + self.retry_seconds
+                finally:
+                    self._loading = False
+        return self._model
+
+    def _load(self) -> "SentenceTransformer | None":
+        """Load the model, or return None without sentence-transformers.
+
+        Raises:
+            Exception: If the model itself cannot be loaded
+        """
+        try:
+            # Deferred so importing the server does not pull in torch
+            # pylint: disable-next=import-outside-toplevel
+            from sentence_transformers import SentenceTransformer  # noqa: PLC0415
+        except ImportError:
+            logger.warning(
+                "sentence-transformers not installed, will use random embeddings"
+            )
+            return None
+        model = SentenceTransformer(self.model_name)
+        logger.info("Loaded embedding model %s", self.model_name)
+        return model
+
+    async def warm_up(self) -> None:
+        """Load the model in a worker thread without blocking the event loop."""
+        await asyncio.to_thread(self.get)
+
+
+# Global provider instance
+embedding_model = EmbeddingModelProvider()
+
+
+def get_embedding_model() -> "SentenceTransformer | None":
+    """Get the embedding model instance, loading it on first use.
 
     Returns:
         SentenceTransformer model or None if not available
     """
-    return MODEL
+    return embedding_model.get()
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent encode requests into batched model calls.
+
+    A batch is sent once ``max_batch_size`` texts are waiting or
+    ``max_wait_ms`` after the first one arrived, whichever comes first. The
+    model runs in a worker thread and each caller gets its own row back.
+    """
+
+    def __init__(
+        self,
+        model_getter: Callable[[], Any] = get_embedding_model,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        cache_size: int = 1024,
+        cache_ttl: float | None = None,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            model_getter: Returns the model to encode with, or None
+            max_batch_size: Most texts per ``encode`` call
+            max_wait_ms: Longest time a text waits for others to join
+            cache_size: Query embeddings kept, 0 to disable caching
+            cache_ttl: Seconds a cached embedding stays valid, None for ever
+        """
+        self.model_getter = model_getter
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.cache: TTLCache[str, np.ndarray] = TTLCache(cache_size, cache_ttl)
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def encode(self, text: str) -> np.ndarray:
+        """Encode one text as a normalized embedding.
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            Normalized embedding vector
+
+        Raises:
+            RuntimeError: If no embedding model is available
+        """
+        key = normalize_text(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            QUERY_CACHE_LOOKUPS.labels("hit").inc()
+            return cached
+        QUERY_CACHE_LOOKUPS.labels("miss").inc()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((key, future))
+        ENCODE_QUEUE_DEPTH.set(len(self._pending))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        vector = await future
+        self.cache.put(key, vector)
+        return vector
+
+    async def warm_cache(self, texts: Iterable[str]) -> int:
+        """Pre-compute cached embeddings for expected queries.
+
+        Args:
+            texts: Query texts
+
+        Returns:
+            Number of texts encoded
+        """
+        keys = list(dict.fromkeys(normalize_text(text) for text in texts))
+        keys = [key for key in keys if key and key not in self.cache]
+        if not keys:
+            return 0
+        model = await asyncio.to_thread(self.model_getter)
+        if model is None:
+            return 0
+        vectors = await asyncio.to_thread(model.encode, keys, normalize_embeddings=True)
+        for key, vector in zip(keys, np.asarray(vectors), strict=True):
+            self.cache.put(key, vector)
+        logger.info("Warmed query embedding cache with %d texts", len(keys))
+        return len(keys)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size :]
+            task = asyncio.get_running_loop().create_task(self._encode_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        ENCODE_QUEUE_DEPTH.set(0)
+
+    async def _encode_batch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        ENCODE_BATCH_SIZE.observe(len(batch))
+        try:
+            model = await asyncio.to_thread(self.model_getter)
+            if model is None:
+                raise RuntimeError("No embedding model available")
+            vectors = await asyncio.to_thread(
+                model.encode, [text for text, _ in batch], normalize_embeddings=True
+            )
+        # pylint: disable-next=W0718
+        except Exception as exc:
+            # Every waiting caller sees the failure instead of hanging
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), vector in zip(batch, np.asarray(vectors), strict=True):
+            if not future.done():
+                future.set_result(vector)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize query text so trivially different spellings share a key.
+
+    Args:
+        text: Query text
+
+    Returns:
+        Case-folded text with whitespace collapsed
+    """
+    return " ".join(text.casefold().split())
+
+
+def load_known_skills(path: str | Path) -> list[str]:
+    """Read ``prompt_steering.known_skills`` from a hypergraph schema file.
+
+    Args:
+        path: Path to ``graph_schema.yaml``
+
+    Returns:
+        Known skill names, empty if the file or PyYAML is unavailable
+    """
+    if yaml is None:
+        logger.warning("PyYAML not installed, skipping embedding warm start")
+        return []
+    try:
+        schema = yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError) as exc:
+        logger.warning("Cannot read warm start skills from %s: %s", path, exc)
+        return []
+    steering = schema.get("prompt_steering") or {}
+    return [str(skill) for skill in steering.get("known_skills") or []]
+
+
+# Global batcher around the shared model
+embedding_batcher = EmbeddingBatcher()
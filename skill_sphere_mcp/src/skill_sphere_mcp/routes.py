@@ -6,7 +6,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from neo4j import AsyncSession
 
 from .api.routes import router as api_router
-from .db.deps import get_db_session
+from .db.deps import get_read_session
+from .models.embedding import embedding_model
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +26,11 @@ async def root() -> dict[str, str]:
 @router.get("/health")
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
-    return {"status": "ok"}
+    return {"status": "ok", "embedding_model": embedding_model.status}
 
 
 @router.get("/db-test")
-async def test_db_connection(session: AsyncSession = Depends(get_db_session)) -> dict[str, str]:
+async def test_db_connection(session: AsyncSession = Depends(get_read_session)) -> dict[str, str]:
     """Test database connection."""
     try:
         result = await session.run("RETURN 1 as test")
@@ -5,16 +5,22 @@ from typing import Any
 
 from fastapi import HTTPException
 from neo4j import AsyncSession
+from prometheus_client import Counter
 from pydantic import BaseModel
 
+from skill_sphere_mcp.config.settings import get_settings
 from skill_sphere_mcp.tools.handlers import (
     ExplainMatchOutputModel,
     GraphSearchOutputModel,
     MatchRoleOutputModel,
+    RankCandidatesOutputModel,
     explain_match,
     graph_search,
     match_role,
+    rank_candidates,
 )
+from skill_sphere_mcp.utils.response_cache import response_cache
+from skill_sphere_mcp.utils.single_flight import SingleFlight
 
 # HTTP Status Constants
 HTTP_UNPROCESSABLE_ENTITY = 422
@@ -41,6 +47,22 @@ TOOL_MATCH_ROLE = "skill.match_role"
 TOOL_EXPLAIN_MATCH = "skill.explain_match"
 TOOL_GENERATE_CV = "cv.generate"
 TOOL_GRAPH_SEARCH = "graph.search"
+TOOL_RANK_CANDIDATES = "skill.rank_candidates"
+
+# Read-only tools whose responses depend only on parameters and graph state
+CACHEABLE_TOOLS = frozenset({TOOL_GRAPH_SEARCH, TOOL_EXPLAIN_MATCH, TOOL_MATCH_ROLE})
+
+# Read-only tools whose identical concurrent calls share one execution
+COALESCED_TOOLS = CACHEABLE_TOOLS | {TOOL_RANK_CANDIDATES}
+
+TOOL_CALLS_COALESCED = Counter(
+    "tool_calls_coalesced",
+    "Tool calls that joined an identical call already in flight",
+    ["tool"],
+)
+
+# In-flight tool calls by response cache key
+_in_flight = SingleFlight()
 
 
 def _validate_match_role_params(parameters: dict[str, Any]) -> None:
@@ -59,6 +81,20 @@ def _validate_explain_match_params(parameters: dict[str, Any]) -> None:
         raise HTTPException(status_code=422, detail="Role requirement is required")
 
 
+def _validate_rank_candidates_params(parameters: dict[str, Any]) -> None:
+    """Validate rank_candidates parameters."""
+    if not parameters.get("required_skills"):
+        raise HTTPException(status_code=422, detail="Required skills are missing")
+    candidates = parameters.get("candidates")
+    if not candidates or not isinstance(candidates, list):
+        raise HTTPException(status_code=422, detail="Candidates are required")
+    if not all(isinstance(candidate, dict) for candidate in candidates):
+        raise HTTPException(status_code=422, detail="Candidates must be objects")
+    top_n = parameters.get("top_n", 10)
+    if not isinstance(top_n, int) or top_n <= 0:
+        raise HTTPException(status_code=422, detail="top_n must be a positive integer")
+
+
 def _validate_generate_cv_params(parameters: dict[str, Any]) -> None:
     """Validate generate_cv parameters."""
     if not parameters.get("profile_id"):
@@ -85,31 +121,12 @@ def _validate_graph_search_params(parameters: dict[str, Any]) -> None:
         raise HTTPException(status_code=422, detail="top_k must be a positive integer")
 
 
-async def dispatch_tool(
-    tool_name: str,
-    parameters: dict[str, Any],
-    session: AsyncSession,
-    structured_output: bool = False,
-) -> dict[str, Any]:
-    """Dispatch tool execution to appropriate handler.
-
-    Args:
-        tool_name: Name of tool to dispatch
-        parameters: Tool parameters
-        session: Database session
-        structured_output: Whether to wrap results in structured_result key
-
-    Returns:
-        Tool execution result
+def _tool_config(tool_name: str) -> tuple[Any, type[BaseModel] | None, Any]:
+    """Return the handler, output model and validator of a tool.
 
     Raises:
-        HTTPException: If tool name is invalid or parameters are invalid
+        HTTPException: If the tool is unknown
     """
-    if not tool_name or not tool_name.strip():
-        raise HTTPException(
-            status_code=HTTP_UNPROCESSABLE_ENTITY, detail="Tool name is required"
-        )
-
     # Map tool names to handlers, output models, and validators
     tool_config: dict[str, tuple[Any, type[BaseModel] | None, Any]] = {
         TOOL_MATCH_ROLE: (
@@ -128,6 +145,11 @@ async def dispatch_tool(
             GraphSearchOutputModel,
             _validate_graph_search_params,
         ),
+        TOOL_RANK_CANDIDATES: (
+            rank_candidates,
+            RankCandidatesOutputModel,
+            _validate_rank_candidates_params,
+        ),
     }
 
     # Get configuration for the tool
@@ -136,10 +158,11 @@ async def dispatch_tool(
         raise HTTPException(
             status_code=HTTP_UNPROCESSABLE_ENTITY, detail=f"Unknown tool: {tool_name}"
         )
+    return config
 
-    handler, output_model, validator = config
 
-    # Validate parameters using the appropriate validator
+def _validate(tool_name: str, validator: Any, parameters: dict[str, Any]) -> None:
+    """Validate parameters using the tool's validator."""
     try:
         validator(parameters)
     except HTTPException:
@@ -150,21 +173,91 @@ async def dispatch_tool(
         logger.error("Exception args: %s", e.args)
         raise HTTPException(status_code=500, detail="Some error") from e
 
+
+async def _run_handler(
+    tool_name: str,
+    handler: Any,
+    parameters: dict[str, Any],
+    session: AsyncSession,
+    flight_key: str | None,
+) -> Any:
+    """Run a handler, sharing identical concurrent calls of read-only tools.
+
+    A shared call runs on the session of the caller that started it. If that
+    caller is cancelled, a waiting caller runs it again on its own session.
+    """
+    if flight_key is None:
+        return await handler(parameters, session)
+    result, shared = await _in_flight.do(
+        flight_key, lambda: handler(parameters, session)
+    )
+    if shared:
+        TOOL_CALLS_COALESCED.labels(tool=tool_name).inc()
+    return result
+
+
+def _handler_error(e: HTTPException) -> HTTPException:
+    """Map an HTTP error raised by a handler to the error returned to clients."""
+    if e.status_code == HTTP_BAD_REQUEST and (
+        "Invalid years_experience" in str(e.detail)
+        or "Invalid parameters" in str(e.detail)
+    ):
+        return HTTPException(status_code=HTTP_UNPROCESSABLE_ENTITY, detail=str(e.detail))
+    return HTTPException(status_code=e.status_code, detail=str(e.detail))
+
+
+async def dispatch_tool(
+    tool_name: str,
+    parameters: dict[str, Any],
+    session: AsyncSession,
+    structured_output: bool = False,
+) -> dict[str, Any]:
+    """Dispatch tool execution to appropriate handler.
+
+    Args:
+        tool_name: Name of tool to dispatch
+        parameters: Tool parameters
+        session: Database session
+        structured_output: Whether to wrap results in structured_result key
+
+    Returns:
+        Tool execution result
+
+    Raises:
+        HTTPException: If tool name is invalid or parameters are invalid
+    """
+    if not tool_name or not tool_name.strip():
+        raise HTTPException(
+            status_code=HTTP_UNPROCESSABLE_ENTITY, detail="Tool name is required"
+        )
+
+    handler, output_model, validator = _tool_config(tool_name)
+    _validate(tool_name, validator, parameters)
+
+    cache_key = None
+    if tool_name in CACHEABLE_TOOLS and get_settings().enable_caching:
+        cache_key = response_cache.key(tool_name, parameters, structured_output)
+        cached = response_cache.get(tool_name, cache_key)
+        if cached is not None:
+            return cached
+
+    flight_key = None
+    if tool_name in COALESCED_TOOLS:
+        flight_key = cache_key or response_cache.key(
+            tool_name, parameters, structured_output
+        )
+
     # Execute handler and handle result
     try:
-        result = await handler(parameters, session)
-        return _format_result(result, output_model, structured_output)
+        result = await _run_handler(tool_name, handler, parameters, session, flight_key)
+        formatted = _format_result(result, output_model, structured_output)
+        if cache_key is not None:
+            response_cache.put(cache_key, formatted)
+        return formatted
     except HTTPException as e:
         if e.status_code == HTTP_UNPROCESSABLE_ENTITY:
             raise
-        if e.status_code == HTTP_BAD_REQUEST and (
-            "Invalid years_experience" in str(e.detail)
-            or "Invalid parameters" in str(e.detail)
-        ):
-            raise HTTPException(
-                status_code=HTTP_UNPROCESSABLE_ENTITY, detail=str(e.detail)
-            ) from e
-        raise HTTPException(status_code=e.status_code, detail=str(e.detail)) from e
+        raise _handler_error(e) from e
     except Exception as e:
         logger.error("Tool dispatch error for %s: %s", tool_name, str(e))
         raise HTTPException(status_code=500, detail="Some error") from e
@@ -6,6 +6,10 @@ from fastapi import HTTPException
 from neo4j import AsyncSession
 from pydantic import BaseModel, Field
 
+from ..graph.fulltext import search_hit, search_nodes
+from ..graph.hybrid_search import search_in_memory
+from ..graph.skill_matching import skill_matching
+
 
 class ExplainMatchOutputModel(BaseModel):
     """Output model for explain match operations."""
@@ -93,16 +97,16 @@ async def graph_search(
     if top_k <= 0:
         raise HTTPException(status_code=400, detail="top_k must be greater than 0")
 
-    # Query the database to find nodes matching the query
-    cypher_query = """
-    MATCH (n)
-    WHERE n.name CONTAINS $search_query OR n.description CONTAINS $search_query
-    RETURN n
-    LIMIT $top_k
-    """
-    result = await session.run(cypher_query, search_query=query, top_k=top_k)
-    records = [record async for record in result]
-    results = [{"node": record["n"]} for record in records]
+    ranked = await search_in_memory(query, top_k)
+    if ranked is not None:
+        hits = [hit for hit, _ in ranked]
+    else:
+        records = await search_nodes(session, query, top_k)
+        hits = [search_hit(record["n"]) for record in records]
+    results = [
+        {"node": hit["properties"], "node_id": hit["node_id"], "labels": hit["labels"]}
+        for hit in hits
+    ]
 
     # Add .links array with deep-links to nodes
     for r in results:
@@ -123,6 +127,47 @@ async def graph_search(
     )
 
 
+SKILL_SET_MATCH_QUERY = """
+UNWIND $required_skills AS skill_name
+MATCH (s:Skill {name: skill_name})<-[:HAS_SKILL]-(p:Person)
+WITH p, collect(DISTINCT s.name) AS matched
+WHERE size(matched) = $skill_count
+RETURN matched
+LIMIT 1
+"""
+
+
+async def match_skill_set(
+    session: AsyncSession, required_skills: list[str]
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Split required skills into those held by a fully matching profile and gaps.
+
+    The query starts from the required ``Skill`` nodes, looked up through the
+    ``Skill.name`` constraint, and counts the distinct skills of each person
+    in one aggregation. Every person holding all required skills matches
+    the same set, so the query stops at the first one.
+
+    Args:
+        session: Neo4j database session
+        required_skills: Required skill names
+
+    Returns:
+        Matching skills and skill gaps, in the order of ``required_skills``
+    """
+    result = await session.run(
+        SKILL_SET_MATCH_QUERY,
+        required_skills=required_skills,
+        skill_count=len(set(required_skills)),
+    )
+    matched: set[str] = set()
+    async for record in result:
+        matched.update(record["matched"])
+
+    matching_skills = [{"name": skill} for skill in required_skills if skill in matched]
+    skill_gaps = [skill for skill in required_skills if skill not in matched]
+    return matching_skills, skill_gaps
+
+
 class MatchRoleOutputModel(BaseModel):
     """Output model for match role operations."""
 
@@ -154,26 +199,7 @@ async def match_role(
                 detail=f"Invalid years_experience for skill '{skill}': {years} (must be int)",
             )
 
-    # Query the database to find matching profiles
-    query = """
-    MATCH (p:Person)
-    WHERE ALL(skill IN $required_skills WHERE (p)-[:HAS_SKILL]->(:Skill {name: skill}))
-    RETURN p
-    """
-    result = await session.run(query, required_skills=required_skills)
-    records = [record async for record in result]
-
-    matching_skills = []
-    skill_gaps = []
-    for skill in required_skills:
-        found = False
-        for record in records:
-            if skill in record["p"].get("skills", []):
-                matching_skills.append({"name": skill})
-                found = True
-                break
-        if not found:
-            skill_gaps.append(skill)
+    matching_skills, skill_gaps = await match_skill_set(session, required_skills)
 
     match_score = (
         len(matching_skills) / len(required_skills) if required_skills else 0.0
@@ -186,6 +212,81 @@ async def match_role(
     )
 
 
+class RankCandidatesOutputModel(BaseModel):
+    """Output model for rank candidates operations."""
+
+    rankings: list[dict[str, Any]] = Field(
+        ..., description="Best candidates with match score and skill gaps"
+    )
+    top_n: int = Field(..., description="Maximum number of candidates returned")
+
+
+def _skill_entries(
+    skills: list[Any], years_experience: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """Normalize skill names or ``{"name", "years"}`` dicts to dicts."""
+    years_experience = years_experience or {}
+    return [
+        (
+            skill
+            if isinstance(skill, dict)
+            else {"name": skill, "years": years_experience.get(skill, 0)}
+        )
+        for skill in skills
+    ]
+
+
+async def rank_candidates(
+    parameters: dict[str, Any], session: AsyncSession
+) -> RankCandidatesOutputModel:
+    """Rank candidate profiles against role requirements.
+
+    Args:
+        parameters: Tool parameters with ``required_skills``, optional
+            ``years_experience``, ``candidates`` (each with an ``id`` and
+            ``skills``) and ``top_n``
+        session: Neo4j database session
+
+    Returns:
+        The best ``top_n`` candidates, best first
+    """
+    required_skills = parameters.get("required_skills")
+    candidates = parameters.get("candidates")
+    top_n = parameters.get("top_n", 10)
+    if not required_skills or not candidates:
+        raise HTTPException(
+            status_code=400,
+            detail="Missing required parameters: required_skills and candidates",
+        )
+    if not isinstance(top_n, int) or top_n <= 0:
+        raise HTTPException(status_code=400, detail="top_n must be greater than 0")
+
+    rankings = await skill_matching.rank_candidates(
+        session,
+        _skill_entries(required_skills, parameters.get("years_experience")),
+        [
+            {**candidate, "skills": _skill_entries(candidate.get("skills", []))}
+            for candidate in candidates
+        ],
+        top_n,
+    )
+    return RankCandidatesOutputModel(
+        rankings=[
+            {
+                "candidate_id": ranking.candidate_id,
+                "match_score": ranking.overall_score,
+                "skill_gaps": ranking.skill_gaps,
+                "matching_skills": [
+                    {"name": match.skill_name, "score": match.match_score}
+                    for match in ranking.matching_skills
+                ],
+            }
+            for ranking in rankings
+        ],
+        top_n=top_n,
+    )
+
+
 # pylint: disable-next=R0903 # Too few public methods
 class SomeHandler:
     """Handler for some tool logic."""
@@ -0,0 +1,175 @@
+"""In-process caching utilities."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded mapping that evicts the least recently used entry.
+
+    A ``maxsize`` of 0 disables the cache: nothing is stored.
+    """
+
+    def __init__(self, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether ``key`` is cached, without touching its recency."""
+        return key in self._data
+
+    def get(self, key: K) -> V | None:
+        """Return a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing
+        """
+        if key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Return the cached subset of ``keys``.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of the keys that were cached to their values
+        """
+        found = {}
+        for key in keys:
+            if key in self._data:
+                self._data.move_to_end(key)
+                found[key] = self._data[key]
+        return found
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value, evicting the oldest entries beyond ``maxsize``.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+
+class TTLCache(LRUCache[K, V]):
+    """LRU cache whose entries also expire ``ttl`` seconds after being stored.
+
+    A ``ttl`` of None keeps entries until they are evicted. Lookups through
+    :meth:`get` and :meth:`get_many` are counted in ``hits`` and ``misses``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Seconds an entry stays valid, or None for no expiry
+            clock: Monotonic time source
+        """
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._expires: dict[K, float] = {}
+
+    def _expired(self, key: K) -> bool:
+        expires = self._expires.get(key)
+        if expires is None or self.clock() < expires:
+            return False
+        del self._data[key]
+        del self._expires[key]
+        return True
+
+    def __contains__(self, key: object) -> bool:
+        """Whether ``key`` is cached and fresh, without touching its recency."""
+        return key in self._data and not self._expired(key)  # type: ignore[arg-type]
+
+    def get(self, key: K) -> V | None:
+        """Return a fresh cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        if key not in self:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return super().get(key)
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Return the fresh cached subset of ``keys``.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of the keys that were cached to their values
+        """
+        keys = list(keys)
+        found = super().get_many([key for key in keys if key in self])
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value with a fresh expiry, evicting beyond ``maxsize``.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self.maxsize <= 0:
+            return
+        if self.ttl is None:
+            self._expires.pop(key, None)
+        else:
+            self._expires[key] = self.clock() + self.ttl
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            evicted, _ = self._data.popitem(last=False)
+            self._expires.pop(evicted, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        super().clear()
+        self._expires.clear()
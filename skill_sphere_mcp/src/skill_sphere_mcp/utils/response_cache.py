@@ -0,0 +1,313 @@
+"""Cache of idempotent tool responses.
+
+Entries are keyed by tool name, canonicalized parameters and the current
+graph version. Writes bump the version, so entries cached before a write
+are never served again and age out through the size bound.
+
+Two backends are provided: an in-process LRU, and a directory of JSON files
+that all worker processes on a host can share. Pointing the directory at
+``/dev/shm`` keeps it in shared memory. A directory that cannot be created,
+or a graph version that cannot be written to it, makes the cache fall back
+to the in-process backend.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from prometheus_client import Counter
+
+from .cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "tool_response_cache_lookups",
+    "Tool response cache lookups",
+    ["tool", "result"],
+)
+
+VERSION_FILE = "graph_version"
+
+
+class ResponseCacheBackend(ABC):
+    """Storage for cached responses and the graph version."""
+
+    maxsize: int
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Return the value stored under ``key``, or None."""
+
+    @abstractmethod
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting old entries if full."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    @abstractmethod
+    def graph_version(self) -> str:
+        """Return the current graph version."""
+
+    @abstractmethod
+    def bump_graph_version(self) -> None:
+        """Move to a new graph version, orphaning existing entries."""
+
+
+class MemoryBackend(ResponseCacheBackend):
+    """Per-process LRU backend."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the backend.
+
+        Args:
+            maxsize: Maximum number of entries
+        """
+        self.maxsize = maxsize
+        self.entries: LRUCache[str, Any] = LRUCache(maxsize)
+        self._version = 0
+
+    def get(self, key: str) -> Any | None:
+        """Return a copy of the value stored under ``key``, or None."""
+        # Copies keep callers from mutating the shared cached response
+        return copy.deepcopy(self.entries.get(key))
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a copy of ``value`` under ``key``."""
+        self.entries.put(key, copy.deepcopy(value))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.entries.clear()
+
+    def graph_version(self) -> str:
+        """Return the current graph version."""
+        return str(self._version)
+
+    def bump_graph_version(self) -> None:
+        """Increment the graph version."""
+        self._version += 1
+
+
+class FileBackend(ResponseCacheBackend):
+    """Backend storing one JSON file per entry in a shared directory.
+
+    Files are written atomically. Reads refresh a file's modification time
+    and the least recently used files are removed beyond ``maxsize``.
+    Values that are not JSON-serializable, or that cannot be written, are
+    not cached.
+    """
+
+    def __init__(self, directory: str | Path | None = None, maxsize: int = 1024):
+        """Initialize the backend.
+
+        Args:
+            directory: Cache directory, created if missing; defaults to a
+                directory under the system temp dir
+            maxsize: Maximum number of entries
+
+        Raises:
+            OSError: If the directory cannot be created
+        """
+        self.directory = Path(
+            directory or Path(tempfile.gettempdir()) / "skill_sphere_mcp_cache"
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.maxsize = maxsize
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _write(self, path: Path, text: str) -> None:
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        try:
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def get(self, key: str) -> Any | None:
+        """Return the value stored under ``key``, or None."""
+        path = self._path(key)
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` if it is JSON-serializable."""
+        if self.maxsize <= 0:
+            return
+        try:
+            text = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug("Response for %s is not JSON-serializable", key)
+            return
+        try:
+            self._write(self._path(key), text)
+            self._evict()
+        except OSError as exc:
+            logger.warning("Could not cache response in %s: %s", self.directory, exc)
+
+    def _entries(self) -> list[os.DirEntry]:
+        return [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(".json") and not entry.name.startswith(".")
+        ]
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        if len(entries) <= self.maxsize:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[: len(entries) - self.maxsize]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                # Another worker evicted it first
+                pass
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        try:
+            entries = self._entries()
+        except OSError as exc:
+            logger.warning("Could not clear response cache %s: %s", self.directory, exc)
+            return
+        for entry in entries:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning(
+                    "Could not remove cached response %s: %s", entry.path, exc
+                )
+
+    def graph_version(self) -> str:
+        """Return the graph version shared by all processes using the directory."""
+        try:
+            return (self.directory / VERSION_FILE).read_text(encoding="utf-8")
+        except OSError:
+            return "0"
+
+    def bump_graph_version(self) -> None:
+        """Write a new random graph version; concurrent bumps cannot collide.
+
+        Raises:
+            OSError: If the version cannot be written
+        """
+        self._write(self.directory / VERSION_FILE, uuid.uuid4().hex)
+
+
+def create_backend(
+    kind: str, directory: str | Path | None = None, maxsize: int = 1024
+) -> ResponseCacheBackend:
+    """Create a response cache backend.
+
+    Args:
+        kind: ``memory`` or ``file``
+        directory: Directory of the file backend
+        maxsize: Maximum number of entries
+
+    Returns:
+        The requested backend, or a memory backend if the file backend's
+        directory cannot be created
+    """
+    if kind == "file":
+        try:
+            return FileBackend(directory, maxsize)
+        except OSError as exc:
+            logger.warning(
+                "Could not use response cache directory, caching in memory: %s", exc
+            )
+    return MemoryBackend(maxsize)
+
+
+class ResponseCache:
+    """Tool response cache over a pluggable backend."""
+
+    def __init__(self, backend: ResponseCacheBackend):
+        """Initialize the cache.
+
+        Args:
+            backend: Entry and graph version storage
+        """
+        self.backend = backend
+
+    def key(self, tool_name: str, parameters: dict[str, Any], *extra: Any) -> str:
+        """Build the cache key for a call at the current graph version.
+
+        Args:
+            tool_name: Tool name
+            parameters: Tool parameters
+            *extra: Further values that change the response
+
+        Returns:
+            Hex digest identifying the call
+        """
+        canonical = json.dumps(
+            [tool_name, parameters, list(extra), self.backend.graph_version()],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, tool_name: str, key: str) -> Any | None:
+        """Return a cached response, counting the lookup.
+
+        Args:
+            tool_name: Tool name, used as the metric label
+            key: Key from :meth:`key`
+
+        Returns:
+            Cached response or None
+        """
+        value = self.backend.get(key)
+        RESPONSE_CACHE_LOOKUPS.labels(
+            tool=tool_name, result="miss" if value is None else "hit"
+        ).inc()
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a response.
+
+        Args:
+            key: Key from :meth:`key`
+            value: Response to cache
+        """
+        self.backend.put(key, value)
+
+    def invalidate(self) -> None:
+        """Bump the graph version so no earlier response is served again.
+
+        A backend that cannot bump its version is cleared as far as possible
+        and replaced by an empty memory backend, so no response from before
+        the change can be served by this process.
+        """
+        try:
+            self.backend.bump_graph_version()
+        except OSError as exc:
+            logger.warning(
+                "Could not bump graph version, caching responses in memory: %s", exc
+            )
+            self.backend.clear()
+            self.backend = MemoryBackend(self.backend.maxsize)
+
+
+# Global response cache, configured at startup
+response_cache = ResponseCache(MemoryBackend())
@@ -0,0 +1,56 @@
+"""Coalescing of identical concurrent calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome.
+
+    Callers that arrive while a call for their key is in flight wait for it
+    instead of starting their own, and receive its result or exception. The
+    call runs in the first caller's context, e.g. on its request-scoped
+    session, so it is cancelled with that caller. Waiters are shielded from
+    that: when the call is cancelled they start it again with their own
+    ``func``, and a cancelled waiter does not cancel the call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        """Number of calls in flight."""
+        return len(self._calls)
+
+    async def do(
+        self, key: Hashable, func: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """Run ``func`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identity of the call
+            func: Starts the call; only invoked if no call is in flight
+
+        Returns:
+            The call's result and whether it was shared with another caller
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None or future.done():
+                future = asyncio.ensure_future(func())
+                self._calls[key] = future
+                future.add_done_callback(lambda done: self._pop(key, done))
+                return await future, False
+            try:
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # This waiter was cancelled, not the call
+                    raise
+
+    def _pop(self, key: Hashable, future: asyncio.Future) -> None:
+        """Forget a finished call unless a newer one took its key."""
+        if self._calls.get(key) is future:
+            del self._calls[key]
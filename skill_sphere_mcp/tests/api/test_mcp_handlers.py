@@ -1,7 +1,7 @@
 """Tests for MCP handlers."""
 
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException, status
@@ -13,7 +13,9 @@ from skill_sphere_mcp.api.mcp.handlers import (
     handle_list_resources,
     handle_search,
     handle_tool_dispatch,
+    query,
 )
+from skill_sphere_mcp.models.mcp import QueryRequest
 
 
 class AsyncIterator:
@@ -183,3 +185,22 @@ async def test_handle_get_resource_invalid():
         await get_resource(resource_type="invalid")
     assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
     assert "Invalid resource type" in str(exc_info.value.detail)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("contains_updates", [False, True])
+async def test_query_bumps_graph_version_only_after_updates(
+    mock_session, contains_updates: bool
+):
+    """Test that only queries that changed the graph invalidate caches."""
+    result = AsyncIterator([{"n": 1}])
+    result.consume = MagicMock(
+        return_value=MagicMock(counters=MagicMock(contains_updates=contains_updates))
+    )
+    mock_session.run.return_value = result
+
+    with patch("skill_sphere_mcp.api.mcp.handlers.bump_graph_version") as mock_bump:
+        response = await query(QueryRequest(query="RETURN 1 AS n"), mock_session)
+
+    assert response["results"] == [{"n": 1}]
+    assert mock_bump.called == contains_updates
@@ -18,7 +18,7 @@ from skill_sphere_mcp.api.mcp.handlers import (
     match_role,
 )
 from skill_sphere_mcp.api.mcp.models import ToolRequest
-from skill_sphere_mcp.api.mcp.routes import get_db_session, list_resources_endpoint
+from skill_sphere_mcp.api.mcp.routes import get_read_session, list_resources_endpoint
 from skill_sphere_mcp.api.mcp.rpc import rpc_match_role_handler
 from skill_sphere_mcp.api.mcp.utils import get_resource
 from skill_sphere_mcp.app import create_app
@@ -133,7 +133,7 @@ async def test_dispatch_tool_success(mock_session: AsyncMock) -> None:
     }
     request = ToolRequest(tool_name="skill.match_role", parameters=parameters)
     # Patch the DB result to return skills compatible with match_role
-    mock_record = {"p": {"name": "John Doe", "skills": ["Python", "FastAPI"]}}
+    mock_record = {"matched": ["Python", "FastAPI"]}
     mock_session.run.return_value = AsyncIterator([mock_record])
     response = await dispatch_tool(request.tool_name, request.parameters, mock_session)
     assert isinstance(response, dict)
@@ -352,18 +352,7 @@ async def test_match_role_success() -> None:
     params = {"required_skills": ["Python"], "years_experience": {"Python": 1}}
     mock_session = AsyncMock()
     # Simulate DB returning a person with matching skills
-    mock_result = AsyncIterator(
-        [
-            {
-                "p": {
-                    "id": "1",
-                    "name": "Test Person",
-                    "skills": ["Python"],
-                    "years_experience": {"Python": 1},
-                }
-            }
-        ]
-    )
+    mock_result = AsyncIterator([{"matched": ["Python"]}])
     mock_session.run.return_value = mock_result
     result = await match_role(params, mock_session)
     assert "match_score" in result
@@ -554,18 +543,7 @@ async def test_handle_skill_match_success() -> None:
     """Test successful skill matching."""
     mock_session = AsyncMock()
     params = {"required_skills": ["Python"], "years_experience": {"Python": 1}}
-    mock_result = AsyncIterator(
-        [
-            {
-                "p": {
-                    "id": "1",
-                    "name": "Test Person",
-                    "skills": ["Python"],
-                    "years_experience": {"Python": 1},
-                }
-            }
-        ]
-    )
+    mock_result = AsyncIterator([{"matched": ["Python"]}])
     mock_session.run.return_value = mock_result
     result = await rpc_match_role_handler(params, mock_session)
     assert "match_score" in result
@@ -621,18 +599,7 @@ async def test_handle_jsonrpc_request_success() -> None:
     """Test JSON-RPC match_role handler returns expected result."""
     mock_session = AsyncMock()
     params = {"required_skills": ["Python"], "years_experience": {"Python": 1}}
-    mock_result = AsyncIterator(
-        [
-            {
-                "p": {
-                    "id": "1",
-                    "name": "Test Person",
-                    "skills": ["Python"],
-                    "years_experience": {"Python": 1},
-                }
-            }
-        ]
-    )
+    mock_result = AsyncIterator([{"matched": ["Python"]}])
     mock_session.run.return_value = mock_result
     result = await rpc_match_role_handler(params, mock_session)
     assert "match_score" in result
@@ -700,7 +667,7 @@ async def test_handle_jsonrpc_request_internal_error() -> None:
 def client(mock_session):
     """Create a test client with mocked dependencies."""
     app = create_app()
-    app.dependency_overrides[get_db_session] = lambda: mock_session
+    app.dependency_overrides[get_read_session] = lambda: mock_session
     with TestClient(app) as test_client:
         yield test_client
 
@@ -710,7 +677,8 @@ def test_health_check(client):
     response = client.get("/health")
     expected_status_code = 200
     assert response.status_code == expected_status_code
-    assert response.json() == {"status": "ok"}
+    assert response.json()["status"] == "ok"
+    assert response.json()["embedding_model"] in {"idle", "loading", "ready"}
 
 
 def test_search_endpoint_success(client, mock_session):
@@ -7,11 +7,13 @@ from fastapi import status
 from fastapi.testclient import TestClient
 
 from skill_sphere_mcp.app import app
-from skill_sphere_mcp.db.deps import get_db_session
+from skill_sphere_mcp.db.deps import get_read_session
 from tests.constants import AsyncIterator
 
 client = TestClient(app)
 
+SEARCH_SCORE = 2.5
+
 def test_health_check():
     response = client.get("/v1/healthz")
     assert response.status_code == status.HTTP_200_OK
@@ -37,7 +39,7 @@ async def test_get_entity_not_found():
     async def mock_get_session():
         yield MockSession()
 
-    app.dependency_overrides[get_db_session] = mock_get_session
+    app.dependency_overrides[get_read_session] = mock_get_session
 
     response = client.get("/v1/entity/999999")
     assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -58,13 +60,14 @@ async def test_search_semantic():
                     "name": "Python",
                     "type": "Skill",
                     "description": "Python programming language"
-                }
+                },
+                "score": SEARCH_SCORE,
             }
         ])
         mock_session.run.return_value = mock_result
         yield mock_session
 
-    app.dependency_overrides[get_db_session] = mock_get_session
+    app.dependency_overrides[get_read_session] = mock_get_session
     
     try:
         response = client.post("/v1/search", json={"query": "Python", "k": 10})
@@ -73,6 +76,6 @@ async def test_search_semantic():
         assert isinstance(data, list)
         assert len(data) > 0
         assert "entity_id" in data[0]
-        assert "score" in data[0]
+        assert data[0]["score"] == SEARCH_SCORE
     finally:
         app.dependency_overrides.clear()
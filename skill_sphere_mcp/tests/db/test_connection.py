@@ -43,7 +43,7 @@ def session_mock() -> AsyncMock:
 def conn(settings: MagicMock, driver: AsyncMock) -> DatabaseConnection:
     """Create DatabaseConnection instance with mocked dependencies."""
     with patch(
-        "skill_sphere_mcp.db.connection.GraphDatabase.driver",
+        "skill_sphere_mcp.db.connection.AsyncGraphDatabase.driver",
         return_value=driver,
     ):
         conn = DatabaseConnection(
@@ -59,7 +59,7 @@ async def test_connection_initialization(
 ) -> None:
     """Test Neo4j connection initialization."""
     with patch(
-        "skill_sphere_mcp.db.connection.GraphDatabase.driver",
+        "skill_sphere_mcp.db.connection.AsyncGraphDatabase.driver",
         return_value=driver,
     ) as mock_driver:
         conn = DatabaseConnection(
@@ -70,6 +70,9 @@ async def test_connection_initialization(
         mock_driver.assert_called_once_with(
             settings.neo4j_uri,
             auth=(settings.neo4j_user, settings.neo4j_password),
+            max_connection_pool_size=100,
+            connection_acquisition_timeout=60.0,
+            max_connection_lifetime=3600.0,
         )
 
 
@@ -148,10 +151,12 @@ async def test_get_session_error_handling(
 @pytest.mark.asyncio
 async def test_get_session():
     """Test getting a database session."""
-    from skill_sphere_mcp.db.deps import get_db_session
+    from skill_sphere_mcp.db.deps import create_connection, get_db_session
 
+    connection = create_connection()
+    await connection.connect()
     # This should be a generator function, not awaitable
-    session_gen = get_db_session()
+    session_gen = get_db_session(connection)
     session = await anext(session_gen)
     assert session is not None
     # Test that session can be used
@@ -161,3 +166,5 @@ async def test_get_session():
         except (TypeError, AttributeError):
             # Session.close() might not be awaitable or might be None
             pass
+    await session_gen.aclose()
+    await connection.close()
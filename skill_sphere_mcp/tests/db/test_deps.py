@@ -2,21 +2,35 @@
 
 # pylint: disable=redefined-outer-name
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 import pytest_asyncio
 from fastapi import Depends, FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
-from neo4j import AsyncSession
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncSession
+from prometheus_client import REGISTRY
 from starlette.status import HTTP_200_OK, HTTP_500_INTERNAL_SERVER_ERROR
 
-from skill_sphere_mcp.db.deps import get_db_session
+from skill_sphere_mcp.db import deps
+from skill_sphere_mcp.db.deps import (
+    create_connection,
+    get_connection,
+    get_db_session,
+    get_read_session,
+    get_write_session,
+)
+from skill_sphere_mcp.db.graph_version import graph_version
 
 get_db_session_dep = Depends(get_db_session)
 
+# Sessions borrowed at once in the pool metrics test
+BORROWED = 2
+
 
 @pytest_asyncio.fixture
 async def app() -> AsyncGenerator[FastAPI, None]:
@@ -73,3 +87,93 @@ async def test_get_db_session_error_handling(app: FastAPI) -> None:
     client = TestClient(app, raise_server_exceptions=False)
     response = client.get("/test")
     assert response.status_code == HTTP_500_INTERNAL_SERVER_ERROR
+
+
+@pytest.fixture
+def driver() -> Iterator[MagicMock]:
+    """Patch the Neo4j driver factory with a driver handing out mock sessions."""
+    mock_driver = MagicMock()
+    mock_driver.close = AsyncMock()
+    mock_driver.session.side_effect = lambda **_kwargs: AsyncMock()
+    with patch(
+        "skill_sphere_mcp.db.connection.AsyncGraphDatabase.driver",
+        return_value=mock_driver,
+    ) as factory:
+        mock_driver.factory = factory
+        yield mock_driver
+
+
+def test_get_connection_reads_app_state() -> None:
+    """Test that requests use the connection opened by the lifespan."""
+    connection = create_connection()
+    request = MagicMock()
+    request.app.state.db_connection = connection
+
+    assert get_connection(request) is connection
+
+    request.app.state = SimpleNamespace()
+    with pytest.raises(RuntimeError):
+        get_connection(request)
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_connection_pool(driver: MagicMock) -> None:
+    """Test that sessions are borrowed from one driver and counted."""
+    sessions = [AsyncMock(), AsyncMock()]
+    driver.session.side_effect = sessions
+    connection = create_connection()
+    await connection.connect()
+
+    first = get_db_session(connection)
+    second = get_db_session(connection)
+    await anext(first)
+    await anext(second)
+    pool_size = deps.get_settings().neo4j_max_connection_pool_size
+    assert REGISTRY.get_sample_value("neo4j_pool_sessions_in_use") == BORROWED
+    assert REGISTRY.get_sample_value("neo4j_pool_max_size") == pool_size
+    assert REGISTRY.get_sample_value("neo4j_pool_utilization") == pytest.approx(
+        BORROWED / pool_size
+    )
+    await first.aclose()
+    await second.aclose()
+    assert REGISTRY.get_sample_value("neo4j_pool_sessions_in_use") == 0
+    for session in sessions:
+        session.close.assert_awaited_once()
+
+    driver.factory.assert_called_once()
+    assert driver.session.call_count == BORROWED
+    assert driver.factory.call_args.kwargs["max_connection_pool_size"] == pool_size
+
+    await connection.close()
+    driver.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_read_and_write_sessions_set_access_mode(driver: MagicMock) -> None:
+    """Test that read and write sessions are opened with their access mode."""
+    connection = create_connection()
+    await connection.connect()
+
+    for dependency in (get_read_session, get_write_session, get_db_session):
+        generator = dependency(connection)
+        await anext(generator)
+        await generator.aclose()
+
+    modes = [call.kwargs["default_access_mode"] for call in driver.session.mock_calls]
+    assert modes == [READ_ACCESS, WRITE_ACCESS, READ_ACCESS]
+
+
+@pytest.mark.asyncio
+async def test_sessions_do_not_bump_graph_version(driver: MagicMock) -> None:
+    """Test that borrowing a session alone leaves cached responses valid."""
+    connection = create_connection()
+    await connection.connect()
+    version = graph_version()
+
+    for dependency in (get_read_session, get_write_session):
+        generator = dependency(connection)
+        await anext(generator)
+        await generator.aclose()
+
+    assert driver.session.call_count == BORROWED
+    assert graph_version() == version
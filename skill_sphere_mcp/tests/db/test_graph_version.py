@@ -0,0 +1,18 @@
+"""Tests for the process-wide graph version."""
+
+from unittest.mock import patch
+
+from skill_sphere_mcp.db.graph_version import bump_graph_version, graph_version
+from skill_sphere_mcp.utils.response_cache import MemoryBackend, response_cache
+
+
+def test_bump_moves_version_and_invalidates_responses() -> None:
+    """Test that a bump is seen by graph caches and the response cache."""
+    with patch.object(response_cache, "backend", MemoryBackend()):
+        version = graph_version()
+        response_version = response_cache.backend.graph_version()
+
+        bump_graph_version()
+
+        assert graph_version() == version + 1
+        assert response_cache.backend.graph_version() != response_version
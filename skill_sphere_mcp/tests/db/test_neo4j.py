@@ -49,7 +49,7 @@ async def mock_result():
 @pytest_asyncio.fixture
 def conn(mock_settings: MagicMock, mock_driver: AsyncMock) -> DatabaseConnection:
     """Create DatabaseConnection instance with mocked dependencies."""
-    with patch("skill_sphere_mcp.db.connection.GraphDatabase") as mock_graph_db:
+    with patch("skill_sphere_mcp.db.connection.AsyncGraphDatabase") as mock_graph_db:
         mock_graph_db.driver.return_value = mock_driver
         return DatabaseConnection(
             uri=mock_settings.neo4j_uri,
@@ -64,7 +64,7 @@ async def test_connection_initialization(
 ) -> None:
     """Test connection initialization."""
     with (
-        patch("skill_sphere_mcp.db.connection.GraphDatabase") as mock_driver_factory,
+        patch("skill_sphere_mcp.db.connection.AsyncGraphDatabase") as mock_driver_factory,
     ):
         conn = DatabaseConnection(
             uri=mock_settings.neo4j_uri,
@@ -74,7 +74,10 @@ async def test_connection_initialization(
         await conn.connect()
         mock_driver_factory.driver.assert_called_once_with(
             mock_settings.neo4j_uri,
-            auth=(mock_settings.neo4j_user, mock_settings.neo4j_password)
+            auth=(mock_settings.neo4j_user, mock_settings.neo4j_password),
+            max_connection_pool_size=100,
+            connection_acquisition_timeout=60.0,
+            max_connection_lifetime=3600.0,
         )
 
 
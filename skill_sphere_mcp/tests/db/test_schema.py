@@ -0,0 +1,60 @@
+"""Tests for graph schema bootstrap."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from neo4j import AsyncSession
+from neo4j.exceptions import ClientError
+
+from skill_sphere_mcp.db.schema import (
+    NODE_TEXT_FULLTEXT_INDEX,
+    SKILL_NAME_CONSTRAINT,
+    SKILL_NAME_INDEX,
+    bootstrap_schema,
+)
+
+# Schema statements run by every bootstrap
+SCHEMA_STATEMENTS = 2
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_schema_creates_constraint():
+    """Test that the uniqueness constraint and fulltext index are created."""
+    mock_session = AsyncMock(spec=AsyncSession)
+
+    await bootstrap_schema(mock_session)
+
+    queries = [call.args[0] for call in mock_session.run.await_args_list]
+    assert queries == [SKILL_NAME_CONSTRAINT, NODE_TEXT_FULLTEXT_INDEX]
+    assert mock_session.run.return_value.consume.await_count == SCHEMA_STATEMENTS
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_schema_falls_back_to_index():
+    """Test that duplicate skill names fall back to a plain index."""
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.run.side_effect = [
+        ClientError("duplicate Skill.name"),
+        AsyncMock(),
+        AsyncMock(),
+    ]
+
+    await bootstrap_schema(mock_session)
+
+    queries = [call.args[0] for call in mock_session.run.await_args_list]
+    assert queries == [
+        SKILL_NAME_CONSTRAINT,
+        SKILL_NAME_INDEX,
+        NODE_TEXT_FULLTEXT_INDEX,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_schema_tolerates_missing_fulltext_support():
+    """Test that a failed fulltext index creation does not abort bootstrap."""
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.run.side_effect = [AsyncMock(), ClientError("fulltext unsupported")]
+
+    await bootstrap_schema(mock_session)
+
+    assert mock_session.run.await_count == SCHEMA_STATEMENTS
@@ -0,0 +1,163 @@
+"""Tests for nearest-neighbor embedding indexes."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from skill_sphere_mcp.graph import ann
+from skill_sphere_mcp.graph.ann import (
+    ANNConfig,
+    NumpyFlatIndex,
+    NumpyIVFIndex,
+    create_index,
+    index_filename,
+)
+
+NUM_VECTORS = 600
+DIMENSION = 16
+NUM_QUERIES = 20
+TOP_K = 10
+MIN_RECALL = 0.9
+# Float32 rounding allowed between scores that should be sorted
+SCORE_TOLERANCE = 1e-6
+
+KINDS = ["flat", "ivf", "hnsw"]
+
+
+@pytest.fixture(scope="module")
+def vectors() -> np.ndarray:
+    """Create clustered, row-normalized vectors."""
+    rng = np.random.default_rng(7)
+    centers = rng.standard_normal((12, DIMENSION))
+    matrix = centers[rng.integers(0, 12, NUM_VECTORS)] + 0.3 * rng.standard_normal(
+        (NUM_VECTORS, DIMENSION)
+    )
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix.astype(np.float32)
+
+
+def _exact(vectors: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """Return the exact top-k rows for every query."""
+    return np.argsort(-(queries @ vectors.T), axis=1)[:, :TOP_K]
+
+
+def _recall(found: np.ndarray, exact: np.ndarray) -> float:
+    """Fraction of exact neighbors that were found."""
+    hits = sum(
+        len(set(f) & set(e))
+        for f, e in zip(found.tolist(), exact.tolist(), strict=True)
+    )
+    return hits / exact.size
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_numpy_index_recall(vectors: np.ndarray, kind: str) -> None:
+    """Test that every NumPy index finds most exact neighbors, best first."""
+    index = create_index(ANNConfig(kind=kind, backend="numpy", nprobe=4))
+    index.build(vectors)
+    queries = vectors[:NUM_QUERIES]
+
+    rows, scores = index.search(queries, TOP_K)
+
+    assert rows.shape == scores.shape == (NUM_QUERIES, TOP_K)
+    assert (np.diff(scores, axis=1) <= SCORE_TOLERANCE).all()
+    assert rows[:, 0].tolist() == list(range(NUM_QUERIES))
+    recall = _recall(rows, _exact(vectors, queries))
+    assert recall == 1.0 if kind == "flat" else recall >= MIN_RECALL
+
+
+def test_ivf_nprobe_trades_recall(vectors: np.ndarray) -> None:
+    """Test that probing every list makes IVF search exact."""
+    config = ANNConfig(kind="ivf", backend="numpy", nlist=16, nprobe=1)
+    index = create_index(config)
+    index.build(vectors)
+    queries = np.random.default_rng(1).standard_normal((NUM_QUERIES, DIMENSION))
+    queries = (queries / np.linalg.norm(queries, axis=1, keepdims=True)).astype(
+        np.float32
+    )
+    narrow = _recall(index.search(queries, TOP_K)[0], _exact(vectors, queries))
+
+    config.nprobe = config.nlist
+    rows, _ = index.search(queries, TOP_K)
+    assert _recall(rows, _exact(vectors, queries)) == 1.0
+    assert narrow < 1.0
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_numpy_index_save_load(vectors: np.ndarray, kind: str, tmp_path: Path) -> None:
+    """Test that a saved index answers queries like the original."""
+    config = ANNConfig(kind=kind, backend="numpy")
+    index = create_index(config)
+    index.build(vectors)
+    path = tmp_path / index_filename(config, index.backend, "graph")
+    index.save(path)
+
+    loaded = create_index(config)
+    loaded.load(path, vectors)
+
+    queries = vectors[:NUM_QUERIES]
+    expected, _ = index.search(queries, TOP_K)
+    assert np.array_equal(loaded.search(queries, TOP_K)[0], expected)
+
+
+def test_index_handles_small_and_empty_matrices() -> None:
+    """Test that fewer rows than k are padded and empty indexes return nothing."""
+    for kind in KINDS:
+        index = create_index(ANNConfig(kind=kind, backend="numpy"))
+        index.build(np.eye(3, dtype=np.float32))
+        rows, _ = index.search(np.eye(3, dtype=np.float32)[:1], 5)
+        assert sorted(rows[0][rows[0] >= 0].tolist()) == [0, 1, 2]
+
+        empty = create_index(ANNConfig(kind=kind, backend="numpy"))
+        empty.build(np.zeros((0, 3), dtype=np.float32))
+        rows, _ = empty.search(np.eye(3, dtype=np.float32)[:1], 5)
+        assert (rows < 0).all()
+
+
+def test_index_filename_ignores_query_knobs() -> None:
+    """Test that only build-time parameters name a persisted index."""
+    base = index_filename(ANNConfig(kind="ivf"), "numpy", "graph")
+    assert index_filename(ANNConfig(kind="ivf", nprobe=64), "numpy", "graph") == base
+    assert index_filename(ANNConfig(kind="ivf", nlist=4), "numpy", "graph") != base
+    assert index_filename(ANNConfig(kind="ivf"), "numpy", "other") != base
+
+
+def test_create_index_rejects_unknown_kind() -> None:
+    """Test that invalid configurations are rejected."""
+    with pytest.raises(ValueError):
+        create_index(ANNConfig(kind="lsh"))
+
+
+def test_auto_backend_searches_exactly_with_numpy() -> None:
+    """Test that exact search reads the matrix in place even with FAISS."""
+    with patch.object(ann, "faiss", MagicMock()):
+        index = create_index(ANNConfig(kind="flat"))
+    assert isinstance(index, NumpyFlatIndex)
+
+
+def test_auto_backend_replaces_hnsw_without_faiss() -> None:
+    """Test that HNSW falls back to IVF instead of the slow NumPy build."""
+    with patch.object(ann, "faiss", None):
+        index = create_index(ANNConfig(kind="hnsw"))
+    assert isinstance(index, NumpyIVFIndex)
+    assert index.config.kind == "ivf"
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_faiss_index(vectors: np.ndarray, kind: str, tmp_path: Path) -> None:
+    """Test the FAISS backend when it is installed."""
+    pytest.importorskip("faiss")
+    config = ANNConfig(kind=kind, backend="faiss", nprobe=4)
+    index = create_index(config)
+    index.build(vectors)
+    queries = vectors[:NUM_QUERIES]
+    rows, _ = index.search(queries, TOP_K)
+    assert _recall(rows, _exact(vectors, queries)) >= MIN_RECALL
+
+    path = tmp_path / index_filename(config, index.backend)
+    index.save(path)
+    loaded = create_index(config)
+    loaded.load(path, vectors)
+    assert np.array_equal(loaded.search(queries, TOP_K)[0], rows)
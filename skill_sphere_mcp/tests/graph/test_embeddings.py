@@ -3,6 +3,7 @@
 # pylint: disable=redefined-outer-name
 
 from collections.abc import AsyncGenerator
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,7 +12,18 @@ import pytest
 import pytest_asyncio
 from neo4j import AsyncSession
 
-from skill_sphere_mcp.graph.embeddings import Node2VecEmbeddings, embeddings
+from skill_sphere_mcp.db.graph_version import bump_graph_version
+from skill_sphere_mcp.graph.ann import INDEX_FILE_PATTERN, ANNConfig, NumpyIVFIndex
+from skill_sphere_mcp.graph.embeddings import (
+    GRAPH_STRUCTURE_QUERY,
+    Node2VecEmbeddings,
+    embeddings,
+)
+from skill_sphere_mcp.graph.snapshot import (
+    EmbeddingSnapshot,
+    compute_fingerprint,
+    save_snapshot,
+)
 
 # Create a random number generator for testing
 rng = np.random.default_rng(42)
@@ -125,14 +137,13 @@ async def test_load_embeddings(
             "2": rng.random(TEST_DIMENSION),
         }
         mock_instance = mock_node2vec.return_value
-        mock_instance.fit = AsyncMock()
 
         # Load embeddings
         await emb.load_embeddings(mock_session)
 
-        # Verify Node2Vec was created and fit was called
+        # Verify Node2Vec was created and fit on the fetched graph
         mock_node2vec.assert_called_once()
-        mock_instance.fit.assert_called_once_with(mock_session)
+        mock_instance.fit_graph.assert_called_once()
 
         # Verify embeddings were stored
         assert emb.model is not None
@@ -296,7 +307,7 @@ async def test_load_embeddings_with_missing_embeddings(mock_session: AsyncMock)
         {"node_id": 2},
     ]
     class FakeNode2Vec:
-        async def fit(self, session):
+        def fit_graph(self, graph):
             pass
         def get_embedding(self, node_id):
             if node_id == "1":
@@ -339,3 +350,248 @@ def test_get_all_embeddings_direct():
     assert "x" in out
     # Ensure it's a new dict, but arrays are not deep-copied
     assert out is not emb._embeddings
+
+
+@pytest.mark.asyncio
+async def test_load_embeddings_reuses_snapshot(
+    mock_session: AsyncMock, tmp_path: Path
+) -> None:
+    """Test that training runs once and later loads use the snapshot."""
+    records = [
+        {"node_id": 1, "neighbors": [2]},
+        {"node_id": 2, "neighbors": [1]},
+    ]
+
+    def run_result(*_args: Any, **_kwargs: Any) -> AsyncMock:
+        result = AsyncMock()
+        result.__aiter__.return_value = iter(records)
+        return result
+
+    mock_session.run.side_effect = run_result
+
+    matrix = rng.random((2, TEST_DIMENSION)).astype(np.float32)
+
+    class FakeNode2Vec:
+        def fit_graph(self, graph):
+            pass
+
+        def get_embedding(self, node_id):
+            return dict(zip(["1", "2"], matrix, strict=True)).get(node_id)
+
+        def get_embedding_matrix(self):
+            return ["1", "2"], matrix
+
+    with patch(
+        "skill_sphere_mcp.graph.embeddings.Node2Vec", return_value=FakeNode2Vec()
+    ) as mock_node2vec:
+        trained = Node2VecEmbeddings(snapshot_dir=str(tmp_path))
+        await trained.load_embeddings(mock_session)
+        assert trained.is_loaded
+
+        restarted = Node2VecEmbeddings()
+        assert restarted.open_snapshot(str(tmp_path))
+        assert not restarted.is_loaded
+        await restarted.load_embeddings(mock_session)
+
+    mock_node2vec.assert_called_once()
+    assert restarted.is_loaded
+    assert restarted.model is None
+    assert np.array_equal(restarted.get_embedding("2"), matrix[1])
+
+    # A changed graph invalidates the snapshot
+    records.append({"node_id": 3, "neighbors": [1]})
+    with patch(
+        "skill_sphere_mcp.graph.embeddings.Node2Vec", return_value=FakeNode2Vec()
+    ) as mock_node2vec:
+        await Node2VecEmbeddings(snapshot_dir=str(tmp_path)).load_embeddings(
+            mock_session
+        )
+    mock_node2vec.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_load_embeddings_survives_unwritable_snapshot_dir(
+    mock_session: AsyncMock, tmp_path: Path
+) -> None:
+    """Test that a snapshot write failure keeps the trained embeddings."""
+    result = AsyncMock()
+    result.__aiter__.return_value = iter([{"node_id": 1, "neighbors": []}])
+    mock_session.run.return_value = result
+    vector = rng.random(TEST_DIMENSION).astype(np.float32)
+    node2vec = MagicMock()
+    node2vec.get_embedding.return_value = vector
+    node2vec.get_embedding_matrix.return_value = (["1"], vector.reshape(1, -1))
+    # A regular file where the snapshot directory should be
+    blocked = tmp_path / "snapshots"
+    blocked.write_text("", encoding="utf-8")
+
+    with patch("skill_sphere_mcp.graph.embeddings.Node2Vec", return_value=node2vec):
+        emb = Node2VecEmbeddings(snapshot_dir=str(blocked))
+        await emb.load_embeddings(mock_session)
+
+    assert emb.is_loaded
+    assert emb.model is node2vec
+    assert np.array_equal(emb.get_embedding("1"), vector)
+    # The structure fetched for the fingerprint is the one trained on
+    mock_session.run.assert_awaited_once()
+    node2vec.fit_graph.assert_called_once_with({"1": []})
+
+
+def test_top_k_matches_brute_force() -> None:
+    """Test that matrix top-k ranks rows like per-node cosine similarity."""
+    emb = Node2VecEmbeddings(dimension=TEST_DIMENSION)
+    vectors = {str(i): rng.standard_normal(TEST_DIMENSION) for i in range(20)}
+    vectors["zero"] = np.zeros(TEST_DIMENSION)
+    emb.set_all_embeddings(vectors)
+    queries = rng.standard_normal((3, TEST_DIMENSION))
+
+    rows, scores = emb.top_k(queries, 5)
+
+    assert rows.shape == scores.shape == (3, 5)
+    for query, query_rows, query_scores in zip(queries, rows, scores, strict=True):
+        expected = sorted(
+            (
+                float(np.dot(query, vec) / (np.linalg.norm(query) * np.linalg.norm(vec)))
+                if np.linalg.norm(vec)
+                else 0.0,
+                node,
+            )
+            for node, vec in vectors.items()
+        )[::-1][:5]
+        assert [emb._row_ids[row] for row in query_rows] == [n for _, n in expected]
+        assert np.allclose(query_scores, [s for s, _ in expected], atol=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_search_batch(mock_session: AsyncMock) -> None:
+    """Test that a batch of queries is ranked and hydrated in one query."""
+    emb = Node2VecEmbeddings(dimension=3)
+    emb.set_all_embeddings(
+        {"1": np.array([1.0, 0.0, 0.0]), "2": np.array([0.0, 1.0, 0.0])}
+    )
+    emb._verified = True
+    mock_session.run.return_value.__aiter__.return_value = [
+        {"node_id": node_id, "labels": ["Node"], "props": {"name": f"Node{node_id}"}}
+        for node_id in (1, 2)
+    ]
+
+    results = await emb.search_batch(
+        mock_session, np.array([[0.0, 2.0, 0.0], [1.0, 0.1, 0.0]]), top_k=1
+    )
+
+    assert [[hit["node_id"] for hit in hits] for hits in results] == [["2"], ["1"]]
+    assert results[0][0]["score"] == pytest.approx(1.0)
+    assert results[0][0]["properties"] == {"name": "Node2"}
+    mock_session.run.assert_called_once()
+    assert sorted(mock_session.run.call_args.kwargs["ids"]) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_search_caches_hydrated_nodes(mock_session: AsyncMock) -> None:
+    """Test that cached node payloads skip the round-trip until the graph changes."""
+    emb = Node2VecEmbeddings(dimension=3, node_cache_size=TEST_NUM_NODES)
+    emb.set_all_embeddings(
+        {"1": np.array([1.0, 0.0, 0.0]), "2": np.array([0.0, 1.0, 0.0])}
+    )
+    emb._verified = True
+    mock_session.run.return_value.__aiter__.return_value = [
+        {"node_id": node_id, "labels": ["Node"], "props": {}} for node_id in (1, 2)
+    ]
+    query = np.array([0.0, 2.0, 0.0])
+
+    first = await emb.search(mock_session, query, top_k=TEST_TOP_K)
+    second = await emb.search(mock_session, query, top_k=TEST_TOP_K)
+
+    assert [hit["node_id"] for hit in first] == ["2", "1"]
+    assert second == first
+    mock_session.run.assert_called_once()
+
+    emb._set_fingerprint(compute_fingerprint({"1": ["2"]}))
+    await emb.search(mock_session, query, top_k=TEST_TOP_K)
+    assert mock_session.run.call_count == TEST_NUM_NODES
+
+
+@pytest.mark.asyncio
+async def test_graph_write_reverifies_and_drops_cached_nodes(
+    mock_session: AsyncMock,
+) -> None:
+    """Test that a bumped graph version re-checks the graph and re-hydrates."""
+    structure = [{"node_id": 1, "neighbors": [2]}, {"node_id": 2, "neighbors": []}]
+    payloads = [{"node_id": 2, "labels": ["Node"], "props": {"name": "Old"}}]
+
+    def run_result(query: str, **_kwargs: Any) -> AsyncMock:
+        result = AsyncMock()
+        records = structure if query == GRAPH_STRUCTURE_QUERY else payloads
+        result.__aiter__.return_value = iter(records)
+        return result
+
+    mock_session.run.side_effect = run_result
+    emb = Node2VecEmbeddings(dimension=3, node_cache_size=TEST_NUM_NODES)
+    emb.set_all_embeddings({"2": np.array([0.0, 1.0, 0.0])})
+    emb.fingerprint = compute_fingerprint({"1": ["2"], "2": []})
+    emb._verified = True
+    query = np.array([0.0, 1.0, 0.0])
+    await emb.search(mock_session, query, top_k=1)
+
+    payloads[0]["props"] = {"name": "New"}
+    bump_graph_version()
+    assert not emb.is_loaded
+    with patch("skill_sphere_mcp.graph.embeddings.Node2Vec") as mock_node2vec:
+        hits = await emb.search(mock_session, query, top_k=1)
+
+    mock_node2vec.assert_not_called()
+    assert emb.is_loaded
+    assert hits[0]["properties"] == {"name": "New"}
+
+
+def test_search_index_persisted_with_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an index over a snapshot is saved once and then reused."""
+    matrix = rng.standard_normal((50, TEST_DIMENSION)).astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    node_ids = [str(i) for i in range(50)]
+    save_snapshot(
+        tmp_path,
+        EmbeddingSnapshot(node_ids, matrix, compute_fingerprint({"1": []})),
+    )
+    config = ANNConfig(kind="ivf", backend="numpy", nlist=4, nprobe=4)
+
+    emb = Node2VecEmbeddings(index_config=config)
+    assert emb.open_snapshot(str(tmp_path))
+    emb.build_index()
+    rows, _ = emb.top_k(matrix[:3], TEST_TOP_K)
+    assert rows[:, 0].tolist() == [0, 1, 2]
+    assert len(list(tmp_path.glob(INDEX_FILE_PATTERN))) == 1
+
+    def fail_build(*_args: Any) -> None:
+        raise AssertionError("index should be loaded, not rebuilt")
+
+    monkeypatch.setattr(NumpyIVFIndex, "build", fail_build)
+    restarted = Node2VecEmbeddings(index_config=config)
+    assert restarted.open_snapshot(str(tmp_path))
+    restarted.build_index()
+    assert np.array_equal(restarted.top_k(matrix[:3], TEST_TOP_K)[0], rows)
+
+
+@pytest.mark.asyncio
+async def test_approximate_index_builds_in_background(
+    mock_session: AsyncMock,
+) -> None:
+    """Test that searches stay exact until the background index build lands."""
+    matrix = rng.standard_normal((50, TEST_DIMENSION)).astype(np.float32)
+    emb = Node2VecEmbeddings(
+        index_config=ANNConfig(kind="ivf", backend="numpy", nlist=4, nprobe=4)
+    )
+    emb.set_all_embeddings({str(i): row for i, row in enumerate(matrix)})
+    emb._verified = True
+    mock_session.run.return_value.__aiter__.return_value = [
+        {"node_id": 0, "labels": ["Node"], "props": {}}
+    ]
+
+    hits = await emb.search(mock_session, matrix[0], top_k=1)
+
+    assert hits[0]["node_id"] == "0"
+    assert emb._index_task is not None
+    assert isinstance(await emb._index_task, NumpyIVFIndex)
+    assert isinstance(emb._search_index(), NumpyIVFIndex)
@@ -0,0 +1,85 @@
+"""Tests for fulltext node search."""
+
+# pylint: disable=redefined-outer-name, protected-access
+
+from unittest.mock import AsyncMock
+
+import pytest
+from neo4j import AsyncSession
+from neo4j.exceptions import ClientError, Neo4jError
+
+from skill_sphere_mcp.graph import fulltext
+from skill_sphere_mcp.graph.fulltext import (
+    FULLTEXT_SEARCH_QUERY,
+    SCAN_SEARCH_QUERY,
+    lucene_query,
+    search_nodes,
+)
+from tests.constants import AsyncIterator
+
+PYTHON_RECORD = {"n": {"id": "1", "name": "Python"}, "score": 2.5}
+
+
+@pytest.fixture
+def mock_session(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Create a mock session with the fulltext index assumed present."""
+    monkeypatch.setattr(fulltext._index_state, "missing_until", 0.0)
+    return AsyncMock(spec=AsyncSession)
+
+
+def _client_error(code: str, message: str) -> ClientError:
+    return Neo4jError._hydrate_neo4j(code=code, message=message)
+
+
+def test_lucene_query_escapes_operators():
+    """Test that user input is escaped and terms also match as prefixes."""
+    assert lucene_query("C++") == r"c\+\+ c\+\+*"
+    assert lucene_query("Graph DB") == "graph graph* db db*"
+    assert not lucene_query("   ")
+
+
+@pytest.mark.asyncio
+async def test_search_nodes_queries_fulltext_index(mock_session: AsyncMock):
+    """Test that searches go to the fulltext index with scores."""
+    mock_session.run.return_value = AsyncIterator([PYTHON_RECORD])
+
+    records = await search_nodes(mock_session, "Python", 5)
+
+    assert records == [PYTHON_RECORD]
+    mock_session.run.assert_awaited_once_with(
+        FULLTEXT_SEARCH_QUERY,
+        index="node_text",
+        search_query="python python*",
+        limit=5,
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_nodes_falls_back_to_scan(mock_session: AsyncMock):
+    """Test that a missing index falls back to the scan and is not retried."""
+    mock_session.run.side_effect = [
+        _client_error(
+            "Neo.ClientError.Procedure.ProcedureCallFailed",
+            "There is no such fulltext schema index: node_text",
+        ),
+        AsyncIterator([PYTHON_RECORD]),
+        AsyncIterator([PYTHON_RECORD]),
+    ]
+
+    assert await search_nodes(mock_session, "Python", 5) == [PYTHON_RECORD]
+    assert await search_nodes(mock_session, "Python", 5) == [PYTHON_RECORD]
+
+    queries = [call.args[0] for call in mock_session.run.await_args_list]
+    assert queries == [FULLTEXT_SEARCH_QUERY, SCAN_SEARCH_QUERY, SCAN_SEARCH_QUERY]
+    assert mock_session.run.await_args.kwargs["search_query"] == "Python"
+
+
+@pytest.mark.asyncio
+async def test_search_nodes_raises_other_client_errors(mock_session: AsyncMock):
+    """Test that unrelated database errors are not masked by the fallback."""
+    mock_session.run.side_effect = _client_error(
+        "Neo.ClientError.Statement.SyntaxError", "Invalid input"
+    )
+
+    with pytest.raises(ClientError):
+        await search_nodes(mock_session, "Python", 5)
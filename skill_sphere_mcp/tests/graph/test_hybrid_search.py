@@ -0,0 +1,117 @@
+"""Tests for hybrid lexical and semantic search."""
+
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+from neo4j import AsyncSession
+
+from skill_sphere_mcp.api.mcp.handlers import graph_search
+from skill_sphere_mcp.graph.hybrid_search import (
+    HybridSearch,
+    NodeTextEmbeddings,
+    reciprocal_rank_fusion,
+)
+from skill_sphere_mcp.graph.text_index import InvertedIndex
+
+NODES = {
+    "1": {"id": "1", "name": "Python", "description": "Programming language"},
+    "2": {"id": "2", "name": "FastAPI", "description": "Web framework"},
+    "3": {"id": "3", "name": "Neo4j", "description": "Graph database"},
+}
+
+# Words mapped onto shared concept axes so synonyms embed alike
+CONCEPTS = {
+    "python": 0,
+    "snake": 0,
+    "web": 1,
+    "http": 1,
+    "graph": 2,
+    "network": 2,
+}
+
+
+class FakeModel:
+    """Sentence-transformer stand-in embedding text onto concept axes."""
+
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, texts, normalize_embeddings=False):
+        """Embed texts as normalized concept counts."""
+        self.encoded.extend(texts)
+        vectors = np.full((len(texts), len(CONCEPTS)), 1e-3)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                if word in CONCEPTS:
+                    vectors[row, CONCEPTS[word]] += 1.0
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+def _hybrid() -> tuple[HybridSearch, FakeModel]:
+    lexical = InvertedIndex()
+    lexical.sync(NODES)
+    search = HybridSearch(lexical)
+    model = FakeModel()
+    search.refresh(model)
+    return search, model
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    """Test that items ranked by both lists beat items ranked by one."""
+    fused = reciprocal_rank_fusion([["a", "b"], ["b", "c"]], limit=3, k=60)
+
+    assert [item for item, _ in fused] == ["b", "a", "c"]
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+
+def test_node_text_embeddings_encode_only_changed_text():
+    """Test that a refresh re-encodes new and edited node text only."""
+    embeddings = NodeTextEmbeddings()
+    model = FakeModel()
+    first = {"1": "python", "2": "web"}
+    assert embeddings.sync(first, model) == len(first)
+
+    second = {"1": "python", "2": "http", "3": "graph"}
+    # Only the edited and the new text are encoded
+    assert embeddings.sync(second, model) == len(second) - 1
+
+    assert model.encoded == ["python", "web", "http", "graph"]
+    assert len(embeddings) == len(second)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_finds_semantic_matches():
+    """Test that queries without lexical hits still match by meaning."""
+    search, model = _hybrid()
+
+    results = await search.search("snake", 2)
+
+    assert results[0][0]["properties"]["name"] == "Python"
+    assert model.encoded[-1] == "snake"
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fuses_both_rankings():
+    """Test that a node ranked first lexically and semantically wins."""
+    search, _ = _hybrid()
+
+    results = await search.search("graph network", 3)
+
+    assert results[0][0]["properties"]["name"] == "Neo4j"
+    assert len(results) == len(NODES)
+
+
+@pytest.mark.asyncio
+async def test_graph_search_uses_hybrid_ranking():
+    """Test that the MCP graph_search handler serves hybrid results."""
+    search, _ = _hybrid()
+    mock_session = AsyncMock(spec=AsyncSession)
+
+    with patch("skill_sphere_mcp.graph.hybrid_search.hybrid_search", search):
+        result = await graph_search({"query": "http", "top_k": 1}, mock_session)
+
+    assert [r["node"]["name"] for r in result["results"]] == ["FastAPI"]
+    mock_session.run.assert_not_called()
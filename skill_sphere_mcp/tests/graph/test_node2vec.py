@@ -3,6 +3,10 @@
 # pylint: disable=redefined-outer-name
 
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise
+from pathlib import Path
+from unittest import mock
 from unittest.mock import AsyncMock
 
 import numpy as np
@@ -11,9 +15,17 @@ import pytest_asyncio
 from neo4j import AsyncSession
 
 from skill_sphere_mcp.graph.node2vec import Node2VecModelConfig, Node2VecTrainingConfig
-from skill_sphere_mcp.graph.node2vec.config import Node2VecConfig
+from skill_sphere_mcp.graph.node2vec.config import Node2VecConfig, TransitionConfig
+from skill_sphere_mcp.graph.node2vec.corpus import GeneratedWalkCorpus
+from skill_sphere_mcp.graph.node2vec.csr import compile_csr
 from skill_sphere_mcp.graph.node2vec.model import Node2Vec, Node2VecModel
+from skill_sphere_mcp.graph.node2vec.parallel import parallel_walk_array
 from skill_sphere_mcp.graph.node2vec.state import Node2VecState
+from skill_sphere_mcp.graph.node2vec.training import (
+    build_unigram_table,
+    skipgram_pairs,
+)
+from skill_sphere_mcp.graph.node2vec.walks import generate_walk_array, simulate_walks
 
 # Constants for test configuration
 DEFAULT_DIMENSION = 128
@@ -34,6 +46,7 @@ TEST_WINDOW_SIZE = 1
 TEST_NUM_NEG_SAMPLES = 1
 TEST_EPOCHS = 1
 TEST_CONTEXT_SIZE = 1
+TEST_WORKERS = 2
 EXPECTED_CONTEXT_SIZE = 1
 EXPECTED_CONTEXT_SIZE_MIDDLE = 2
 
@@ -54,6 +67,16 @@ ALIAS_Q_VALUE = 5
 # Constants for test graph
 EXPECTED_NUM_NODES = 4
 
+# Constants for lazy transition sampling
+LAZY_NUM_WALKERS = 20000
+LAZY_TOLERANCE = 0.02
+
+# Negative sampling table size divisible by 16**0.75 + 1
+TEST_TABLE_SIZE = 900
+
+# Streaming corpus test values
+TEST_BLOCK_SIZE = 3
+
 # Create a random number generator for testing
 rng = np.random.default_rng(42)
 
@@ -293,6 +316,21 @@ def test_node2vec_walk_isolated_node(
     assert walk[0] == "5"
 
 
+def test_node2vec_walk_reuses_compiled_graph(
+    test_node2vec: Node2Vec, test_sample_graph: dict[str, list[str]]
+) -> None:
+    """Test that walks on the preprocessed graph do not recompile it."""
+    test_node2vec.preprocess_transition_probs(test_sample_graph)
+
+    with mock.patch(
+        "skill_sphere_mcp.graph.node2vec.walks.compile_csr"
+    ) as mock_compile:
+        walk = test_node2vec.node2vec_walk("1")
+
+    mock_compile.assert_not_called()
+    assert walk[0] == "1"
+
+
 def test_generate_walks(
     test_node2vec: Node2Vec, test_sample_graph: dict[str, list[str]]
 ) -> None:
@@ -314,6 +352,362 @@ def test_generate_walks_empty_graph(test_node2vec: Node2Vec) -> None:
     assert len(walks) == 0
 
 
+def test_compile_csr(test_sample_graph: dict[str, list[str]]) -> None:
+    """Test compiling an adjacency list into CSR arrays."""
+    csr = compile_csr(test_sample_graph)
+
+    assert csr.node_ids == ["1", "2", "3", "4"]
+    assert csr.indptr.tolist() == [0, 2, 5, 8, 10]
+    assert csr.decode(csr.indices.reshape(1, -1))[0][2:5] == ["1", "3", "4"]
+    assert len(csr.node_q) == len(csr.indices)
+    assert not csr.has_edge_tables
+
+
+def test_compile_csr_edge_tables(
+    test_node2vec: Node2Vec, test_sample_graph: dict[str, list[str]]
+) -> None:
+    """Test that preprocessing compiles per-edge alias tables."""
+    test_node2vec.preprocess_transition_probs(test_sample_graph)
+    csr = test_node2vec._state.csr  # pylint: disable=protected-access
+
+    assert csr is not None
+    assert csr.has_edge_tables
+    assert len(csr.edge_q) == int(csr.degrees[csr.indices].sum())
+
+
+def test_simulate_walks_follow_edges(test_sample_graph: dict[str, list[str]]) -> None:
+    """Test that vectorized walks only traverse existing edges."""
+    csr = compile_csr(test_sample_graph)
+    walks = generate_walk_array(csr, TEST_NUM_WALKS, 10, np.random.default_rng(0))
+
+    assert walks.shape == (TEST_NUM_WALKS * len(test_sample_graph), 10)
+    assert walks.dtype == np.int32
+    edges = {
+        (csr.index[src], csr.index[dst])
+        for src, nbrs in test_sample_graph.items()
+        for dst in nbrs
+    }
+    for row in walks:
+        assert all((a, b) in edges for a, b in pairwise(row))
+
+
+def test_simulate_walks_dead_end() -> None:
+    """Test that walkers stop and pad at nodes without neighbors."""
+    csr = compile_csr({"a": ["b"], "b": []})
+    walks = simulate_walks(csr, csr.encode(["a", "b"]), 4, np.random.default_rng(0))
+
+    assert walks.tolist() == [[0, 1, -1, -1], [1, -1, -1, -1]]
+    assert csr.decode(walks) == [["a", "b"], ["b"]]
+
+
+def _biased_walk_frequencies(lazy_edges: bool) -> np.ndarray:
+    """Sample many short biased walks and return (2nd, 3rd) node frequencies."""
+    graph = {
+        "a": ["b"],
+        "b": ["a", "c", "d"],
+        "c": ["b", "d"],
+        "d": ["b", "c", "e"],
+        "e": ["d"],
+    }
+    node2vec = Node2Vec()
+    node2vec.preprocess_transition_probs(
+        graph,
+        TransitionConfig(
+            p=CUSTOM_P * 2,
+            q=CUSTOM_Q / 2,
+            weight_key="weight",
+            directed=True,
+            unweighted=True,
+            lazy_edges=lazy_edges,
+        ),
+    )
+    csr = node2vec._state.csr  # pylint: disable=protected-access
+    starts = np.full(LAZY_NUM_WALKERS, csr.index["b"], dtype=np.int32)
+    walks = simulate_walks(csr, starts, 3, np.random.default_rng(7))
+    counts = np.zeros((csr.num_nodes, csr.num_nodes))
+    np.add.at(counts, (walks[:, 1], walks[:, 2]), 1)
+    return counts / LAZY_NUM_WALKERS
+
+
+def test_lazy_edges_skips_edge_tables(
+    test_node2vec: Node2Vec, test_sample_graph: dict[str, list[str]]
+) -> None:
+    """Test that lazy preprocessing builds no per-edge alias tables."""
+    test_node2vec.preprocess_transition_probs(
+        test_sample_graph,
+        TransitionConfig(
+            p=CUSTOM_P,
+            q=CUSTOM_Q,
+            weight_key="weight",
+            directed=False,
+            unweighted=True,
+            lazy_edges=True,
+        ),
+    )
+    csr = test_node2vec._state.csr  # pylint: disable=protected-access
+    assert test_node2vec.get_alias_edges() == {}
+    assert csr is not None
+    assert not csr.has_edge_tables
+    assert (csr.p, csr.q) == (CUSTOM_P, CUSTOM_Q)
+    walks = test_node2vec.generate_walks(test_node2vec._state.graph)
+    assert len(walks) == TEST_NUM_WALKS * len(test_sample_graph)
+
+
+def test_lazy_edges_match_alias_edges() -> None:
+    """Test that rejection sampling matches the precomputed edge tables."""
+    eager = _biased_walk_frequencies(lazy_edges=False)
+    lazy = _biased_walk_frequencies(lazy_edges=True)
+    assert np.abs(eager - lazy).max() < LAZY_TOLERANCE
+
+
+def test_has_edges() -> None:
+    """Test bulk neighbor lookups on the sorted edge index."""
+    csr = compile_csr({"a": ["b", "c"], "b": ["c"], "c": []})
+    src = csr.encode(["a", "a", "b", "b", "c"])
+    dst = csr.encode(["b", "c", "a", "c", "a"])
+    assert csr.has_edges(src, dst).tolist() == [True, True, False, True, False]
+
+
+def test_skipgram_pairs() -> None:
+    """Test extraction of (center, context) pairs from a padded walk array."""
+    walks = np.asarray([[0, 1, 2], [3, 4, -1]], dtype=np.int32)
+    centers, contexts = skipgram_pairs(walks, TEST_WINDOW_SIZE)
+    pairs = set(zip(centers.tolist(), contexts.tolist(), strict=True))
+    assert pairs == {(0, 1), (1, 0), (1, 2), (2, 1), (3, 4), (4, 3)}
+
+
+def test_build_unigram_table() -> None:
+    """Test that the negative sampling table follows counts**0.75."""
+    counts = np.asarray([16, 1, 0])
+    table = build_unigram_table(counts, table_size=TEST_TABLE_SIZE)
+    assert len(table) == TEST_TABLE_SIZE
+    assert np.bincount(table, minlength=3).tolist() == [800, 100, 0]
+    assert len(build_unigram_table(np.zeros(3))) == 0
+
+
+def test_parallel_walk_array_reproducible(
+    test_sample_graph: dict[str, list[str]],
+) -> None:
+    """Test that sharded walks are valid and reproducible per seed."""
+    csr = compile_csr(test_sample_graph)
+    first = parallel_walk_array(
+        csr, TEST_NUM_WALKS, 10, np.random.default_rng(1), TEST_WORKERS
+    )
+    second = parallel_walk_array(
+        csr, TEST_NUM_WALKS, 10, np.random.default_rng(1), TEST_WORKERS
+    )
+    assert first.shape == (TEST_NUM_WALKS * len(test_sample_graph), 10)
+    assert np.array_equal(first, second)
+    assert (first >= 0).all()
+
+
+def test_generated_corpus_blocks(test_sample_graph: dict[str, list[str]]) -> None:
+    """Test that a generated corpus streams every walker in bounded blocks."""
+    csr = compile_csr(test_sample_graph)
+    corpus = GeneratedWalkCorpus(
+        csr, TEST_NUM_WALKS, 10, np.random.default_rng(1), TEST_BLOCK_SIZE
+    )
+    blocks = list(corpus.blocks())
+    walks = np.concatenate(blocks)
+
+    assert all(len(block) <= TEST_BLOCK_SIZE for block in blocks)
+    assert walks.shape == (len(corpus), 10)
+    assert walks.dtype == np.int32
+    assert sorted(walks[:, 0].tolist()) == sorted(
+        csr.start_nodes.tolist() * TEST_NUM_WALKS
+    )
+    assert np.array_equal(corpus.node_counts(), csr.degrees)
+
+
+def test_spilled_corpus_replays_walks(
+    test_sample_graph: dict[str, list[str]], tmp_path: Path
+) -> None:
+    """Test that a spilled corpus replays identical walks with exact counts."""
+    csr = compile_csr(test_sample_graph)
+    corpus = GeneratedWalkCorpus(
+        csr, TEST_NUM_WALKS, 10, np.random.default_rng(1), TEST_BLOCK_SIZE
+    ).spill(str(tmp_path / "walks.npy"))
+
+    first = np.concatenate(list(corpus.blocks()))
+    second = np.concatenate(list(corpus.blocks()))
+    assert np.array_equal(first, second)
+    assert np.array_equal(np.load(tmp_path / "walks.npy"), first)
+    assert np.array_equal(
+        corpus.node_counts(), np.bincount(first[first >= 0], minlength=csr.num_nodes)
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("spill", [False, True])
+async def test_fit_streams_walks(
+    test_mock_session: AsyncMock,
+    test_mock_result: AsyncMock,
+    tmp_path: Path,
+    spill: bool,
+) -> None:
+    """Test that fit trains on streamed walks without materializing them."""
+    records = [
+        {"node_id": 1, "neighbors": [2, 3]},
+        {"node_id": 2, "neighbors": [3, 4]},
+        {"node_id": 3, "neighbors": [4]},
+        {"node_id": 4, "neighbors": []},
+    ]
+    test_mock_result.__aiter__ = make_aiter(records)
+    test_mock_session.run.return_value = test_mock_result
+    spill_path = tmp_path / "walks.npy"
+    node2vec = Node2Vec(
+        Node2VecConfig(
+            model=Node2VecModelConfig(dimension=TEST_DIMENSION),
+            training=Node2VecTrainingConfig(
+                walk_length=TEST_WALK_LENGTH,
+                num_walks=TEST_NUM_WALKS,
+                epochs=TEST_EPOCHS,
+                walk_block_size=TEST_BLOCK_SIZE,
+                walk_spill_path=str(spill_path) if spill else None,
+            ),
+        )
+    )
+
+    await node2vec.fit(test_mock_session)
+
+    node_ids, matrix = node2vec.get_embedding_matrix()
+    assert node_ids == ["1", "2", "3", "4"]
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0, atol=1e-5)
+    assert not node2vec._state.walks  # pylint: disable=protected-access
+    assert spill_path.exists() == spill
+
+
+@pytest.mark.asyncio
+async def test_fit_reuses_one_worker_pool(
+    test_mock_session: AsyncMock, test_mock_result: AsyncMock
+) -> None:
+    """Test that parallel fit walks and trains every block on one pool."""
+    records = [
+        {"node_id": 1, "neighbors": [2, 3]},
+        {"node_id": 2, "neighbors": [3, 4]},
+        {"node_id": 3, "neighbors": [4]},
+        {"node_id": 4, "neighbors": []},
+    ]
+    test_mock_result.__aiter__ = make_aiter(records)
+    test_mock_session.run.return_value = test_mock_result
+    node2vec = Node2Vec(
+        Node2VecConfig(
+            model=Node2VecModelConfig(dimension=TEST_DIMENSION),
+            training=Node2VecTrainingConfig(
+                walk_length=TEST_WALK_LENGTH,
+                num_walks=TEST_NUM_WALKS,
+                epochs=TEST_WORKERS,
+                walk_block_size=1,
+                workers=TEST_WORKERS,
+            ),
+        )
+    )
+
+    with mock.patch(
+        "skill_sphere_mcp.graph.node2vec.parallel.ProcessPoolExecutor",
+        wraps=ProcessPoolExecutor,
+    ) as pool_class:
+        await node2vec.fit(test_mock_session)
+
+    pool_class.assert_called_once()
+    _, matrix = node2vec.get_embedding_matrix()
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0, atol=1e-5)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "model_config",
+    [
+        Node2VecModelConfig(
+            dimension=TEST_DIMENSION, p=CUSTOM_P, q=CUSTOM_Q, lazy_edges=True
+        ),
+        Node2VecModelConfig(
+            dimension=TEST_DIMENSION, p=CUSTOM_P, q=CUSTOM_Q, lazy_edge_threshold=0
+        ),
+    ],
+)
+async def test_fit_with_lazy_edges(
+    test_mock_session: AsyncMock,
+    test_mock_result: AsyncMock,
+    model_config: Node2VecModelConfig,
+) -> None:
+    """Test that fit walks with lazy sampling when the model config asks."""
+    records = [
+        {"node_id": 1, "neighbors": [2, 3]},
+        {"node_id": 2, "neighbors": [3, 4]},
+        {"node_id": 3, "neighbors": [4]},
+        {"node_id": 4, "neighbors": []},
+    ]
+    test_mock_result.__aiter__ = make_aiter(records)
+    test_mock_session.run.return_value = test_mock_result
+    node2vec = Node2Vec(
+        Node2VecConfig(
+            model=model_config,
+            training=Node2VecTrainingConfig(
+                walk_length=TEST_WALK_LENGTH,
+                num_walks=TEST_NUM_WALKS,
+                epochs=TEST_EPOCHS,
+            ),
+        )
+    )
+
+    await node2vec.fit(test_mock_session)
+
+    csr = node2vec._state.csr  # pylint: disable=protected-access
+    assert csr is not None
+    assert not csr.has_edge_tables
+    assert (csr.p, csr.q) == (CUSTOM_P, CUSTOM_Q)
+    assert node2vec.get_alias_edges() == {}
+    node_ids, matrix = node2vec.get_embedding_matrix()
+    assert node_ids == ["1", "2", "3", "4"]
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0, atol=1e-5)
+
+
+@pytest.mark.parametrize("workers", [1, TEST_WORKERS])
+def test_train_embeddings_separates_communities(workers: int) -> None:
+    """Test that batched skip-gram places linked communities apart."""
+    graph = {}
+    for community in "ab":
+        members = [f"{community}{i}" for i in range(8)]
+        for node in members:
+            graph[node] = [other for other in members if other != node]
+    graph["a0"].append("b0")
+    node2vec = Node2Vec(
+        Node2VecConfig(
+            model=Node2VecModelConfig(dimension=16),
+            training=Node2VecTrainingConfig(
+                walk_length=10,
+                num_walks=10,
+                epochs=30,
+                learning_rate=0.05,
+                batch_size=64,
+                workers=workers,
+            ),
+        )
+    )
+    node2vec.preprocess_transition_probs(
+        graph,
+        TransitionConfig(
+            p=DEFAULT_P, q=DEFAULT_Q, weight_key="weight", directed=True, unweighted=True
+        ),
+    )
+    node2vec.initialize_embeddings(set(graph))
+    node2vec.train_embeddings(node2vec.generate_walks(graph))
+
+    node_ids, matrix = node2vec.get_embedding_matrix()
+    assert matrix.dtype == np.float32
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0, atol=1e-5)
+    labels = np.asarray([node[0] for node in node_ids])
+    same = labels[:, None] == labels[None, :]
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(same, False)
+    within = similarity[same].mean()
+    across = similarity[labels[:, None] != labels[None, :]].mean()
+    assert within > across + 0.2
+    assert node2vec.get_embedding("a1") is not None
+    assert np.shares_memory(node2vec.get_embedding("a1"), matrix)
+
+
 def test_initialize_embeddings(test_node2vec: Node2Vec) -> None:
     """Test embedding initialization."""
     nodes = {"1", "2", "3"}
@@ -19,7 +19,9 @@ os.environ.pop("SKILL_SPHERE_MCP_CLIENT_MCP_INSTRUCTIONS", None)
 
 # Now import the settings
 from skill_sphere_mcp.config.settings import ClientInfo, Settings, get_settings
+from skill_sphere_mcp.db.graph_version import bump_graph_version
 from skill_sphere_mcp.graph.skill_matching import (
+    CandidateRanking,
     MatchResult,
     SkillMatch,
     SkillMatchingService,
@@ -35,6 +37,8 @@ settings = get_settings()
 EXPECTED_MATCH_COUNT = 2
 EXPECTED_GAP_COUNT = 1
 EXPECTED_OVERALL_SCORE = 0.8
+INDEX_LOADS = 2
+TOP_CANDIDATES = 4
 
 # Test data
 MOCK_SKILLS = [{"name": "Python", "years": 5}, {"name": "FastAPI", "years": 3}]
@@ -68,6 +72,27 @@ MOCK_CANDIDATE_SKILLS = [
 ]
 
 
+def _skill_records(*names: str) -> list[dict]:
+    """Build skill index records for the given skill names."""
+    return [{"name": name, "node_id": i} for i, name in enumerate(names, start=1)]
+
+
+def _mock_graph(mock_session: AsyncMock, skill_names: list[str], path: object) -> None:
+    """Answer skill index and batched evidence queries with canned records."""
+
+    def run_side_effect(query, *args, **kwargs):
+        mock_result = mock.MagicMock()
+        if "MATCH (s:Skill)" in query:
+            mock_result.__aiter__.return_value = _skill_records(*skill_names)
+        elif "UNWIND $pairs" in query:
+            mock_result.__aiter__.return_value = [
+                {**pair, "path": path} for pair in kwargs["pairs"] if path is not None
+            ]
+        return mock_result
+
+    mock_session.run.side_effect = run_side_effect
+
+
 @pytest_asyncio.fixture
 async def skill_matcher() -> SkillMatchingService:
     """Create a skill matching service instance."""
@@ -141,11 +166,11 @@ async def test_match_role_success(
     skill_matcher: SkillMatchingService, mock_session: AsyncMock
 ) -> None:
     """Test successful role matching."""
-    # Patch embeddings.model to a dummy so Node2Vec is not invoked
+    # Mark embeddings as loaded so Node2Vec is not invoked
     with mock.patch(
         "skill_sphere_mcp.graph.skill_matching.embeddings"
     ) as mock_embeddings:
-        mock_embeddings.model = object()
+        mock_embeddings.is_loaded = True
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
 
         # Mock a path with nodes and relationships
@@ -160,10 +185,7 @@ async def test_match_role_success(
         mock_path.nodes = [mock_node]
         mock_path.relationships = []
 
-        mock_session.run.return_value.single.return_value = {
-            "path": mock_path,
-            "node_id": 1,
-        }
+        _mock_graph(mock_session, ["Python", "FastAPI"], mock_path)
 
         result = await skill_matcher.match_role(
             mock_session,
@@ -215,7 +237,7 @@ async def test_match_role_partial_match(
     with mock.patch(
         "skill_sphere_mcp.graph.skill_matching.embeddings"
     ) as mock_embeddings:
-        mock_embeddings.model = object()
+        mock_embeddings.is_loaded = True
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
         # Only return a path for the matching skill
         mock_node = mock.MagicMock()
@@ -231,13 +253,8 @@ async def test_match_role_partial_match(
         mock_path = mock.MagicMock()
         mock_path.nodes = [mock_node]
         mock_path.relationships = []
-        # Return node_id for Python embedding, node_id for candidate, path for evidence, None for FastAPI
-        mock_session.run.return_value.single.side_effect = [
-            {"node_id": 1},  # Python embedding
-            {"node_id": 1},  # Python candidate embedding
-            {"path": mock_path},  # Python evidence
-            None,  # FastAPI embedding (not found)
-        ]
+        # Only Python is in the skill index, so FastAPI has no embedding
+        _mock_graph(mock_session, ["Python"], mock_path)
         partial_candidate_skills = [{"name": "Python", "years": 5}]
         result = await skill_matcher.match_role(
             mock_session,
@@ -259,7 +276,7 @@ async def test_match_role_experience_scoring(
     with mock.patch(
         "skill_sphere_mcp.graph.skill_matching.embeddings"
     ) as mock_embeddings:
-        mock_embeddings.model = object()
+        mock_embeddings.is_loaded = True
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
 
         # Mock a path with nodes and relationships
@@ -274,10 +291,7 @@ async def test_match_role_experience_scoring(
         mock_path.nodes = [mock_node]
         mock_path.relationships = []
 
-        mock_session.run.return_value.single.return_value = {
-            "path": mock_path,
-            "node_id": 1,
-        }
+        _mock_graph(mock_session, ["Python", "FastAPI"], mock_path)
 
         # Test with varying experience levels
         candidate_skills = [
@@ -304,7 +318,7 @@ async def test_find_best_match(
     with mock.patch(
         "skill_sphere_mcp.graph.skill_matching.embeddings"
     ) as mock_embeddings:
-        mock_embeddings.model = object()
+        mock_embeddings.is_loaded = True
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
         mock_node = mock.MagicMock()
         mock_node.labels = ["Skill"]
@@ -322,8 +336,10 @@ async def test_find_best_match(
 
         def run_side_effect(query, *args, **kwargs):
             mock_result = mock.MagicMock()
-            if "RETURN id(s) as node_id" in query:
-                mock_result.single = AsyncMock(return_value={"node_id": 1})
+            if "RETURN s.name as name, id(s) as node_id" in query:
+                mock_result.__aiter__.return_value = _skill_records(
+                    "Python", "FastAPI"
+                )
             elif "RETURN path" in query:
                 mock_result.single = AsyncMock(return_value={"path": mock_path})
             else:
@@ -351,7 +367,7 @@ async def test_find_best_match_no_match(
     with mock.patch(
         "skill_sphere_mcp.graph.skill_matching.embeddings"
     ) as mock_embeddings:
-        mock_embeddings.model = object()
+        mock_embeddings.is_loaded = True
         mock_embeddings.get_embedding.return_value = None
         best_match = await skill_matcher._find_best_match(
             mock_session,
@@ -370,7 +386,7 @@ async def test_find_best_match_below_threshold(
     with mock.patch(
         "skill_sphere_mcp.graph.skill_matching.embeddings"
     ) as mock_embeddings:
-        mock_embeddings.model = object()
+        mock_embeddings.is_loaded = True
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
         mock_node = mock.MagicMock()
         mock_node.labels = ["Skill"]
@@ -388,8 +404,10 @@ async def test_find_best_match_below_threshold(
 
         def run_side_effect(query, *args, **kwargs):
             mock_result = mock.MagicMock()
-            if "RETURN id(s) as node_id" in query:
-                mock_result.single = AsyncMock(return_value={"node_id": 1})
+            if "RETURN s.name as name, id(s) as node_id" in query:
+                mock_result.__aiter__.return_value = _skill_records(
+                    "Python", "FastAPI"
+                )
             elif "RETURN path" in query:
                 mock_result.single = AsyncMock(return_value={"path": mock_path})
             else:
@@ -417,9 +435,9 @@ async def test_get_skill_embedding(
     with mock.patch(
         "skill_sphere_mcp.graph.skill_matching.embeddings"
     ) as mock_embeddings:
-        mock_embeddings.model = object()
+        mock_embeddings.is_loaded = True
         mock_embeddings.get_embedding.return_value = np.ones(128)
-        mock_session.run.return_value.single.return_value = {"node_id": 1}
+        mock_session.run.return_value.__aiter__.return_value = _skill_records("Python")
         embedding = await skill_matcher._get_skill_embedding(mock_session, "Python")
         assert embedding is not None
         assert isinstance(embedding, np.ndarray)
@@ -486,7 +504,7 @@ async def test_match_role_with_evidence(
     with mock.patch(
         "skill_sphere_mcp.graph.skill_matching.embeddings"
     ) as mock_embeddings:
-        mock_embeddings.model = object()
+        mock_embeddings.is_loaded = True
         mock_embeddings.get_embedding.return_value = np.ones((1, 128))
         mock_node = mock.MagicMock()
         mock_node.labels = ["Skill"]
@@ -501,12 +519,7 @@ async def test_match_role_with_evidence(
         mock_path = mock.MagicMock()
         mock_path.nodes = [mock_node]
         mock_path.relationships = []
-        # First call for embedding, second for evidence
-        mock_session.run.return_value.single.side_effect = [
-            {"node_id": 1},  # embedding for req_skill
-            {"node_id": 1},  # embedding for candidate
-            {"path": mock_path},  # evidence
-        ]
+        _mock_graph(mock_session, ["Python"], mock_path)
         result = await skill_matcher.match_role(
             mock_session,
             [{"name": "Python", "years": 5}],
@@ -516,3 +529,175 @@ async def test_match_role_with_evidence(
         assert len(result.matching_skills) == 1
         assert len(result.matching_skills[0].evidence) > 0
         assert result.supporting_nodes
+
+
+@pytest.mark.asyncio
+async def test_skill_index_loaded_once(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test that scoring does no per-skill queries after one bulk index load."""
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings:
+        mock_embeddings.is_loaded = True
+        mock_embeddings.get_embedding.side_effect = lambda node_id: np.eye(3)[
+            int(node_id) - 1
+        ]
+        _mock_graph(mock_session, ["Python", "FastAPI", "Rust"], None)
+
+        first = await skill_matcher.match_role(
+            mock_session, MOCK_REQUIRED_SKILLS, MOCK_CANDIDATE_SKILLS
+        )
+        await skill_matcher.match_role(
+            mock_session, MOCK_REQUIRED_SKILLS, MOCK_CANDIDATE_SKILLS
+        )
+
+        queries = [call.args[0] for call in mock_session.run.call_args_list]
+        assert sum("MATCH (s:Skill)" in query for query in queries) == 1
+        assert all("{name: $name}" not in query for query in queries)
+        assert len(first.matching_skills) == len(MOCK_REQUIRED_SKILLS)
+
+        # A graph write reloads the index
+        bump_graph_version()
+        await skill_matcher.match_role(
+            mock_session, MOCK_REQUIRED_SKILLS, MOCK_CANDIDATE_SKILLS
+        )
+        queries = [call.args[0] for call in mock_session.run.call_args_list]
+        assert sum("MATCH (s:Skill)" in query for query in queries) == INDEX_LOADS
+
+        # So does a new graph fingerprint
+        mock_embeddings.fingerprint = object()
+        await skill_matcher.match_role(
+            mock_session, MOCK_REQUIRED_SKILLS, MOCK_CANDIDATE_SKILLS
+        )
+        queries = [call.args[0] for call in mock_session.run.call_args_list]
+        assert sum("MATCH (s:Skill)" in query for query in queries) == INDEX_LOADS + 1
+
+
+def test_best_matches_agree_with_pairwise_scoring(
+    skill_matcher: SkillMatchingService,
+) -> None:
+    """Test that matrix scoring selects the same matches as a pairwise loop."""
+    rng = np.random.default_rng(0)
+    names = [f"skill-{i}" for i in range(12)]
+    vectors = {name: rng.normal(size=8) for name in names}
+    vectors["skill-1"] = vectors["skill-0"] + 0.1  # near duplicate
+    required = [{"name": name, "years": i % 3} for i, name in enumerate(names[:6])]
+    candidates = [{"name": name, "years": i % 4} for i, name in enumerate(names[4:])]
+    candidates.append({"name": "unknown", "years": 9})
+    skill_matcher._skill_ids = {name: name for name in names}
+    skill_matcher.similarity_threshold = 0.2
+
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings:
+        mock_embeddings.get_embedding.side_effect = vectors.get
+        best_matches = skill_matcher._best_matches(required, candidates)
+
+    for req, best in zip(required, best_matches, strict=True):
+        expected: tuple[int, float] | None = None
+        for column, cand in enumerate(candidates):
+            if cand["name"] not in vectors:
+                continue
+            a, b = vectors[req["name"]], vectors[cand["name"]]
+            similarity = a @ b / (np.linalg.norm(a) * np.linalg.norm(b))
+            if similarity < skill_matcher.similarity_threshold:
+                continue
+            if req["years"] > 0:
+                ratio = min(cand["years"] / req["years"], 1.0)
+                similarity = similarity * 0.7 + ratio * 0.3
+            if similarity > (expected[1] if expected else 0.0):
+                expected = (column, similarity)
+        if expected is None:
+            assert best is None
+        else:
+            assert best is not None
+            assert best[0] == expected[0]
+            assert best[1] == pytest.approx(expected[1], abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_gather_evidence_batch(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test that evidence for all pairs is fetched once and then cached."""
+    mock_path = mock.MagicMock()
+    mock_path.nodes = []
+    mock_path.relationships = [mock.MagicMock(type="REQUIRES")]
+    mock_result = mock.MagicMock()
+    mock_result.__aiter__.return_value = [
+        {"req_skill": "Python", "candidate_skill": "Django", "path": mock_path}
+    ]
+    mock_session.run.return_value = mock_result
+    pairs = [("Python", "Django"), ("Rust", "Go"), ("Python", "Django")]
+
+    evidence = await skill_matcher._gather_evidence_batch(mock_session, pairs)
+
+    mock_session.run.assert_awaited_once()
+    assert mock_session.run.call_args.kwargs["pairs"] == [
+        {"req_skill": "Python", "candidate_skill": "Django"},
+        {"req_skill": "Rust", "candidate_skill": "Go"},
+    ]
+    assert evidence[("Python", "Django")][0]["rel_type"] == "REQUIRES"
+    assert evidence[("Rust", "Go")] == []
+
+    cached = await skill_matcher._gather_evidence_batch(mock_session, pairs[:2])
+    mock_session.run.assert_awaited_once()
+    assert cached == evidence
+    assert await skill_matcher._gather_evidence(mock_session, "Rust", "Go") == []
+    mock_session.run.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_rank_candidates_matches_match_role(
+    skill_matcher: SkillMatchingService, mock_session: AsyncMock
+) -> None:
+    """Test that ranked scores agree with per-candidate match_role scores."""
+    rng = np.random.default_rng(1)
+    names = [f"skill-{i}" for i in range(10)]
+    vectors = {name: rng.normal(size=6) for name in names}
+    vectors["skill-7"] = vectors["skill-0"] + 0.05
+    required = [{"name": "skill-0", "years": 3}, {"name": "skill-1", "years": 0}]
+    candidates = [
+        {
+            "id": f"p{i}",
+            "skills": [{"name": names[j], "years": (i + j) % 5} for j in picks],
+        }
+        for i, picks in enumerate([[0, 2], [7, 1], [3, 4], [], [1, 7, 0], [9]])
+    ]
+    skill_matcher.similarity_threshold = 0.3
+    _mock_graph(mock_session, names, None)
+
+    with mock.patch(
+        "skill_sphere_mcp.graph.skill_matching.embeddings"
+    ) as mock_embeddings:
+        mock_embeddings.is_loaded = True
+        mock_embeddings.get_embedding.side_effect = lambda node_id: vectors[
+            names[int(node_id) - 1]
+        ]
+        rankings = await skill_matcher.rank_candidates(
+            mock_session, required, candidates, top_n=TOP_CANDIDATES
+        )
+        expected = {
+            candidate["id"]: await skill_matcher.match_role(
+                mock_session, required, candidate["skills"]
+            )
+            for candidate in candidates
+        }
+
+    assert len(rankings) == TOP_CANDIDATES
+    assert rankings[0].matching_skills
+    assert all(isinstance(ranking, CandidateRanking) for ranking in rankings)
+    scores = [ranking.overall_score for ranking in rankings]
+    assert scores == sorted(scores, reverse=True)
+    best_expected = sorted(
+        (result.overall_score for result in expected.values()), reverse=True
+    )[:4]
+    assert scores == pytest.approx(best_expected)
+    for ranking in rankings:
+        result = expected[ranking.candidate_id]
+        assert ranking.overall_score == pytest.approx(result.overall_score)
+        assert ranking.skill_gaps == result.skill_gaps
+        assert [match.skill_name for match in ranking.matching_skills] == [
+            match.skill_name for match in result.matching_skills
+        ]
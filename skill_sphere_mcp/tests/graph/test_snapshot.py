@@ -0,0 +1,60 @@
+"""Tests for persisted embedding snapshots."""
+
+from pathlib import Path
+
+import numpy as np
+
+from skill_sphere_mcp.graph.snapshot import (
+    INDEX_FILE,
+    EmbeddingSnapshot,
+    compute_fingerprint,
+    load_snapshot,
+    save_snapshot,
+)
+
+GRAPH = {"1": ["2", "3"], "2": ["3"], "3": []}
+
+
+def _snapshot() -> EmbeddingSnapshot:
+    """Create a small snapshot of the test graph."""
+    matrix = np.random.default_rng(0).random((3, 4)).astype(np.float32)
+    return EmbeddingSnapshot(["1", "2", "3"], matrix, compute_fingerprint(GRAPH))
+
+
+def test_fingerprint_ignores_order() -> None:
+    """Test that fingerprints depend on structure, not ordering."""
+    reordered = {"3": [], "2": ["3"], "1": ["3", "2"]}
+    fingerprint = compute_fingerprint(GRAPH)
+    assert fingerprint == compute_fingerprint(reordered)
+    assert (fingerprint.node_count, fingerprint.edge_count) == (3, 3)
+    assert fingerprint != compute_fingerprint({**GRAPH, "3": ["1"]})
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    """Test that a saved snapshot loads back memory-mapped."""
+    snapshot = _snapshot()
+    save_snapshot(tmp_path, snapshot)
+
+    loaded = load_snapshot(tmp_path, snapshot.fingerprint)
+    assert loaded is not None
+    assert loaded.node_ids == snapshot.node_ids
+    assert loaded.fingerprint == snapshot.fingerprint
+    assert isinstance(loaded.matrix, np.memmap)
+    assert not loaded.matrix.flags.writeable
+    assert np.array_equal(loaded.matrix, snapshot.matrix)
+
+
+def test_snapshot_rejects_stale_fingerprint(tmp_path: Path) -> None:
+    """Test that a snapshot of another graph is not loaded."""
+    save_snapshot(tmp_path, _snapshot())
+    changed = compute_fingerprint({**GRAPH, "4": ["1"]})
+    assert load_snapshot(tmp_path, changed) is None
+    assert load_snapshot(tmp_path) is not None
+
+
+def test_snapshot_missing_or_corrupt(tmp_path: Path) -> None:
+    """Test that missing or unreadable snapshots are ignored."""
+    assert load_snapshot(tmp_path) is None
+    save_snapshot(tmp_path, _snapshot())
+    (tmp_path / INDEX_FILE).write_text("{", encoding="utf-8")
+    assert load_snapshot(tmp_path) is None
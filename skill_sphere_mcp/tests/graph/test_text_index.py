@@ -0,0 +1,116 @@
+"""Tests for the in-process BM25 text index."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from neo4j import AsyncSession
+from neo4j.graph import Graph, Node
+
+from skill_sphere_mcp.api.mcp import handlers as mcp_handlers
+from skill_sphere_mcp.graph.text_index import EXPORT_QUERY, InvertedIndex, tokenize
+from skill_sphere_mcp.tools.handlers import graph_search
+from tests.constants import AsyncIterator
+
+NODES = {
+    "1": {"id": "1", "name": "Python", "description": "Python programming language"},
+    "2": {"id": "2", "name": "FastAPI", "description": "Python web framework"},
+    "3": {"id": "3", "name": "Neo4j", "description": "Graph database"},
+}
+LABELS = {"1": ["Skill"], "2": ["Skill", "Tool"], "3": ["Tool"]}
+
+# Nodes added, changed or removed by the refresh in the sync test
+SYNC_CHANGES = 3
+
+
+def test_tokenize_keeps_technical_terms():
+    """Test that tokens like C++ and Node.js survive tokenization."""
+    assert tokenize("C++, C# and Node.js.") == ["c++", "c#", "and", "node.js"]
+
+
+def test_search_ranks_with_bm25():
+    """Test that more specific matches rank first and misses are excluded."""
+    index = InvertedIndex()
+    index.sync(NODES)
+
+    results = index.search("python", 10)
+
+    assert [hit["node_id"] for hit, _ in results] == ["1", "2"]
+    assert results[0][1] > results[1][1] > 0
+    assert not index.search("kubernetes", 10)
+    assert len(index.search("python graph", 1)) == 1
+
+
+def test_sync_only_reindexes_changed_nodes():
+    """Test that a refresh applies additions, edits and removals."""
+    index = InvertedIndex()
+    assert index.sync(NODES) == len(NODES)
+    assert index.sync(NODES) == 0
+
+    updated = dict(NODES)
+    updated["3"] = {"id": "3", "name": "Neo4j", "description": "Python driver"}
+    del updated["2"]
+    updated["4"] = {"id": "4", "name": "Kubernetes"}
+
+    assert index.sync(updated) == SYNC_CHANGES
+    assert len(index) == len(updated)
+    assert [hit["node_id"] for hit, _ in index.search("python", 10)] == ["1", "3"]
+    assert index.search("kubernetes", 10)[0][0]["node_id"] == "4"
+    assert not index.search("framework", 10)
+
+
+@pytest.mark.asyncio
+async def test_load_exports_nodes_in_one_query():
+    """Test that loading runs the bulk export and marks the index ready."""
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.run.return_value = AsyncIterator(
+        [
+            {"node_id": node_id, "labels": LABELS[node_id], "props": props}
+            for node_id, props in NODES.items()
+        ]
+    )
+    index = InvertedIndex()
+    assert not index.ready
+
+    await index.load(mock_session)
+
+    assert index.ready
+    assert len(index) == len(NODES)
+    assert index.node("2")["labels"] == ["Skill", "Tool"]
+    mock_session.run.assert_awaited_once()
+    assert mock_session.run.await_args.args[0] == EXPORT_QUERY
+
+
+@pytest.mark.asyncio
+async def test_graph_search_serves_from_loaded_index():
+    """Test that graph.search skips the database once the index is loaded."""
+    mock_session = AsyncMock(spec=AsyncSession)
+    index = InvertedIndex()
+    index.sync(NODES)
+
+    with patch("skill_sphere_mcp.graph.hybrid_search.text_index", index):
+        result = await graph_search({"query": "graph", "top_k": 5}, mock_session)
+
+    assert [r["node"]["name"] for r in result.results] == ["Neo4j"]
+    assert result.results[0]["links"]
+    mock_session.run.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "handler", [graph_search, mcp_handlers.graph_search], ids=["tool", "mcp"]
+)
+async def test_graph_search_same_fields_from_index_and_database(handler):
+    """Test that in-memory and database hits carry the same node fields."""
+    request = {"query": "graph", "top_k": 5}
+    index = InvertedIndex()
+    index.sync(NODES, LABELS)
+    node = Node(Graph(), "3", 3, LABELS["3"], NODES["3"])
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.run.return_value = AsyncIterator([{"n": node, "score": 1.0}])
+
+    with patch("skill_sphere_mcp.graph.hybrid_search.text_index", index):
+        from_index = await handler(request, mock_session)
+    from_database = await handler(request, mock_session)
+
+    mock_session.run.assert_awaited_once()
+    assert from_index == from_database
@@ -0,0 +1,205 @@
+"""Tests for the embedding model provider, encode batcher and query cache."""
+
+import asyncio
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from prometheus_client import REGISTRY
+
+from skill_sphere_mcp.models.embedding import (
+    EmbeddingBatcher,
+    EmbeddingModelProvider,
+    load_known_skills,
+    normalize_text,
+)
+
+LOADERS = 8
+RETRY_SECONDS = 30.0
+# The failed load and the retry
+LOAD_ATTEMPTS = 2
+# Distinct skills in the warm-start schema once case is folded
+KNOWN_SKILLS = 2
+
+
+def test_provider_does_not_load_until_used():
+    """Test that creating the provider loads nothing."""
+    provider = EmbeddingModelProvider()
+
+    assert not provider.ready
+    assert provider.status == "idle"
+
+
+def test_provider_loads_once_across_threads():
+    """Test that concurrent first calls share a single model load."""
+    provider = EmbeddingModelProvider("test-model")
+    model = MagicMock()
+    barrier = threading.Barrier(LOADERS)
+    results = []
+
+    def load():
+        barrier.wait()
+        results.append(provider.get())
+
+    with patch.object(provider, "_load", return_value=model) as mock_load:
+        threads = [threading.Thread(target=load) for _ in range(LOADERS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    mock_load.assert_called_once()
+    assert results == [model] * LOADERS
+    assert provider.status == "ready"
+
+
+def test_provider_reports_unavailable_model():
+    """Test that a missing package is remembered instead of retried."""
+    provider = EmbeddingModelProvider("missing-model")
+
+    with patch.dict(sys.modules, {"sentence_transformers": None}):
+        assert provider.get() is None
+        assert provider.get() is None
+
+    assert provider.status == "unavailable"
+
+
+def test_provider_retries_failed_load_after_delay():
+    """Test that a failed model load is retried once the delay has passed."""
+    provider = EmbeddingModelProvider("test-model", retry_seconds=RETRY_SECONDS)
+    model = MagicMock()
+    clock = "skill_sphere_mcp.models.embedding.time.monotonic"
+
+    with patch.object(
+        provider, "_load", side_effect=[OSError("download failed"), model]
+    ) as mock_load:
+        with patch(clock, return_value=0.0):
+            assert provider.get() is None
+            assert provider.get() is None
+            assert provider.status == "unavailable"
+        with patch(clock, return_value=RETRY_SECONDS):
+            assert provider.get() is model
+
+    assert mock_load.call_count == LOAD_ATTEMPTS
+    assert provider.status == "ready"
+
+
+@pytest.mark.asyncio
+async def test_warm_up_loads_model():
+    """Test that warm-up loads the model off the event loop."""
+    provider = EmbeddingModelProvider("test-model")
+    model = MagicMock()
+
+    with patch.object(provider, "_load", return_value=model):
+        await provider.warm_up()
+
+    assert provider.ready
+    assert provider.get() is model
+
+
+class RecordingModel:
+    """Model stand-in embedding each text as its length."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def encode(self, texts, normalize_embeddings=False):
+        """Record the batch and return one row per text."""
+        assert normalize_embeddings
+        self.batches.append(list(texts))
+        return np.array([[len(text)] for text in texts], dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_requests():
+    """Test that concurrent encodes share one model call and get their rows."""
+    model = RecordingModel()
+    batcher = EmbeddingBatcher(lambda: model, max_batch_size=32, max_wait_ms=5)
+    texts = ["a", "bb", "ccc", "dddd"]
+    before = REGISTRY.get_sample_value("embedding_encode_batch_size_count") or 0.0
+
+    vectors = await asyncio.gather(*(batcher.encode(text) for text in texts))
+
+    assert model.batches == [texts]
+    assert [float(v[0]) for v in vectors] == [1.0, 2.0, 3.0, 4.0]
+    assert REGISTRY.get_sample_value("embedding_encode_batch_size_count") == before + 1
+    assert REGISTRY.get_sample_value("embedding_encode_queue_depth") == 0
+
+
+@pytest.mark.asyncio
+async def test_batcher_splits_at_max_batch_size():
+    """Test that a full batch is sent without waiting for the timer."""
+    model = RecordingModel()
+    batcher = EmbeddingBatcher(lambda: model, max_batch_size=2, max_wait_ms=10_000)
+
+    await asyncio.wait_for(
+        asyncio.gather(*(batcher.encode(text) for text in "abcd")), timeout=1
+    )
+
+    assert model.batches == [["a", "b"], ["c", "d"]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_fails_every_caller_without_model():
+    """Test that callers see an error when no model is available."""
+    batcher = EmbeddingBatcher(lambda: None, max_wait_ms=1)
+
+    results = await asyncio.gather(
+        batcher.encode("a"), batcher.encode("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def _cache_hits() -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "embedding_query_cache_lookups_total", {"result": "hit"}
+        )
+        or 0.0
+    )
+
+
+def test_normalize_text_ignores_case_and_spacing():
+    """Test that query keys ignore case and surrounding whitespace."""
+    assert normalize_text("  Machine   LEARNING ") == "machine learning"
+
+
+@pytest.mark.asyncio
+async def test_batcher_serves_repeated_queries_from_cache():
+    """Test that normalized repeats of a query skip the model."""
+    model = RecordingModel()
+    batcher = EmbeddingBatcher(lambda: model, max_wait_ms=1)
+    before = _cache_hits()
+
+    first = await batcher.encode("Python")
+    second = await batcher.encode("  python ")
+
+    assert model.batches == [["python"]]
+    assert second is first
+    assert batcher.cache.hits == 1
+    assert _cache_hits() == before + 1
+
+
+@pytest.mark.asyncio
+async def test_warm_cache_from_known_skills(tmp_path):
+    """Test that schema known_skills are encoded once, in a single batch."""
+    schema = tmp_path / "graph_schema.yaml"
+    schema.write_text(
+        "prompt_steering:\n  known_skills:\n    - Neo4j\n    - RAG\n    - neo4j\n",
+        encoding="utf-8",
+    )
+    model = RecordingModel()
+    batcher = EmbeddingBatcher(lambda: model)
+
+    assert await batcher.warm_cache(load_known_skills(schema)) == KNOWN_SKILLS
+    await batcher.encode("RAG")
+
+    assert model.batches == [["neo4j", "rag"]]
+
+
+def test_load_known_skills_missing_file(tmp_path):
+    """Test that a missing schema file disables the warm start."""
+    assert load_known_skills(tmp_path / "missing.yaml") == []
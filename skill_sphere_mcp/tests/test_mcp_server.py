@@ -10,8 +10,8 @@ from skill_sphere_mcp.api.jsonrpc import (
     ERROR_INVALID_PARAMS,
     JSONRPCRequest,
 )
-from skill_sphere_mcp.api.mcp.routes import get_db_session
 from skill_sphere_mcp.app import create_app
+from skill_sphere_mcp.db.deps import get_read_session, get_write_session
 
 from .constants import HTTP_OK, HTTP_UNPROCESSABLE_ENTITY
 
@@ -59,19 +59,10 @@ def mock_db_session():
                     }
                 )
 
-        elif "MATCH (p:Person)" in norm_query and "WHERE ALL(skill IN" in norm_query:
+        elif "UNWIND $required_skills AS skill_name" in norm_query:
             mock_result = AsyncMock()
             mock_result.all = AsyncMock(
-                return_value=[
-                    {
-                        "p": {
-                            "id": "1",
-                            "name": "Test Person",
-                            "skills": ["Python", "FastAPI"],
-                            "experience": {"Python": 5, "FastAPI": 3},
-                        }
-                    }
-                ]
+                return_value=[{"matched": ["Python", "FastAPI"]}]
             )
 
         elif "MATCH (p:Person)" in norm_query:
@@ -111,7 +102,7 @@ def mock_db_session():
                 }
             )
 
-        elif "MATCH (n)" in norm_query:
+        elif "MATCH (n)" in norm_query or "db.index.fulltext" in norm_query:
 
             class AsyncIteratorMock:
                 def __init__(self, items):
@@ -172,7 +163,8 @@ def mock_db_session():
 def client(mock_db_session):
     """Create a test client with mocked dependencies."""
     app = create_app()
-    app.dependency_overrides[get_db_session] = lambda: mock_db_session
+    app.dependency_overrides[get_read_session] = lambda: mock_db_session
+    app.dependency_overrides[get_write_session] = lambda: mock_db_session
     with TestClient(app) as test_client:
         yield test_client
 
@@ -182,7 +174,8 @@ async def test_health_check(client: TestClient) -> None:
     """Test health check endpoint."""
     response = client.get("/health")
     assert response.status_code == HTTP_OK
-    assert response.json() == {"status": "ok"}
+    assert response.json()["status"] == "ok"
+    assert response.json()["embedding_model"] in {"idle", "loading", "ready"}
 
 
 @pytest.mark.asyncio
@@ -1,24 +1,34 @@
 """Tests for tool dispatcher."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 import pytest_asyncio
 from fastapi import HTTPException, status
 from neo4j import AsyncSession
+from prometheus_client import REGISTRY
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
 
+from skill_sphere_mcp.config.settings import get_test_settings
+from skill_sphere_mcp.db.graph_version import bump_graph_version
 from skill_sphere_mcp.tools.dispatcher import (
     _validate_explain_match_params,
     _validate_generate_cv_params,
     _validate_graph_search_params,
     _validate_match_role_params,
+    _validate_rank_candidates_params,
     dispatch_tool,
 )
+from skill_sphere_mcp.utils.response_cache import MemoryBackend, response_cache
 
 # Test data
 MOCK_SKILLS = ["Python", "FastAPI"]
 MOCK_YEARS = {"Python": 5, "FastAPI": 3}
+# Handler calls after a cached search is repeated across a graph write
+CALLS_ACROSS_WRITE = 2
+# Handler calls for two distinct searches, one of them coalesced
+DISTINCT_SEARCHES = 2
 
 
 @pytest_asyncio.fixture
@@ -120,6 +130,61 @@ def test_validate_graph_search_params() -> None:
     assert exc_info.value.status_code == HTTP_422_UNPROCESSABLE_ENTITY
 
 
+def test_validate_rank_candidates_params() -> None:
+    """Test validation of rank candidates parameters."""
+    # Valid parameters
+    _validate_rank_candidates_params(
+        {
+            "required_skills": MOCK_SKILLS,
+            "candidates": [{"id": "p1", "skills": MOCK_SKILLS}],
+            "top_n": 5,
+        }
+    )
+
+    # Invalid parameters
+    for parameters in (
+        {"candidates": [{"id": "p1", "skills": MOCK_SKILLS}]},
+        {"required_skills": MOCK_SKILLS},
+        {"required_skills": MOCK_SKILLS, "candidates": ["p1"]},
+        {"required_skills": MOCK_SKILLS, "candidates": [{"id": "p1"}], "top_n": 0},
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            _validate_rank_candidates_params(parameters)
+        assert exc_info.value.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_dispatch_rank_candidates(mock_session: AsyncMock) -> None:
+    """Test dispatching the rank candidates tool."""
+    with patch(
+        "skill_sphere_mcp.tools.dispatcher.rank_candidates", new_callable=AsyncMock
+    ) as mock_rank:
+        mock_rank.return_value = {
+            "rankings": [
+                {
+                    "candidate_id": "p1",
+                    "match_score": 0.9,
+                    "skill_gaps": [],
+                    "matching_skills": [{"name": "Python", "score": 0.9}],
+                }
+            ],
+            "top_n": 1,
+        }
+
+        result = await dispatch_tool(
+            "skill.rank_candidates",
+            {
+                "required_skills": MOCK_SKILLS,
+                "candidates": [{"id": "p1", "skills": MOCK_SKILLS}],
+                "top_n": 1,
+            },
+            mock_session,
+        )
+
+        assert result["rankings"][0]["candidate_id"] == "p1"
+        assert result["top_n"] == 1
+
+
 @pytest_asyncio.fixture
 async def test_dispatch_tool_success(mock_session: AsyncMock) -> None:
     """Test successful tool dispatch."""
@@ -176,3 +241,112 @@ async def test_dispatch_tool_handler_error(mock_session: AsyncMock) -> None:
                 mock_session,
             )
         assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+@pytest.mark.asyncio
+async def test_dispatch_caches_idempotent_tools(mock_session: AsyncMock) -> None:
+    """Test that repeated searches are served from the response cache."""
+    settings = get_test_settings()
+    settings.enable_caching = True
+    parameters = {"query": "Python", "top_k": 5}
+    response = {"results": [], "query": "Python", "top_k": 5}
+
+    with (
+        patch("skill_sphere_mcp.tools.dispatcher.get_settings", return_value=settings),
+        patch.object(response_cache, "backend", MemoryBackend()),
+        patch(
+            "skill_sphere_mcp.tools.dispatcher.graph_search", new_callable=AsyncMock
+        ) as mock_search,
+    ):
+        mock_search.return_value = response
+        first = await dispatch_tool("graph.search", parameters, mock_session)
+        second = await dispatch_tool("graph.search", dict(parameters), mock_session)
+        assert mock_search.await_count == 1
+
+        bump_graph_version()
+        await dispatch_tool("graph.search", parameters, mock_session)
+        assert mock_search.await_count == CALLS_ACROSS_WRITE
+
+    assert first == second == response
+
+
+@pytest.mark.asyncio
+async def test_dispatch_coalesces_identical_concurrent_calls(
+    mock_session: AsyncMock,
+) -> None:
+    """Test that identical in-flight searches share one handler call."""
+    release = asyncio.Event()
+    response = {"results": [], "query": "Python", "top_k": 5}
+
+    async def slow_search(*_args):
+        await release.wait()
+        return response
+
+    def coalesced() -> float:
+        return (
+            REGISTRY.get_sample_value(
+                "tool_calls_coalesced_total", {"tool": "graph.search"}
+            )
+            or 0.0
+        )
+
+    before = coalesced()
+    with patch(
+        "skill_sphere_mcp.tools.dispatcher.graph_search",
+        new_callable=AsyncMock,
+        side_effect=slow_search,
+    ) as mock_search:
+        calls = [
+            asyncio.create_task(
+                dispatch_tool("graph.search", {"query": "Python", "top_k": 5}, session)
+            )
+            for session in (mock_session, AsyncMock(spec=AsyncSession))
+        ]
+        other = asyncio.create_task(
+            dispatch_tool("graph.search", {"query": "Rust", "top_k": 5}, mock_session)
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls, other)
+
+    assert mock_search.await_count == DISTINCT_SEARCHES
+    assert results[0] == results[1] == response
+    assert coalesced() == before + 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_reruns_shared_call_when_first_caller_cancelled(
+    mock_session: AsyncMock,
+) -> None:
+    """Test that a waiter reruns a coalesced call on its own session."""
+    release = asyncio.Event()
+    sessions = []
+    response = {"results": [], "query": "Neo4j", "top_k": 5}
+
+    async def slow_search(_parameters, session):
+        sessions.append(session)
+        await release.wait()
+        return response
+
+    other_session = AsyncMock(spec=AsyncSession)
+    with patch(
+        "skill_sphere_mcp.tools.dispatcher.graph_search",
+        new_callable=AsyncMock,
+        side_effect=slow_search,
+    ):
+        first, second = (
+            asyncio.create_task(
+                dispatch_tool("graph.search", {"query": "Neo4j", "top_k": 5}, session)
+            )
+            for session in (mock_session, other_session)
+        )
+        while not sessions:
+            await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        release.set()
+        result = await second
+
+    assert result == response
+    assert sessions == [mock_session, other_session]
@@ -79,18 +79,7 @@ async def test_match_role_success(mock_session: AsyncMock) -> None:
     """Test successful skill matching."""
     # Setup mock session response
     mock_result = AsyncMock()
-    mock_result = AsyncIterator(
-        [
-            {
-                "p": {
-                    "id": "1",
-                    "name": "Test Person",
-                    "skills": ["Python", "FastAPI"],
-                    "experience": {"Python": 5, "FastAPI": 3},
-                }
-            }
-        ]
-    )
+    mock_result = AsyncIterator([{"matched": ["Python", "FastAPI"]}])
     mock_session.run.return_value = mock_result
 
     result = await match_role(
@@ -462,17 +451,7 @@ async def test_graph_search_large_top_k(mock_session: AsyncMock) -> None:
 async def test_match_role_empty_experience(mock_session: AsyncMock) -> None:
     """Test match role with empty years_experience."""
     mock_result = AsyncMock()
-    mock_result = AsyncIterator(
-        [
-            {
-                "p": {
-                    "name": "Test Person",
-                    "skills": ["Python", "FastAPI"],
-                    "experience": {},
-                }
-            }
-        ]
-    )
+    mock_result = AsyncIterator([{"matched": ["Python", "FastAPI"]}])
     mock_session.run.return_value = mock_result
 
     result = await match_role(
@@ -514,20 +493,8 @@ async def test_match_role_multiple_profiles(mock_session: AsyncMock) -> None:
     mock_result = AsyncMock()
     mock_result = AsyncIterator(
         [
-            {
-                "p": {
-                    "name": "Person 1",
-                    "skills": ["Python"],
-                    "experience": {"Python": 5},
-                }
-            },
-            {
-                "p": {
-                    "name": "Person 2",
-                    "skills": ["Python"],
-                    "experience": {"Python": 3},
-                }
-            },
+            {"matched": ["Python"]},
+            {"matched": ["Python"]},
         ]
     )
     mock_session.run.return_value = mock_result
@@ -545,6 +512,28 @@ async def test_match_role_multiple_profiles(mock_session: AsyncMock) -> None:
     assert len(result["skill_gaps"]) == 0
 
 
+@pytest.mark.asyncio
+async def test_match_role_skill_set_query(mock_session: AsyncMock) -> None:
+    """Test that matching starts from Skill nodes and counts distinct skills."""
+    mock_session.run.return_value = AsyncIterator([{"matched": ["Python"]}])
+
+    result = await match_role(
+        {
+            "required_skills": ["Python", "Python"],
+            "years_experience": {"Python": 3},
+        },
+        mock_session,
+    )
+
+    query = mock_session.run.call_args.args[0]
+    assert "UNWIND $required_skills" in query
+    assert "WHERE ALL" not in query
+    assert "LIMIT 1" in query
+    assert mock_session.run.call_args.kwargs["skill_count"] == 1
+    assert result["match_score"] == pytest.approx(1.0)
+    assert result["skill_gaps"] == []
+
+
 @pytest.mark.asyncio
 async def test_match_role_empty_skills(mock_session: AsyncMock) -> None:
     """Test match role with empty required_skills list."""
@@ -0,0 +1,53 @@
+"""Tests for in-process caching utilities."""
+
+from skill_sphere_mcp.utils.cache import LRUCache, TTLCache
+
+CACHE_SIZE = 2
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """Test that reads refresh recency and the oldest entry is evicted."""
+    cache: LRUCache[str, int] = LRUCache(CACHE_SIZE)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+    assert len(cache) == CACHE_SIZE
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_lru_cache_disabled() -> None:
+    """Test that a zero-sized cache stores nothing."""
+    cache: LRUCache[str, int] = LRUCache(0)
+    cache.put("a", 1)
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_expires_entries_and_counts_lookups() -> None:
+    """Test that entries expire after the TTL and lookups are counted."""
+    now = [0.0]
+    cache: TTLCache[str, int] = TTLCache(2, ttl=10.0, clock=lambda: now[0])
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+
+    now[0] = 10.0
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    """Test that the size bound still applies without a TTL."""
+    cache: TTLCache[str, int] = TTLCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+
+    assert cache.get_many(["a", "b", "c"]) == {"b": 2, "c": 3}
+    assert (cache.hits, cache.misses) == (2, 1)
@@ -0,0 +1,129 @@
+"""Tests for the tool response cache."""
+
+import os
+
+import pytest
+
+from skill_sphere_mcp.utils.response_cache import (
+    FileBackend,
+    MemoryBackend,
+    ResponseCache,
+    create_backend,
+)
+
+MAXSIZE = 8
+RESPONSE = {"results": [{"node": {"name": "Python"}}], "top_k": 1}
+
+
+@pytest.fixture(params=["memory", "file"])
+def cache(request: pytest.FixtureRequest, tmp_path) -> ResponseCache:
+    """Create a response cache for each backend."""
+    if request.param == "file":
+        return ResponseCache(FileBackend(tmp_path, maxsize=8))
+    return ResponseCache(MemoryBackend(maxsize=8))
+
+
+def test_key_canonicalizes_parameters(cache: ResponseCache) -> None:
+    """Test that parameter order does not change the key but values do."""
+    key = cache.key("graph.search", {"query": "Python", "top_k": 5})
+
+    assert key == cache.key("graph.search", {"top_k": 5, "query": "Python"})
+    assert key != cache.key("graph.search", {"query": "Python", "top_k": 6})
+    assert key != cache.key("skill.match_role", {"query": "Python", "top_k": 5})
+
+
+def test_round_trip_and_invalidate(cache: ResponseCache) -> None:
+    """Test that a bumped graph version hides earlier responses."""
+    key = cache.key("graph.search", {"query": "Python"})
+    cache.put(key, RESPONSE)
+
+    assert cache.get("graph.search", key) == RESPONSE
+
+    cache.invalidate()
+    assert cache.key("graph.search", {"query": "Python"}) != key
+
+
+def test_memory_backend_returns_copies() -> None:
+    """Test that callers cannot mutate a cached response."""
+    backend = MemoryBackend()
+    backend.put("k", {"results": []})
+    backend.get("k")["results"].append("mutated")
+
+    assert backend.get("k") == {"results": []}
+
+
+def test_file_backend_shares_entries_and_version(tmp_path) -> None:
+    """Test that backends on one directory see each other's writes."""
+    first = ResponseCache(FileBackend(tmp_path))
+    second = ResponseCache(FileBackend(tmp_path))
+    key = first.key("graph.search", {"query": "Python"})
+    first.put(key, RESPONSE)
+
+    assert second.get("graph.search", key) == RESPONSE
+
+    second.invalidate()
+    assert first.key("graph.search", {"query": "Python"}) != key
+
+
+def test_file_backend_evicts_least_recently_used(tmp_path) -> None:
+    """Test that the oldest files are removed beyond the size bound."""
+    backend = FileBackend(tmp_path, maxsize=2)
+    backend.put("a", 1)
+    backend.put("b", 2)
+    os.utime(tmp_path / "a.json", (0, 0))
+    backend.put("c", 3)
+
+    assert backend.get("a") is None
+    assert (backend.get("b"), backend.get("c")) == (2, 3)
+
+
+def test_file_backend_skips_unserializable_values(tmp_path) -> None:
+    """Test that values JSON cannot encode are not cached."""
+    backend = FileBackend(tmp_path)
+    backend.put("k", {"node": object()})
+
+    assert backend.get("k") is None
+
+
+def _fail_replace(*_args) -> None:
+    raise OSError("disk full")
+
+
+def test_file_backend_skips_unwritable_values(tmp_path, monkeypatch) -> None:
+    """Test that a failed write leaves nothing cached and no temp files."""
+    backend = FileBackend(tmp_path)
+    monkeypatch.setattr(os, "replace", _fail_replace)
+
+    backend.put("k", RESPONSE)
+
+    assert backend.get("k") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_cache_moves_to_memory_when_version_cannot_be_bumped(
+    tmp_path, monkeypatch
+) -> None:
+    """Test that a failed bump drops the file backend and its entries."""
+    cache = ResponseCache(FileBackend(tmp_path, maxsize=8))
+    key = cache.key("graph.search", {"query": "Python"})
+    cache.put(key, RESPONSE)
+    monkeypatch.setattr(os, "replace", _fail_replace)
+
+    cache.invalidate()
+
+    assert isinstance(cache.backend, MemoryBackend)
+    assert cache.backend.maxsize == MAXSIZE
+    assert cache.get("graph.search", key) is None
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_create_backend_falls_back_to_memory(tmp_path) -> None:
+    """Test that an unusable cache directory does not abort startup."""
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+
+    backend = create_backend("file", blocker / "cache", maxsize=MAXSIZE)
+
+    assert isinstance(backend, MemoryBackend)
+    assert backend.maxsize == MAXSIZE
+    assert isinstance(create_backend("file", tmp_path / "cache"), FileBackend)
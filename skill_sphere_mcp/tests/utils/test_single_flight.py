@@ -0,0 +1,109 @@
+"""Tests for single-flight call coalescing."""
+
+import asyncio
+
+import pytest
+
+from skill_sphere_mcp.utils.single_flight import SingleFlight
+
+# Keys with a call in flight in the coalescing test
+KEYS_IN_FLIGHT = 2
+# Executions of a failing call across two rounds of callers
+FAILED_ATTEMPTS = 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution() -> None:
+    """Test that callers with the same key share a single call."""
+    flight = SingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def work(value: str) -> str:
+        calls.append(value)
+        await release.wait()
+        return value
+
+    waiters = [
+        asyncio.create_task(flight.do("a", lambda: work("a"))),
+        asyncio.create_task(flight.do("a", lambda: work("a"))),
+        asyncio.create_task(flight.do("b", lambda: work("b"))),
+    ]
+    await asyncio.sleep(0)
+    assert len(flight) == KEYS_IN_FLIGHT
+    release.set()
+
+    results = await asyncio.gather(*waiters)
+
+    assert calls == ["a", "b"]
+    assert results == [("a", False), ("a", True), ("b", False)]
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller_and_are_not_remembered() -> None:
+    """Test that a failure is shared and the next call runs afresh."""
+    flight = SingleFlight()
+    attempts = 0
+
+    async def fail() -> None:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+
+    with pytest.raises(ValueError):
+        await flight.do("k", fail)
+    assert attempts == FAILED_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call() -> None:
+    """Test that the call survives a waiting caller being cancelled."""
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> int:
+        await release.wait()
+        return 42
+
+    first = asyncio.create_task(flight.do("k", work))
+    second = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    second.cancel()
+    release.set()
+
+    assert await first == (42, False)
+    with pytest.raises(asyncio.CancelledError):
+        await second
+
+
+@pytest.mark.asyncio
+async def test_cancelled_first_caller_hands_call_to_waiter() -> None:
+    """Test that a waiter reruns the call with its own context."""
+    flight = SingleFlight()
+    release = asyncio.Event()
+    runs = []
+
+    async def work(caller: str) -> str:
+        runs.append(caller)
+        await release.wait()
+        return caller
+
+    first = asyncio.create_task(flight.do("k", lambda: work("first")))
+    second = asyncio.create_task(flight.do("k", lambda: work("second")))
+    while not runs:
+        await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == ("second", False)
+    assert first.cancelled()
+    assert runs == ["first", "second"]
+    assert len(flight) == 0